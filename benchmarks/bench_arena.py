@@ -0,0 +1,108 @@
+"""TreeArena against the light OOP tags on large trees.
+
+Builds the same catalogue table (`TABLE > TBODY > TR > TD.sku, TD.name,
+TD.price`) with light classes and with a `TreeArena`, and reports build
+time, render time and the memory the tree keeps alive (tracemalloc). Both
+renders are checked to be identical.
+
+Run from the repository root:
+
+    python benchmarks/bench_arena.py [--rows 250000] [--repeat 1]
+
+250,000 rows is a little over one million elements and text nodes.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo.components.arena import TreeArena  # noqa: E402
+from probo.components.elements import Element  # noqa: E402
+from probo.components.light_tags.oop.block_tags import Ltable, Ltbody, Ltd, Ltr  # noqa: E402
+
+
+def light(rows: int):
+    return Ltable(
+        Ltbody(
+            *[
+                Ltr(
+                    Ltd(f"SKU-{r:07d}", Class="sku"),
+                    Ltd(f"Product {r}", Class="name"),
+                    Ltd(f"{r % 997}.99", Class="price"),
+                    Class="row",
+                )
+                for r in range(rows)
+            ]
+        ),
+        Class="catalogue",
+    )
+
+
+def arena(rows: int):
+    tree = TreeArena()
+    body = tree.tbody()
+    for r in range(rows):
+        tree.append(
+            body,
+            tree.tr(
+                tree.td(f"SKU-{r:07d}", Class="sku"),
+                tree.td(f"Product {r}", Class="name"),
+                tree.td(f"{r % 997}.99", Class="price"),
+                Class="row",
+            ),
+        )
+    return tree, tree.table(body, Class="catalogue")
+
+
+def measure(build, render, repeat: int):
+    best_build = best_render = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        t0 = time.perf_counter()
+        tree = build()
+        t1 = time.perf_counter()
+        html = render(tree)
+        t2 = time.perf_counter()
+        gc.enable()
+        best_build, best_render = min(best_build, t1 - t0), min(best_render, t2 - t1)
+        del tree
+    gc.collect()
+    tracemalloc.start()
+    tree = build()  # kept alive until measured
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return best_build, best_render, held, html
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=250_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    nodes = 2 + args.rows * 7
+    print(f"{args.rows:,} rows, {nodes:,} nodes (elements and text)\n")
+    print(f"{'paradigm':14} {'build s':>8} {'render s':>9} {'total s':>8} {'MB held':>8} {'B/node':>7}")
+    outputs = []
+    for name, build, render in (
+        ("light OOP", lambda: light(args.rows), lambda tree: tree.render(Element())),
+        ("TreeArena", lambda: arena(args.rows), lambda built: built[0].render(built[1])),
+    ):
+        build_time, render_time, held, html = measure(build, render, args.repeat)
+        outputs.append(html)
+        print(
+            f"{name:14} {build_time:8.2f} {render_time:9.2f} {build_time + render_time:8.2f}"
+            f" {held / 1e6:8.1f} {held / nodes:7.0f}"
+        )
+    assert outputs[0] == outputs[1], "renders differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""NodeIndex lookups against the tree walk they replace.
+
+Builds a page of `--rows` list rows (`LI > SPAN`, about two nodes per row)
+and times, with and without `build_index()`:
+
+- `find_by_id` and `find_all_by_class` on an unchanged tree;
+- `--edits` rounds of `add` (a row inserted mid-list, the HTMX swap case)
+  followed by `find_by_id`, where the index has to keep up with the tree.
+
+Without an index, lookups are the depth-first walk (`find_by_id` falls back
+to it). Run from the repository root:
+
+    python benchmarks/bench_index.py [--rows 50000] [--edits 20] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo import DIV, LI, SPAN, UL  # noqa: E402
+
+
+def build_page(rows: int) -> tuple[DIV, UL]:
+    items = UL(*[LI(SPAN(str(i), Class="cell"), id=f"row-{i}", Class="row") for i in range(rows)])
+    return DIV(items, id="page"), items
+
+
+def best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def add_then_lookup(rows: int, edits: int, indexed: bool) -> float:
+    page, items = build_page(rows)
+    if indexed:
+        page.build_index()
+    start = time.perf_counter()
+    for edit in range(edits):
+        items.add(LI(SPAN("new"), id=f"new-{edit}", Class="row"), rows // 2)
+        assert page.find_by_id(f"new-{edit}") is not None
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page, _ = build_page(args.rows)
+    nodes = sum(1 for _ in page.walk())
+    target = f"row-{args.rows - 1}"
+    print(f"{nodes} nodes, best of {args.repeat} runs (ms)\n")
+
+    build = best(page.build_index, args.repeat)
+    rows = [
+        ("build_index", build, None),
+        (
+            f"find_by_id({target!r})",
+            best(lambda: page.find_by_id(target), args.repeat),
+            best(lambda: page.drop_index().find_by_id(target), 1),
+        ),
+    ]
+    page.build_index()
+    rows.append(
+        (
+            "find_all_by_class('row')",
+            best(lambda: page.find_all_by_class("row"), args.repeat),
+            best(lambda: page.drop_index().find_all_by_class("row"), 1),
+        )
+    )
+    rows.append(
+        (
+            f"{args.edits} x (add + find_by_id)",
+            add_then_lookup(args.rows, args.edits, indexed=True),
+            add_then_lookup(args.rows, args.edits, indexed=False),
+        )
+    )
+
+    print(f"{'case':32} {'indexed':>10} {'walk':>10}")
+    for name, indexed, walk in rows:
+        walked = f"{walk:10.2f}" if walk is not None else f"{'':>10}"
+        print(f"{name:32} {indexed:10.2f} {walked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Bytes per node for each SSDOM paradigm, measured with tracemalloc.
+
+Builds the same list of rows (`UL > LI.row > SPAN.cell`) as a heavy tree,
+a light tree and with the functional helpers, and reports the memory each
+one keeps alive, divided by the number of elements. For the trees it also
+reports the figure after a render (which must not grow it) and after every
+node's `content` and `attributes` were accessed for editing, which promotes
+them out of compact storage.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py [--rows 20000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo import LI, SPAN, UL  # noqa: E402
+from probo.components.elements import Element  # noqa: E402
+from probo.components.light_tags.func.block_tags import l_li, l_span, l_ul  # noqa: E402
+from probo.components.light_tags.oop.block_tags import Lli, Lspan, Lul  # noqa: E402
+
+
+def heavy(rows: int) -> UL:
+    return UL(*[LI(SPAN(str(r), Class="cell"), Class="row") for r in range(rows)])
+
+
+def light(rows: int) -> Lul:
+    return Lul(*[Lli(Lspan(str(r), Class="cell"), Class="row") for r in range(rows)])
+
+
+def functional(rows: int) -> str:
+    EL = Element()
+    return l_ul(EL, *[l_li(EL, l_span(EL, str(r), Class="cell"), Class="row") for r in range(rows)])
+
+
+def retained(build, *steps):
+    """Bytes held by `build()`'s result after each of `steps` is applied."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    sizes = [tracemalloc.get_traced_memory()[0] - before]
+    for step in steps:
+        step(result)
+        gc.collect()
+        sizes.append(tracemalloc.get_traced_memory()[0] - before)
+    tracemalloc.stop()
+    return sizes
+
+
+def promote(tree) -> None:
+    for node in tree.walk():
+        node.content
+        node.attributes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+    nodes = 2 * args.rows + 1
+
+    print(f"{nodes} elements, bytes per element\n")
+    print(f"{'paradigm':12} {'built':>8} {'rendered':>9} {'promoted':>9}")
+    sizes = retained(lambda: heavy(args.rows), lambda tree: tree.render(), promote)
+    print(f"{'heavy':12}" + "".join(f" {size / nodes:8.0f}" for size in sizes))
+    EL = Element()
+    sizes = retained(lambda: light(args.rows), lambda tree: tree.render(EL), promote)
+    print(f"{'light':12}" + "".join(f" {size / nodes:8.0f}" for size in sizes))
+    (size,) = retained(lambda: functional(args.rows))
+    print(f"{'functional':12} {size / nodes:8.0f} {'-':>9} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
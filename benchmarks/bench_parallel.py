@@ -0,0 +1,105 @@
+"""Serial against parallel rendering, to find where the process pool pays off.
+
+Renders the same catalogue table (`TABLE > TBODY > TR > TD.sku, TD.name,
+TD.price`) at growing sizes, once with `render_into` and once with
+`render_parallel` forced on (threshold 0), for heavy and light trees. The
+first size at which the parallel render wins is the crossover; set
+`render_parallel(threshold=...)` near it for your machine.
+
+Run from the repository root:
+
+    python benchmarks/bench_parallel.py [--workers 4] [--rows 250 1000 4000 16000 64000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo import TABLE, TBODY, TD, TR  # noqa: E402
+from probo.components.elements import Element  # noqa: E402
+from probo.components.light_tags.oop.block_tags import Ltable, Ltbody, Ltd, Ltr  # noqa: E402
+from probo.components.parallel import render_parallel  # noqa: E402
+from probo.streaming.sinks import ListSink  # noqa: E402
+
+
+def heavy(rows: int) -> TABLE:
+    return TABLE(
+        TBODY(
+            *[
+                TR(
+                    TD(f"SKU-{r:07d}", Class="sku"),
+                    TD(f"Product {r}", Class="name"),
+                    TD(f"{r % 997}.99", Class="price"),
+                    Class="row",
+                )
+                for r in range(rows)
+            ]
+        ),
+        Class="catalogue",
+    )
+
+
+def light(rows: int) -> Ltable:
+    return Ltable(
+        Ltbody(
+            *[
+                Ltr(
+                    Ltd(f"SKU-{r:07d}", Class="sku"),
+                    Ltd(f"Product {r}", Class="name"),
+                    Ltd(f"{r % 997}.99", Class="price"),
+                    Class="row",
+                )
+                for r in range(rows)
+            ]
+        ),
+        Class="catalogue",
+    )
+
+
+def best(fn, repeat: int):
+    times, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    parser.add_argument("--rows", type=int, nargs="+", default=[250, 1000, 4000, 16000, 64000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {os.cpu_count()} CPUs\n")
+    print(f"{'tree':6} {'nodes':>8} {'serial s':>9} {'parallel s':>11} {'speedup':>8}")
+    for name, build in (("heavy", heavy), ("light", light)):
+        crossover = None
+        for rows in args.rows:
+            tree = build(rows)
+            EL = Element() if name == "light" else None
+            if EL is None:
+                serial = lambda: tree.render_into(ListSink()).getvalue()  # noqa: E731
+            else:
+                serial = lambda: tree.render_into(EL, ListSink()).getvalue()  # noqa: E731
+            serial_time, expected = best(serial, args.repeat)
+            parallel_time, html = best(
+                lambda: render_parallel(tree, EL, workers=args.workers, threshold=0, min_chunk=1), args.repeat
+            )
+            assert html == expected, "renders differ"
+            nodes = 2 + rows * 7
+            if crossover is None and parallel_time < serial_time:
+                crossover = nodes
+            print(
+                f"{name:6} {nodes:8,} {serial_time:9.3f} {parallel_time:11.3f} {serial_time / parallel_time:7.2f}x"
+            )
+        print(f"{name}: parallel wins from {crossover:,} nodes\n" if crossover else f"{name}: no crossover\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""SSDOM payload diffing with 1k registered components.
+
+Registers `--components` cards (`DIV > H3, P, SPAN`) on a RouterPayload the
+way a router does with its TCM, then times:
+
+- construction (components are only registered, not rendered);
+- one client request: diffing a single component for a client;
+- a full diff of every component, the cost construction used to pay;
+- MD5 against BLAKE2b-128 over the rendered cards.
+
+Run from the repository root:
+
+    python benchmarks/bench_payload.py [--components 1000] [--clients 100] [--repeat 5]
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo import DIV, H3, P, SPAN  # noqa: E402
+from probo.router.global_cache import global_cache  # noqa: E402
+from probo.router.payload import RouterPayload  # noqa: E402
+
+
+def card(i: int) -> DIV:
+    return DIV(
+        H3(f"Card {i}"),
+        P(f"Description of item {i} " * 4),
+        SPAN(f"{i % 97}.99", Class="price"),
+        Class="card",
+        Id=f"card-{i}",
+    )
+
+
+def best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        global_cache.clear()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=1000)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    components = {f"card-{i}": card(i) for i in range(args.components)}
+    payload = RouterPayload(**components)
+
+    def per_client_requests():
+        for c in range(args.clients):
+            payload.for_client(f"client-{c}", **{"card-7": components["card-7"]}).get_response("json")
+
+    rendered = [c.render().encode("utf-8") for c in components.values()]
+
+    rows = [
+        ("construct", best(lambda: RouterPayload(**components), args.repeat)),
+        ("full diff", best(lambda: RouterPayload(**components).get_response("json"), args.repeat)),
+        (f"{args.clients} client requests", best(per_client_requests, args.repeat)),
+        ("md5 x all", best(lambda: [hashlib.md5(r).hexdigest() for r in rendered], args.repeat)),
+        ("blake2b x all", best(lambda: [hashlib.blake2b(r, digest_size=16).hexdigest() for r in rendered], args.repeat)),
+    ]
+    print(f"{args.components} components, best of {args.repeat}")
+    for name, seconds in rows:
+        print(f"  {name:<24} {seconds * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
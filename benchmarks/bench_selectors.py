@@ -0,0 +1,94 @@
+"""Micro-benchmarks for the SSDOM selector engine.
+
+Compares `select_all` on the live tree against rendering the tree and
+querying it with BeautifulSoup, the previous way of running full CSS
+selectors over a page.
+
+Run from the repository root:
+
+    python benchmarks/bench_selectors.py [--sections 200] [--repeat 5]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from probo import DIV, LI, SECTION, SPAN, UL  # noqa: E402
+from probo.components.query import compile_selector  # noqa: E402
+
+SELECTORS = (
+    "#row-150-7",
+    "span.hot",
+    "section > ul li:nth-child(odd)",
+    "li:first-child + li span",
+    "section:nth-child(3n) [data-kind=badge]",
+    "div ul > li:not(.hot) span",
+)
+
+
+def build_page(sections: int, rows: int = 20) -> DIV:
+    return DIV(
+        *[
+            SECTION(
+                UL(
+                    *[
+                        LI(
+                            SPAN(str(r), Class="hot" if r % 5 == 0 else "cold", data_kind="badge"),
+                            id=f"row-{s}-{r}",
+                            Class="hot" if r % 7 == 0 else "row",
+                        )
+                        for r in range(rows)
+                    ]
+                ),
+                id=f"section-{s}",
+            )
+            for s in range(sections)
+        ],
+        id="page",
+    )
+
+
+def best(statement, repeat: int) -> float:
+    return min(timeit.repeat(statement, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = build_page(args.sections)
+    nodes = sum(1 for _ in page.walk())
+    print(f"{nodes} nodes, best of {args.repeat} runs (ms)\n")
+
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        BeautifulSoup = None
+
+    print(f"{'selector':45} {'compile':>8} {'engine':>8} {'indexed':>8} {'render+bs4':>11}")
+    soup_time = None
+    if BeautifulSoup is not None:
+        soup_time = best(lambda: BeautifulSoup(page.render(), "html.parser"), args.repeat)
+        soup = BeautifulSoup(page.render(), "html.parser")
+    for selector in SELECTORS:
+        compile_selector.cache_clear()
+        compile_time = best(lambda: compile_selector(selector), 1)
+        engine = best(lambda: page.select_all(selector), args.repeat)
+        page.build_index()
+        indexed = best(lambda: page.select_all(selector), args.repeat)
+        page.drop_index()
+        if soup_time is not None:
+            query = best(lambda: soup.select(selector), args.repeat)
+            reference = f"{soup_time + query:11.2f}"
+        else:
+            reference = f"{'n/a':>11}"
+        print(f"{selector:45} {compile_time:8.3f} {engine:8.2f} {indexed:8.2f} {reference}")
+
+
+if __name__ == "__main__":
+    main()
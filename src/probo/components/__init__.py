@@ -18,11 +18,15 @@ from probo.components.base import (
 from probo.components.node import (
     ElementNodeMixin,
     ElementMutatorMixin,
+    NodeIndex,
+    iter_subtree,
     ProxyElement,
     ComponentNode,
 )
 from probo.components.attributes import (
+    AttributeSchema,
     ElementAttributeValidator,
+    compile_attribute_schema,
 )
 
 from probo.components.executer import (
@@ -37,11 +41,37 @@ from probo.components.state import (
     ElementState,
 )
 
+from probo.utility import (
+    CustomElementRegistry,
+    CustomTag,
+    custom_elements,
+)
 from probo.components.light_tags.node import LightNode
+from probo.components.compiler import CompiledTemplate, compile_tree
+from probo.components.compact import AttributeSet, CompactNodeMixin, intern_attributes
+from probo.components.arena import ArenaRef, TreeArena
+from probo.components.parallel import render_parallel
+from probo.components.query import CompiledSelector, SelectorSyntaxError, compile_selector
 from probo.components.fragment import frag
 
 __all__ = [
+    "CompiledTemplate",
+    "compile_tree",
+    "AttributeSet",
+    "CompactNodeMixin",
+    "intern_attributes",
+    "ArenaRef",
+    "TreeArena",
+    "render_parallel",
+    "CompiledSelector",
+    "SelectorSyntaxError",
+    "compile_selector",
+    "CustomElementRegistry",
+    "CustomTag",
+    "custom_elements",
+    "AttributeSchema",
     "ElementAttributeValidator",
+    "compile_attribute_schema",
     "Element",
     "Head",
     "Component",
@@ -54,6 +84,8 @@ __all__ = [
     "BaseHTMLElement",
     "ElementAttributeManipulator",
     "ElementNodeMixin",
+    "NodeIndex",
+    "iter_subtree",
     "ComponentAttrManager",
     "ProxyElement",
     "ElementMutatorMixin",
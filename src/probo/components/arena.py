@@ -0,0 +1,377 @@
+import inspect
+import keyword
+from array import array
+from typing import Any, Generator, Iterable, Optional
+
+from probo.components.elements import Element
+from probo.components.light_tags.func import block_tags, self_closing, svg_tags
+from probo.components.light_tags.node import LightNode
+from probo.streaming.sinks import ListSink, RenderSink
+from probo.utility import ProboSourceString, markup_escape
+
+_NONE = -1
+_TAG_BITS = 16
+_UNFRAMED = ()
+
+
+class ArenaRef(int):
+    """The index of a node in a `TreeArena`, as returned by its builders.
+
+    A plain int subclass, so children passed to a builder can be told apart
+    from numeric text. Refs only mean something to the arena that made them.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"ArenaRef({int(self)})"
+
+
+class TreeArena:
+    """
+    A tree stored as parallel arrays instead of one Python object per node.
+
+    Each node is an index into the `array('i')` columns below; a million
+    nodes cost a few dozen megabytes of machine ints rather than a million
+    `LightNode`s. Tags and attribute sets are interned into tables, so the
+    columns hold small ids, and text is escaped once when it is added.
+
+    Rendering walks the columns with first-child / next-sibling / parent
+    links. Opening tags are validated and built through `Element.tag_frame`,
+    as for light nodes, and kept per render settings for every attribute set
+    used by more than one node, so repeated shapes (`<td class="price">`)
+    are built once; closing tags are kept per tag. `render` equals the
+    string render of the same light tree.
+
+    The builders mirror the light functional tags: `arena.div(...)` is the
+    arena version of `l_div(EL, ...)`, and returns an `ArenaRef` to pass as
+    content to its parent. Content may be refs, text, ProboSourceStrings
+    (written unescaped), light nodes (copied into the arena), other objects
+    with `render()` (rendered when added, escaped like text unless they
+    return a ProboSourceString) and lists or generators of those. The tree
+    is a static snapshot: nodes are only ever appended.
+
+    Attributes:
+        tags (array): Tag id per node, -1 for text nodes.
+        attributes (array): Attribute-set id per element, text-slot id per
+            text node.
+        parents, first_children, last_children, next_siblings (array):
+            Node indexes, -1 for none.
+        texts (list[str]): Escaped text slots.
+        tag_names (list[str]): Tag names by id.
+        attribute_sets (list[tuple]): Attribute items by id; id 0 is empty.
+        attribute_types (list[tuple]): The value types of each set.
+        attribute_uses (array): How many elements use each attribute set.
+
+    Example:
+        >>> arena = TreeArena()
+        >>> rows = arena.tbody(*(arena.tr(arena.td(sku), arena.td(price)) for sku, price in catalogue))
+        >>> with FileSink("catalogue.html") as sink:
+        ...     arena.render_into(sink, arena.table(rows, Class="catalogue"))
+    """
+
+    __slots__ = (
+        "tags",
+        "attributes",
+        "parents",
+        "first_children",
+        "last_children",
+        "next_siblings",
+        "texts",
+        "tag_names",
+        "attribute_sets",
+        "attribute_types",
+        "attribute_uses",
+        "_tag_ids",
+        "_attribute_ids",
+        "_type_tuples",
+        "_frames",
+    )
+
+    def __init__(self):
+        self.tags = array("i")
+        self.attributes = array("i")
+        self.parents = array("i")
+        self.first_children = array("i")
+        self.last_children = array("i")
+        self.next_siblings = array("i")
+        self.texts: list[str] = []
+        self.tag_names: list[str] = []
+        self.attribute_sets: list[tuple] = [()]
+        self.attribute_types: list[tuple] = [()]
+        self.attribute_uses = array("i", [0])
+        self._tag_ids: dict[str, int] = {}
+        self._attribute_ids: dict[tuple, int] = {(): 0}
+        self._type_tuples: dict[tuple, tuple] = {(): ()}
+        self._frames: dict[tuple, tuple[dict[int, tuple], dict[int, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    # -- building ---------------------------------------------------------
+
+    def element(self, tag: str, *content: Any, **attrs: Any) -> ArenaRef:
+        """Adds an element and links `content` as its children.
+
+        Args:
+            tag: The tag name, as the Element builder spells it ('div', 'Del').
+            *content: Child refs, text and the other content described above.
+            **attrs: HTML attributes, as for any other tag.
+
+        Raises:
+            ValueError: If the tag is unknown, or a child already has a parent.
+        """
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self._intern_tag(tag)
+        node = self._new_node(tag_id, self._intern_attributes(attrs) if attrs else 0)
+        if content:
+            self._link(node, content)
+        return ArenaRef(node)
+
+    def text_node(self, value: Any) -> ArenaRef:
+        """Adds a detached text node (escaped unless it is a ProboSourceString)."""
+        return ArenaRef(self._new_text(value))
+
+    def append(self, parent: int, *content: Any) -> ArenaRef:
+        """Links `content` after the existing children of `parent`.
+
+        Lets very large containers be filled row by row without holding
+        every child ref at once.
+        """
+        if self.tags[parent] == _NONE:
+            raise ValueError("Text nodes cannot have children.")
+        self._link(parent, content)
+        return ArenaRef(parent)
+
+    def children(self, node: int) -> Generator[ArenaRef, None, None]:
+        """Yields the children of `node` in order."""
+        child = self.first_children[node]
+        while child != _NONE:
+            yield ArenaRef(child)
+            child = self.next_siblings[child]
+
+    def _new_node(self, tag_id: int, attribute_id: int) -> int:
+        node = len(self.tags)
+        self.tags.append(tag_id)
+        self.attributes.append(attribute_id)
+        self.parents.append(_NONE)
+        self.first_children.append(_NONE)
+        self.last_children.append(_NONE)
+        self.next_siblings.append(_NONE)
+        return node
+
+    def _new_text(self, value: Any) -> int:
+        self.texts.append(value if isinstance(value, ProboSourceString) else markup_escape(value))
+        return self._new_node(_NONE, len(self.texts) - 1)
+
+    def _intern_tag(self, tag: str) -> int:
+        if not hasattr(Element(), tag):
+            raise ValueError(f"Unknown tag '{tag}'.")
+        if len(self.tag_names) >= 1 << _TAG_BITS:
+            raise ValueError("Too many distinct tags in one arena.")
+        self.tag_names.append(tag)
+        return self._tag_ids.setdefault(tag, len(self.tag_names) - 1)
+
+    def _intern_attributes(self, attrs: dict[str, Any]) -> int:
+        """Returns the id of the attribute set equal to `attrs`.
+
+        Sets are keyed by their items, in order. A hit whose values differ
+        in type (`hidden=True` against `hidden=1`) and sets holding
+        unhashable values get an id of their own.
+        """
+        items = tuple(attrs.items())
+        types = tuple(map(type, attrs.values()))
+        # Type tuples are shared, so comparing them is an identity check.
+        types = self._type_tuples.setdefault(types, types)
+        try:
+            attribute_id = self._attribute_ids.get(items)
+        except TypeError:
+            attribute_id = None
+        else:
+            if attribute_id is None:
+                self._attribute_ids[items] = len(self.attribute_sets)
+            elif self.attribute_types[attribute_id] is types:
+                self.attribute_uses[attribute_id] += 1
+                return attribute_id
+        self.attribute_sets.append(items)
+        self.attribute_types.append(types)
+        self.attribute_uses.append(1)
+        return len(self.attribute_sets) - 1
+
+    def _link(self, parent: int, content: Iterable[Any]) -> None:
+        parents, next_siblings = self.parents, self.next_siblings
+        last = self.last_children[parent]
+        for item in content:
+            if type(item) is ArenaRef:
+                child = int(item)
+                if parents[child] != _NONE:
+                    raise ValueError(f"Node {int(child)} already has a parent.")
+                ancestor = parent
+                while ancestor != _NONE:
+                    # Linking a node under itself or a descendant makes a cycle.
+                    if ancestor == child:
+                        raise ValueError(f"Node {child} is an ancestor of node {parent}.")
+                    ancestor = parents[ancestor]
+            elif isinstance(item, (list, tuple)) or inspect.isgenerator(item):
+                self.last_children[parent] = last
+                self._link(parent, item)
+                last = self.last_children[parent]
+                continue
+            elif isinstance(item, LightNode):
+                # Copied into the arena, so it renders with the arena's settings.
+                child = self.element(item.tag_name, *item._content, **item._attributes)
+            elif hasattr(item, "render"):
+                # Escaped by _new_text unless it is a ProboSourceString.
+                child = self._new_text(item.render())
+            else:
+                child = self._new_text(item)
+            parents[child] = parent
+            if last == _NONE:
+                self.first_children[parent] = child
+            else:
+                next_siblings[last] = child
+            last = child
+        self.last_children[parent] = last
+
+    # -- rendering --------------------------------------------------------
+
+    def render(self, root: int, EL: Optional[Element] = None) -> ProboSourceString:
+        """Renders the subtree under `root` to a string.
+
+        Args:
+            root: The ref of the top node.
+            EL (Element, optional): A string-mode builder supplying the render
+                settings (natural formatting, pretty errors, custom
+                attributes). A fresh Element is used when omitted.
+        """
+        return ProboSourceString("".join(self._fragments(root, self._builder(EL))))
+
+    def render_into(self, sink: RenderSink, root: int, EL: Optional[Element] = None) -> RenderSink:
+        """Writes the subtree under `root` into `sink` and returns the sink."""
+        write = sink.write
+        for fragment in self._fragments(root, self._builder(EL)):
+            write(fragment)
+        return sink
+
+    def stream(self, root: int, batch: int = 50, EL: Optional[Element] = None) -> Generator[str, None, None]:
+        """Yields the markup of the subtree under `root`, `batch` fragments
+        (tags and text slots) per chunk."""
+        sink = ListSink()
+        write = sink.write
+        for fragment in self._fragments(root, self._builder(EL)):
+            write(fragment)
+            if len(sink.parts) >= batch:
+                yield "".join(sink.drain())
+        if sink.parts:
+            yield "".join(sink.drain())
+
+    def _builder(self, EL: Optional[Element]) -> Element:
+        if EL is None:
+            return Element()
+        if EL.is_list:
+            raise ValueError("TreeArena renders with a string-mode Element.")
+        return EL
+
+    def _fragments(self, root: int, EL: Element) -> Generator[str, None, None]:
+        """Pre-order walk over the columns, yielding each tag and text slot.
+
+        Opening a node yields its frame head and moves to its first child;
+        a node without a next sibling yields its parent's closing tag while
+        climbing. No per-node objects are kept.
+        """
+        tags, attributes, texts, uses = self.tags, self.attributes, self.texts, self.attribute_uses
+        first_children, next_siblings, parents = self.first_children, self.next_siblings, self.parents
+        frames, tails = self._frame_table(EL)
+        node = root
+        while True:
+            tag = tags[node]
+            if tag == _NONE:
+                yield texts[attributes[node]]
+            else:
+                attribute_id = attributes[node]
+                key = (attribute_id << _TAG_BITS) | tag
+                frame = frames.get(key)
+                if frame is None:
+                    frame = self._frame(tag, attribute_id, EL, tails)
+                    if attribute_id == 0 or uses[attribute_id] > 1:
+                        frames[key] = frame
+                if frame is _UNFRAMED:
+                    yield self._render_unframed(node, EL)
+                else:
+                    head, tail = frame
+                    yield head
+                    if tail is not None:
+                        child = first_children[node]
+                        if child != _NONE:
+                            node = child
+                            continue
+                        yield tail
+            while node != root:
+                sibling = next_siblings[node]
+                if sibling != _NONE:
+                    node = sibling
+                    break
+                node = parents[node]
+                yield tails[tags[node]]
+            else:
+                return
+
+    def _frame_table(self, EL: Element) -> tuple[dict[int, tuple], dict[int, str]]:
+        settings = (EL.is_natural, EL.probo_pretty_error, EL.probo_custom_attrs)
+        table = self._frames.get(settings)
+        if table is None:
+            table = self._frames[settings] = ({}, {})
+        return table
+
+    def _frame(self, tag_id: int, attribute_id: int, EL: Element, tails: dict[int, str]) -> tuple:
+        """(head, tail) for one shape: tail is None for void elements and
+        for validation errors, which replace the element. `_UNFRAMED` when
+        EL cannot frame the tag. Records the tag's tail in `tails`."""
+        frame = EL.tag_frame(self.tag_names[tag_id], dict(self.attribute_sets[attribute_id]), shared_cache=False)
+        if frame is None:
+            return _UNFRAMED
+        if isinstance(frame, str):
+            return (frame, None)
+        if frame.void:
+            return (frame.opening, None)
+        separator = "\n" if EL.is_natural else ""
+        tail = tails.get(tag_id)
+        if tail is None:
+            tail = tails[tag_id] = separator + frame.closing
+        return (frame.opening + separator, tail)
+
+    def _render_unframed(self, node: int, EL: Element) -> str:
+        """Renders a tag the builder cannot frame (the doctype) through its
+        tag method, as a light node would."""
+        content = "".join("".join(self._fragments(child, EL)) for child in self.children(node))
+        method = getattr(EL, self.tag_names[self.tags[node]])
+        return method(ProboSourceString(content), **dict(self.attribute_sets[self.attributes[node]])).element
+
+
+def _tag_builder(name: str):
+    # The body of `TreeArena.element`, inlined: builders run once per node.
+    def build(self: TreeArena, *content: Any, **attrs: Any) -> ArenaRef:
+        tag_id = self._tag_ids.get(name)
+        if tag_id is None:
+            tag_id = self._intern_tag(name)
+        node = self._new_node(tag_id, self._intern_attributes(attrs) if attrs else 0)
+        if content:
+            self._link(node, content)
+        return ArenaRef(node)
+
+    build.__name__ = build.__qualname__ = name
+    build.__doc__ = f"Adds a <{name.lower()}> element; the arena counterpart of `l_{name}`."
+    return build
+
+
+for _module in (block_tags, self_closing, svg_tags):
+    for _name, _function in vars(_module).items():
+        if (
+            _name.startswith("l_")
+            and callable(_function)
+            and not keyword.iskeyword(_name[2:])
+            and _name[2:] not in TreeArena.__dict__
+        ):
+            setattr(TreeArena, _name[2:], _tag_builder(_name[2:]))
+del _module, _name, _function
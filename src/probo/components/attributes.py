@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Any,Self,Optional
 from probo.utility import EnumLookUPMixin
 
@@ -1913,6 +1914,80 @@ class Tag(EnumLookUPMixin, Enum):
         except KeyError:
             return default
 
+class AttributeSchema:
+    """
+    Compiled attribute rules for one opening tag.
+
+    Built once per tag from `ElementAttribute` and `AttributeValue`, so a
+    validation is a handful of set/dict lookups instead of walking the enums
+    and re-deriving the rules for every attribute of every node.
+
+    Args:
+        element_tag: the element string tag used in <tag> format.
+
+    Attributes:
+        any_value (frozenset): attributes accepting any value.
+        value_rules (dict): attribute -> frozenset of allowed values
+            (matched as-is or lower-cased).
+        tag_value_rules (dict): attribute -> allowed values specific to this tag
+            (must match both as-is and lower-cased).
+        dropped (frozenset): boolean attributes silently omitted when given a
+            non-boolean value.
+        allowed (frozenset): every attribute that can appear on this tag.
+    """
+    __slots__ = (
+        'element_tag',
+        'any_value',
+        'value_rules',
+        'tag_value_rules',
+        'dropped',
+        'allowed',
+    )
+    def __init__(self, element_tag: str = ""):
+        self.element_tag = element_tag
+        tag_clean = element_tag.strip("<>")
+        el_attr_definitions = ElementAttribute.ELEMENT_ATTRIBUTE.value
+        any_value, dropped = set(), set()
+        value_rules, tag_value_rules = {}, {}
+
+        for key, rule in AttributeValue.ATTRIBUTE_VALUE.value.items():
+            el_attr_check = el_attr_definitions.get(key, None)
+            if not rule or (el_attr_check and element_tag and element_tag not in el_attr_check):
+                continue
+            if rule == "any":
+                any_value.add(key)
+            elif isinstance(rule, list):
+                value_rules[key] = frozenset(rule)
+            elif isinstance(rule, dict):
+                if tag_clean in rule:
+                    allowed_vals = rule[tag_clean]
+                    # A plain string keeps substring semantics, as before.
+                    tag_value_rules[key] = (
+                        allowed_vals if isinstance(allowed_vals, str) else frozenset(allowed_vals)
+                    )
+            else:
+                dropped.add(key)
+
+        self.any_value = frozenset(any_value)
+        self.value_rules = value_rules
+        self.tag_value_rules = tag_value_rules
+        self.dropped = frozenset(dropped)
+        self.allowed = self.any_value | value_rules.keys() | tag_value_rules.keys() | self.dropped
+
+
+@lru_cache(maxsize=1024)
+def compile_attribute_schema(element_tag: str) -> AttributeSchema:
+    """Lazily compiles (once per tag) and returns the tag's `AttributeSchema`."""
+    return AttributeSchema(element_tag)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_attribute_key(raw_key: str) -> str:
+    if len(raw_key) >1:
+        return raw_key[0].lower()+raw_key[1:].strip().replace("_", "-")
+    return raw_key.lower().strip().replace("_", "-")
+
+
 class ElementAttributeValidator:
     """
     Class to validate HTML attributes for elements.
@@ -1954,11 +2029,7 @@ class ElementAttributeValidator:
         :param self: ElementAttributeValidator.
         :param raw_key: the attribute key passed as **kwargs to be normalized.
         """
-        if len(raw_key) >1:
-            key = raw_key[0].lower()+raw_key[1:].strip().replace("_", "-")
-        else:
-            key = raw_key.lower().strip().replace("_", "-")
-        return key
+        return _normalize_attribute_key(raw_key)
 
     def validate(self) -> bool:
         """
@@ -1969,13 +2040,11 @@ class ElementAttributeValidator:
             return True
 
         all_valid = True
-        el_attr_definitions = ElementAttribute.ELEMENT_ATTRIBUTE.value
-        # Access the master dictionary
-        definitions = AttributeValue.ATTRIBUTE_VALUE.value
-        
+        schema = compile_attribute_schema(self.element_tag)
+
         for raw_key, value in self.raw_attrs.items():
             # 1. NORMALIZE KEY (class_ -> class, aria_hidden -> aria-hidden)
-            key = self._normalized_key(raw_key)
+            key = _normalize_attribute_key(raw_key)
 
             # --- SKIP PART 1: BOOLEANS ---
             if isinstance(value, bool) or key == value:
@@ -1989,57 +2058,44 @@ class ElementAttributeValidator:
             if key.startswith(("data-", "aria-", "hx-", "on", "xml", "ng-", "v-")):
                 self.valid_attrs[key] = value
                 continue
-                        
-            el_attr_check = el_attr_definitions.get(key, None)
-            if (
-                (el_attr_check and self.element_tag )and (not self.element_tag in el_attr_check)
-            ):
-                self.error_attrs.append(f"{key}='{value}'")
-                return False
-            
-            rule = definitions.get(key,None)
-            # --- CHECK: DEFINITIONS ---
-            if rule:
 
-                # Case A: 'any' -> Accept anything
-                if rule == "any":
-                    self.valid_attrs[key] = value
-                    continue
+            # Case A: 'any' -> Accept anything
+            if key in schema.any_value:
+                self.valid_attrs[key] = value
+                continue
 
-                # Case B: List of allowed values -> Check it
-                if isinstance(rule, list):
-                    # Convert to string to handle ints safely
-                    if str(value) not in rule:
-                        if str(value).lower() in rule:
-                            self.valid_attrs[key] = value
-                        else:
-                            self.error_attrs.append(f"{key}='{value}' (Expected: {rule})")
-                            all_valid = False
-                        continue
-                    else:
-                        self.valid_attrs[key] = value
-                        continue
+            # Case B: List of allowed values -> Check it
+            allowed_vals = schema.value_rules.get(key)
+            if allowed_vals is not None:
+                # Convert to string to handle ints safely
+                text = str(value)
+                if text in allowed_vals or text.lower() in allowed_vals:
+                    self.valid_attrs[key] = value
+                else:
+                    rule = AttributeValue.ATTRIBUTE_VALUE.value[key]
+                    self.error_attrs.append(f"{key}='{value}' (Expected: {rule})")
+                    all_valid = False
+                continue
 
-                # Case C: Dictionary (Element-Specific Rules) -> Check it
-                if isinstance(rule, dict):
+            # Case C: Element-Specific Rules -> Check it
+            allowed_vals = schema.tag_value_rules.get(key)
+            if allowed_vals is not None:
+                text = str(value)
+                if text not in allowed_vals or text.lower() not in allowed_vals:
                     tag_clean = self.element_tag.strip("<>")
+                    rule = AttributeValue.ATTRIBUTE_VALUE.value[key][tag_clean]
+                    self.error_attrs.append(
+                        f"{key}='{value}' on <{tag_clean}> (Expected: {rule})"
+                    )
+                    all_valid = False
+                else:
+                    self.valid_attrs[key] = value
+                continue
 
-                    if tag_clean in rule:
-                        allowed_vals = rule[tag_clean]
-                        if str(value) not in allowed_vals or str(value).lower() not in allowed_vals:
-                            self.error_attrs.append(
-                                f"{key}='{value}' on <{tag_clean}> (Expected: {allowed_vals})"
-                            )
-                            all_valid = False
-                            continue
-                        else:
-                            # Tag not specified in rule, be loose
-                            self.valid_attrs[key] = value
-                            continue
-                    else:
-                        self.error_attrs.append(f"{key}='{value}'")
-                        return False
-            else:
-                self.error_attrs.append(f"{key}='{value}'")
-                return False
+            if key in schema.dropped:
+                continue
+
+            # Unknown attribute, or not permitted on this element.
+            self.error_attrs.append(f"{key}='{value}'")
+            return False
         return all_valid
@@ -1,9 +1,57 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from collections import deque
-from typing import Dict, Union, Self, Any,Generator
+from typing import AsyncIterator, Callable, Dict, Union, Self, Any,Generator
 import inspect
-from probo.utility import ProboSourceString,markup_escape
+from functools import partial
+from probo.utility import (
+    ProboSourceString,
+    markup_escape,
+    astream_chunks,
+    defer_async,
+    is_async_content,
+)
+from probo.streaming.sinks import ListSink, RenderSink
+from probo.components.compiler import CompiledTemplate, SegmentSink, compile_tree
+from probo.components.compact import EMPTY_MAPPING, CompactNodeMixin, intern_attributes
+
+def _write_escaped(sink: RenderSink, rendered: Any) -> None:
+    """Writes a rendered value the way the string collector merges it."""
+    if isinstance(rendered, (list, deque)):
+        for x in rendered:
+            sink.write(x if isinstance(x, ProboSourceString) else markup_escape(x))
+    else:
+        sink.write(rendered if isinstance(rendered, ProboSourceString) else markup_escape(rendered))
+
+
+def _is_live(value: Any) -> bool:
+    """True for content whose output may change between renders."""
+    return callable(value) or inspect.isgenerator(value) or is_async_content(value)
+
+
+def _write_rendered(sink: RenderSink, item: Any, EL: Any) -> None:
+    """Slot writer: renders a child that cannot be framed by a sink."""
+    _write_escaped(sink, item.render(EL) if hasattr(item, "light_tag") else item.render())
+
+
+def _write_rendered_sub(sink: RenderSink, sub: Any) -> None:
+    """Slot writer: renders a child found inside a nested list."""
+    sub_rendered = sub.render()
+    if isinstance(sub_rendered, (list, deque)):
+        _write_escaped(sink, sub_rendered)
+    else:
+        _write_escaped(sink, sub_rendered if isinstance(sub_rendered, ProboSourceString) else markup_escape(sub_rendered))
+
+
+def _write_generator(sink: RenderSink, item: Any) -> None:
+    """Slot writer: drains a generator of strings and elements."""
+    sink.write(ProboSourceString("".join((x if isinstance(x, ProboSourceString) else markup_escape(x)) if not hasattr(x,"render") else x.render() for x in item)))
+
+
+def _write_value(sink: RenderSink, item: Any) -> None:
+    """Slot writer: escapes a raw value (the string collector escapes twice)."""
+    _write_escaped(sink, item if isinstance(item, ProboSourceString) else markup_escape(item))
+
 
 class ElementAttributeManipulator:
     """
@@ -368,7 +416,7 @@ class ComponentAttrManager(ElementAttributeManipulator):
         """
         return self.children
 
-class BaseHTMLElement(ABC):
+class BaseHTMLElement(CompactNodeMixin, ABC):
     """The abstract base class for all ProboUI HTML elements.
 
     Provides a unified initialization for element content and attributes. 
@@ -376,11 +424,19 @@ class BaseHTMLElement(ABC):
     attributes, CSS classes, and inline styles by delegating to 
     `ElementAttributeManipulator`.
 
+    Content and attributes are stored compactly (see `CompactNodeMixin`):
+    the constructor's tuple and an interned attribute set, promoted to a
+    deque and a dict the first time they are accessed for editing.
+
     Attributes:
-        content (tuple): The positional arguments representing inner HTML/text.
+        content (deque): The positional arguments representing inner HTML/text.
         attributes (dict): The keyword arguments representing HTML attributes.
     """
-    __slots__ = ('attributes', 'content','node_children', '_render_conditions', 'parent','_ElementNodeMixin__void_node', 'element_tag', '_override_style')
+    __slots__ = ('_attributes', '_content','node_children', '_render_conditions', 'parent','_ElementNodeMixin__void_node', 'element_tag', '_override_style', '_memoize', '_render_cache', '_node_index',
+                 '_el_instance', 'use_list', 'use_deque', 'element_data', '_el_owner', '_share_element',
+                 # Elements accepted ad-hoc attributes and weak references before
+                 # they were slotted; the dict is only allocated when one is set.
+                 '__dict__', '__weakref__')
 
     def __init__(self, *content:str, **kwargs:Any):
         """
@@ -391,11 +447,13 @@ class BaseHTMLElement(ABC):
             **kwargs: Arbitrary keyword arguments representing HTML attributes.
                       (e.g., class_='my-class', id='my-id', style='color: red;').
         """
-        self.content = deque(content) if isinstance(content, tuple) else deque((content,))
+        self._content = content if isinstance(content, tuple) else (content,)
         self.element_tag=''
-        self.attributes = kwargs
+        self._attributes = intern_attributes(kwargs)
         self._override_style = False
-        self._render_conditions={}
+        self._render_conditions = EMPTY_MAPPING
+        self._memoize = False
+        self._render_cache = None
     @property
     def attr_manager(self) -> ElementAttributeManipulator:
         """Accesses the attribute manipulator for this element.
@@ -404,6 +462,7 @@ class BaseHTMLElement(ABC):
             An instance of ElementAttributeManipulator initialized with 
             the element's current attributes, allowing for chainable updates.
         """
+        self.mark_dirty()
         return ElementAttributeManipulator(self.attributes)
 
     @property
@@ -415,6 +474,7 @@ class BaseHTMLElement(ABC):
             the element's current attributes, allowing for chainable updates.
         """
         from probo.styles.style_manager import StyleManager
+        self.mark_dirty()
         return StyleManager(self.attributes,self._override_style)
 
     def inner_html(self, *content:tuple[str|Self]) -> Self:
@@ -425,7 +485,8 @@ class BaseHTMLElement(ABC):
                       for the element. Can be strings, other BaseHTMLElement 
                       instances, or lists of such instances.
         """
-        self.content=deque(content)
+        self._content = content
+        self.mark_dirty()
         return self
 
     def add_render_constraints(self, **constraints:str) -> Self:
@@ -440,8 +501,65 @@ class BaseHTMLElement(ABC):
                 conditions (e.g., user_is_logged_in=True, has_items=False).
         """
         self._render_conditions = constraints
+        self.mark_dirty()
+        return self
+
+    def memoize(self, enabled: bool = True) -> Self:
+        """Caches the rendered markup of this subtree between renders.
+
+        Each memoised element keeps its output as a `CompiledTemplate`, so a
+        clean subtree is replayed instead of re-rendered, while components
+        and generators inside it are still evaluated every time. Mutations
+        through `attr_manager`, `style_manager`, `inner_html`, `add`,
+        `remove`, `modify` and `bind_element`, and reading `content` or
+        `attributes` to edit them, mark the element and its ancestors dirty.
+
+        Args:
+            enabled: False switches caching off for the subtree and drops it.
+
+        Example:
+            >>> layout = HTML(HEAD(...), BODY(NAV(badge := SPAN("3")), MAIN())).memoize()
+            >>> layout.render()
+            >>> badge.inner_html("4")  # only SPAN, NAV, BODY and HTML re-render
+            >>> layout.render()
+        """
+        self._memoize = enabled
+        self._render_cache = None
+        for item in self._content:
+            subs = item if isinstance(item, (list, tuple)) else (item,)
+            for sub in subs:
+                if isinstance(sub, BaseHTMLElement):
+                    sub.memoize(enabled)
         return self
 
+    def mark_dirty(self) -> Self:
+        """Drops the cached render of this element and of every ancestor,
+        and queues the element to be re-read by any `NodeIndex` above it."""
+        node = self
+        while node is not None:
+            if getattr(node, "_render_cache", None) is not None:
+                node._render_cache = None
+            index = getattr(node, "_node_index", None)
+            if index is not None:
+                index.touch(self)
+            node = getattr(node, "parent", None)
+        return self
+
+    def _memoized(self, kind: str, EL: Any, write: Callable[[RenderSink], Any]) -> CompiledTemplate | None:
+        """Returns the cached template for `kind`, compiling it with `write`
+        on a miss. None when `write` reports the element cannot be framed."""
+        key = (kind, EL.is_natural, EL.probo_pretty_error, EL.probo_custom_attrs)
+        if self._render_cache is not None and key in self._render_cache:
+            return self._render_cache[key]
+        compiling = SegmentSink()
+        if write(compiling) is False:
+            return None
+        template = compiling.getvalue()
+        if self._render_cache is None:
+            self._render_cache = {}
+        self._render_cache[key] = template
+        return template
+
     def _get_rendered_content(self) -> str|list[str]|deque[str]:
         """Recursively renders all nested content into a single HTML string.
 
@@ -450,16 +568,27 @@ class BaseHTMLElement(ABC):
         iterables (like lists of elements), converting everything to its 
         final string representation.
 
+        In string mode the whole subtree is written into one render sink
+        (see `render_into`), so each fragment is copied once regardless of
+        nesting depth.
+
         Returns:
             A string containing the concatenated HTML of all child items.
         """
+        if hasattr(type(self), "EL"):
+            # Picks up flags an ancestor set since the last render.
+            self.EL
         use_list = self.use_list if hasattr(self, "use_list") else False
         use_deque = self.use_deque if hasattr(self, "use_deque") else False
 
         if not use_list and not self.use_deque:
-            collector = ""
-        else:
-            collector = deque() if use_deque else list()
+            if self._memoize:
+                EL = self.EL
+                return self._memoized("content", EL, lambda sink: self._write_content(sink, EL)).render()
+            sink = ListSink()
+            self._write_content(sink, self.EL)
+            return sink.getvalue()
+        collector = deque() if use_deque else list()
 
         # 2. Helper to add items to the collector based on type
         def _add_to_collector(target, item):
@@ -476,7 +605,7 @@ class BaseHTMLElement(ABC):
                 return target
 
         # 3. Process the content
-        for item in self.content:
+        for item in self._content:
             rendered = None
             # Scenario A: Child is a Component (Class)
             if hasattr(item, "render"):
@@ -523,7 +652,135 @@ class BaseHTMLElement(ABC):
             collector = _add_to_collector(collector, rendered)
 
         return collector
+
+    def _write_content(self, sink: RenderSink, EL: Any) -> None:
+        """Writes the string-mode rendering of `self.content` into `sink`.
+
+        Child elements and light nodes write themselves through `_write_node`.
+        Everything that may change between renders (components, generators,
+        callables, awaitables) goes through `sink.write_dynamic`, which a
+        compiling sink records as a slot; other values are escaped exactly
+        as the string collector always did.
+        """
+        for item in self._content:
+            if hasattr(item, "render"):
+                if hasattr(item, "light_tag"):
+                    if hasattr(item, "_write_node") and item._write_node(sink, EL):
+                        continue
+                else:
+                    if hasattr(item, "bind_element"):
+                        item.bind_element(EL)
+                    if hasattr(item, "_write_node") and item._write_node(sink, item.EL if hasattr(item, "EL") else EL):
+                        continue
+                sink.write_dynamic(partial(_write_rendered, item=item, EL=EL))
+
+            elif inspect.isgenerator(item):
+                sink.write_dynamic(partial(_write_generator, item=item))
+
+            elif isinstance(item, Iterable) and not isinstance(
+                item, (str, bytes, deque)
+            ):
+                for sub in item:
+                    if hasattr(sub, "render"):
+                        if self._memoize and getattr(sub, "parent", False) is None:
+                            # Link list-held children so their mutations reach this cache.
+                            sub.parent = self
+                        if hasattr(sub, "bind_element"):
+                            sub.bind_element(EL)
+                        if hasattr(sub, "_write_node") and sub._write_node(sink, sub.EL if hasattr(sub, "EL") else EL):
+                            continue
+                        sink.write_dynamic(partial(_write_rendered_sub, sub=sub))
+                    elif _is_live(sub):
+                        sink.write_dynamic(partial(_write_value, item=sub))
+                    else:
+                        _write_value(sink, sub)
+
+            elif _is_live(item):
+                sink.write_dynamic(partial(_write_value, item=item))
+            else:
+                _write_value(sink, item)
+
+    def _frame_tag(self) -> str | None:
+        """The tag this element writes around its content, or None if it
+        must be rendered through its own `render()`."""
+        return self.element_tag or None
+
+    def _write_node(self, sink: RenderSink, EL: Any) -> bool:
+        """Writes this element and its subtree into `sink` in one pass.
+
+        Returns False, having written nothing, when the element cannot be
+        framed by `EL` (see `Element.tag_frame`); the caller then falls back
+        to `render()`. Memoised elements replay their cached template.
+        """
+        if not self._memoize:
+            return self._write_frame(sink, EL)
+        template = self._memoized("node", EL, lambda compiling: self._write_frame(compiling, EL))
+        if template is None:
+            return False
+        template.render_into(sink)
+        return True
+
+    def _write_frame(self, sink: RenderSink, EL: Any) -> bool:
+        tag = self._frame_tag()
+        if not tag or self._render_conditions:
+            # Conditional elements are evaluated by their own render() every time.
+            return False
+        frame = EL.tag_frame(tag, self._attributes)
+        if frame is None:
+            return False
+        if isinstance(frame, str):
+            # Invalid attributes under probo_pretty_error: the error replaces the element.
+            sink.write(frame)
+            return True
+        sink.write(frame.opening)
+        if frame.void:
+            return True
+        separator = "\n" if EL.is_natural else ""
+        if separator:
+            sink.write(separator)
+        self._write_content(sink, EL)
+        if separator:
+            sink.write(separator)
+        sink.write(frame.closing)
+        return True
+
+    def render_into(self, sink: RenderSink) -> RenderSink:
+        """Writes the string rendering of this element into `sink`.
+
+        The output equals `render()` in string mode, but the tree is walked
+        once and every tag and text fragment goes straight to the sink, so
+        deep trees render in linear time and a `FileSink` never holds the
+        page in memory.
+
+        Args:
+            sink: A RenderSink (ListSink, StringSink, BytesSink, FileSink...).
+
+        Returns:
+            The same sink, for chaining into `getvalue()`.
+
+        Example:
+            >>> DIV(P("a"), P("b")).render_into(ListSink()).getvalue()
+            '<div><p>a</p><p>b</p></div>'
+        """
+        if not self._write_node(sink, self.EL):
+            rendered = self.render()
+            sink.write(rendered if isinstance(rendered, str) else "".join(rendered))
+        return sink
         
+    def compile(self) -> CompiledTemplate:
+        """Freezes the static parts of this tree into precomputed markup.
+
+        Static subtrees are validated and rendered once; components,
+        generators, callables and conditional elements stay as slots that
+        are evaluated on each `render()` of the result. See
+        `probo.components.compiler.CompiledTemplate`.
+
+        Example:
+            >>> shell = DIV(HEADER(NAV(...)), cart_summary).compile()
+            >>> html = shell.render()  # only cart_summary is re-rendered
+        """
+        return compile_tree(self)
+
     def _get_stream_content(self, batch: int = 50) -> Generator[str, None, None]:
         """
         The streaming engine: Iterates through children and yields HTML fragments.
@@ -546,12 +803,27 @@ class BaseHTMLElement(ABC):
                     yield from res
                 else:
                     yield res
+            elif is_async_content(item):
+                yield defer_async(item)
             else:
                 yield str(item)
 
-        for item in self.content:
+        for item in self._content:
             yield from _process_item(item)
 
+    def astream(self, batch: int = 50) -> AsyncIterator[str]:
+        """Async counterpart of `stream()`.
+
+        Content may hold awaitables and async iterables (e.g. rows from an async
+        DB driver); they are resolved in place as the stream reaches them. For
+        fully synchronous content the chunks are exactly those of `stream()`.
+
+        Example:
+            >>> async for chunk in DIV(fetch_rows()).astream(batch=20):
+            ...     await send(chunk)
+        """
+        return astream_chunks(self.stream(batch=batch), batch=batch)
+
     @abstractmethod
     def render(self) -> str:
         """Abstract method to generate the final HTML string for the element.
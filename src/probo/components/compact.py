@@ -0,0 +1,141 @@
+import weakref
+from collections import deque
+from typing import Any, Mapping
+
+
+class AttributeSet(dict):
+    """
+    An immutable attribute mapping shared by every node built with the same
+    attributes.
+
+    Most nodes of a page repeat a handful of attribute combinations
+    (`Class="row"`, `Class="cell"`, none at all). `intern_attributes`
+    returns one AttributeSet per combination, so a thousand `LI(Class="row")`
+    hold a pointer each instead of a dict each. Reading works like any dict,
+    including `**attrs` unpacking; changing it raises TypeError. Nodes copy
+    it into a private dict the first time their `attributes` are accessed
+    (see `CompactNodeMixin`), so sharing is invisible to callers.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def _immutable(self, *args: Any, **kwargs: Any):
+        raise TypeError("AttributeSet is shared between nodes and cannot be changed; copy it with dict() first.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    update = pop = popitem = setdefault = clear = _immutable
+
+    def __reduce__(self):
+        # Pickled trees re-intern their attribute sets when loaded.
+        return (intern_attributes, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"AttributeSet({dict.__repr__(self)})"
+
+
+EMPTY_ATTRIBUTES = AttributeSet()
+
+EMPTY_MAPPING: Mapping[str, Any] = EMPTY_ATTRIBUTES
+"""Shared stand-in for per-node dicts that are usually empty (render
+conditions, element data). Code that fills them assigns a new dict."""
+
+_ATTRIBUTE_SETS: "weakref.WeakValueDictionary[tuple, AttributeSet]" = weakref.WeakValueDictionary()
+
+
+def intern_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    """Returns the shared AttributeSet equal to `attributes`.
+
+    Attribute order is part of the key (it is the render order), and so is
+    each value's type, so `hidden=True` and `hidden=1` stay apart. A set is
+    dropped from the table once no node uses it. Mappings with unhashable
+    values are returned unchanged.
+
+    Args:
+        attributes: The keyword arguments a node was built with.
+
+    Example:
+        >>> intern_attributes({"Class": "row"}) is intern_attributes({"Class": "row"})
+        True
+    """
+    if not attributes:
+        return EMPTY_ATTRIBUTES
+    if type(attributes) is AttributeSet:
+        return attributes
+    try:
+        key = tuple((name, type(value), value) for name, value in attributes.items())
+        shared = _ATTRIBUTE_SETS.get(key)
+    except TypeError:
+        return attributes
+    if shared is None:
+        shared = _ATTRIBUTE_SETS.setdefault(key, AttributeSet(attributes))
+    return shared
+
+
+class CompactNodeMixin:
+    """
+    Copy-on-write storage for a node's `content` and `attributes`.
+
+    A node keeps the tuple of its constructor arguments as `_content` and an
+    interned AttributeSet as `_attributes`; nothing is allocated per node for
+    either. The public `content` and `attributes` properties hand out
+    mutable containers, promoting on first access: content becomes a deque
+    and attributes become a private dict. Render paths read `_content` and
+    `_attributes` directly, so rendering a tree never promotes it.
+
+    Since a caller may change whatever the properties hand out, accessing
+    them on a memoised node (see `BaseHTMLElement.memoize`) also calls its
+    `mark_dirty()`, so the next render sees the edit. Hold on to the
+    container only for the edit itself: changes made through a saved
+    reference after the next render are not seen.
+
+    Classes using the mixin declare `_content` and `_attributes` slots.
+    """
+
+    __slots__ = ()
+
+    @property
+    def content(self) -> deque:
+        content = self._content
+        if type(content) is tuple:
+            content = self._content = deque(content)
+        self._handing_out()
+        return content
+
+    @content.setter
+    def content(self, value: Any) -> None:
+        self._content = value
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        attributes = self._attributes
+        if type(attributes) is AttributeSet:
+            attributes = self._attributes = dict(attributes)
+        self._handing_out()
+        return attributes
+
+    @attributes.setter
+    def attributes(self, value: dict[str, Any]) -> None:
+        self._attributes = value
+
+    def _handing_out(self) -> None:
+        # Only memoised nodes pay for the ancestor walk; plain reads such as
+        # `find(lambda n: n.attributes.get("id") == ...)` stay O(1).
+        if getattr(self, "_memoize", False):
+            self.mark_dirty()
+
+    @property
+    def is_compact(self) -> bool:
+        """True while neither content nor attributes have been promoted."""
+        return type(self._content) is tuple and type(self._attributes) is AttributeSet
+
+
+def content_view(node: Any) -> Any:
+    """A node's content for reading, without promoting compact storage."""
+    content = getattr(node, "_content", None)
+    return getattr(node, "content", ()) if content is None else content
+
+
+def attributes_view(node: Any) -> Any:
+    """A node's attributes for reading, without promoting compact storage."""
+    attributes = getattr(node, "_attributes", None)
+    return getattr(node, "attributes", None) if attributes is None else attributes
@@ -0,0 +1,132 @@
+from functools import partial
+from typing import Any, Callable, Union
+
+from probo.streaming.sinks import ListSink, RenderSink
+from probo.utility import ProboSourceString
+
+Segment = Union[ProboSourceString, Callable[[RenderSink], None]]
+
+
+class CompiledTemplate:
+    """
+    A tree flattened into literal segments and dynamic slots.
+
+    Every static subtree (tags, attributes and plain text) is rendered,
+    validated and joined once at compile time. What remains are slots for
+    the content that must be evaluated on every render: components,
+    generators, callables, awaitables and elements with render conditions.
+    Rendering is then a walk over `segments` whose cost scales with the
+    number of slots, not the number of nodes.
+
+    Slots keep live references to their objects, so changing the state a
+    component reads is picked up by the next render. Structural edits to
+    the static part of the tree (adding children, changing attributes) need
+    a fresh `compile()`.
+
+    Attributes:
+        segments (tuple): Literal strings and slot writers in document order.
+        slot_count (int): How many segments are dynamic.
+
+    Example:
+        >>> page = DIV(H1("Orders"), UL(*[LI(n) for n in names]), OrderCount())
+        >>> compiled = page.compile()
+        >>> compiled.slot_count
+        1
+        >>> compiled.render() == page.render()
+        True
+    """
+
+    __slots__ = ("segments", "slot_count")
+
+    def __init__(self, segments: tuple[Segment, ...]):
+        self.segments = segments
+        self.slot_count = sum(1 for segment in segments if not isinstance(segment, str))
+
+    @property
+    def is_static(self) -> bool:
+        """True when the whole tree was frozen into literal markup."""
+        return self.slot_count == 0
+
+    def render_into(self, sink: RenderSink) -> RenderSink:
+        """Writes the literals and evaluates each slot into `sink`.
+
+        Slots go through `sink.write_dynamic`, so replaying into a compiling
+        sink keeps them dynamic.
+        """
+        for segment in self.segments:
+            if isinstance(segment, str):
+                sink.write(segment)
+            else:
+                sink.write_dynamic(segment)
+        return sink
+
+    def render(self) -> ProboSourceString:
+        if self.slot_count == 0:
+            return self.segments[0] if self.segments else ProboSourceString()
+        return self.render_into(ListSink()).getvalue()
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate(segments={len(self.segments)}, slots={self.slot_count})"
+
+
+class SegmentSink(RenderSink):
+    """A compiling sink: literal writes are merged, dynamic writes become slots."""
+
+    __slots__ = ("segments", "_literal")
+
+    def __init__(self):
+        self.segments: list[Segment] = []
+        self._literal: list[str] = []
+
+    def write(self, chunk: str) -> None:
+        self._literal.append(chunk)
+
+    def write_dynamic(self, writer: Callable[[RenderSink], None]) -> None:
+        self._flush()
+        self.segments.append(writer)
+
+    def getvalue(self) -> CompiledTemplate:
+        self._flush()
+        return CompiledTemplate(tuple(self.segments))
+
+    def _flush(self) -> None:
+        if self._literal:
+            self.segments.append(ProboSourceString("".join(self._literal)))
+            self._literal.clear()
+
+
+def _write_root(sink: RenderSink, node: Any, EL: Any) -> None:
+    rendered = node.render(EL) if hasattr(node, "light_tag") else node.render()
+    if isinstance(rendered, tuple):
+        # Components render to (html, css).
+        rendered = rendered[0]
+    sink.write(rendered if isinstance(rendered, str) else "".join(rendered))
+
+
+def compile_tree(node: Any, EL: Any = None) -> CompiledTemplate:
+    """Compiles a heavy or light tree into a `CompiledTemplate`.
+
+    The output of `compiled.render()` equals the node's string-mode
+    `render()`. A node that cannot be framed (a component, a conditional
+    element) compiles to a single slot.
+
+    Args:
+        node: A BaseHTMLElement, a LightNode or any object with `render()`.
+        EL (Element, optional): The builder driving light nodes. A fresh
+            string-mode Element is used when omitted.
+    """
+    sink = SegmentSink()
+    if hasattr(node, "light_tag"):
+        if EL is None:
+            from probo.components.elements import Element
+
+            EL = Element()
+        written = node._write_node(sink, EL)
+    elif hasattr(node, "_write_node"):
+        EL = node.EL
+        written = node._write_node(sink, EL)
+    else:
+        written = False
+    if not written:
+        sink.write_dynamic(partial(_write_root, node=node, EL=EL))
+    return sink.getvalue()
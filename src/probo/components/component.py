@@ -13,7 +13,7 @@ from probo.styles.elements import (
 )
 from probo.utility import ProboSourceString
 from typing import Any, Self
-from probo.templates.resolver import TemplateResolver
+from probo.templates.resolver import TemplateResolver, TemplateIndex
 from typing import Any,Self,Optional
 
 class Component(ComponentNode):
@@ -252,12 +252,13 @@ class Component(ComponentNode):
                 content=final_template, **self.root_element_attrs
             ).element
         if self.active_css_rules:
+            template_index = TemplateIndex(final_template)
             valid_css = element_style_state(
-                final_template,
+                template_index,
                 self.comp_state.resolved_state_elements,
                 *self.active_css_rules,
             )
-            self.cmp_style = ComponentStyle(final_template, *valid_css)
+            self.cmp_style = ComponentStyle(template_index, *valid_css)
             return ProboSourceString(final_template), ProboSourceString(self.cmp_style.render())
         else:
             return ProboSourceString(final_template)
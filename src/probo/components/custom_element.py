@@ -27,7 +27,7 @@ class CustomElement(BaseHTMLElement, ElementNodeMixin, ElementMutatorMixin):
         content = self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .custom_element(self.tag)
             .element
@@ -37,7 +37,7 @@ class CustomElement(BaseHTMLElement, ElementNodeMixin, ElementMutatorMixin):
         '''
         Blueprint:custom_element = Element(
         ).set_attrs(**self.attributes).set_content(self.content).custom_element(self.tag).element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
@@ -45,7 +45,7 @@ class CustomElement(BaseHTMLElement, ElementNodeMixin, ElementMutatorMixin):
 
         element_info = (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .custom_element(self.tag)
             .element
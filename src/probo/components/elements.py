@@ -3,12 +3,19 @@ from probo.components.attributes import (
     Tag,
 )
 from functools import partial
-from enum import Enum
 import tempfile
 import webbrowser
 import os
+import threading
 from collections import OrderedDict
-from probo.utility import render_attributes, markup_escape, ProboSourceString
+from probo.utility import (
+    CustomTag,
+    custom_elements,
+    render_attributes,
+    markup_escape,
+    ProboSourceString,
+    astream_chunks,
+)
 from typing import Any, AsyncGenerator, Self
 from collections import deque
 
@@ -16,6 +23,69 @@ MARKER = chr(31)
 CONTENT_MARKER = f"@probo:{MARKER}"
 Tag.thaw()
 
+
+class TagTemplate:
+    """Ready-made opening/closing strings for one (tag, attributes) shape."""
+
+    __slots__ = ("opening", "closing", "void")
+
+    def __init__(self, opening: str, closing: str | None, void: bool):
+        self.opening = opening
+        self.closing = closing
+        self.void = void
+
+
+class TagTemplateCache:
+    """
+    A bounded, thread-safe LRU of compiled `TagTemplate`s shared by every
+    Element builder.
+
+    Keys are (tag name, tag string, void flag, normalised attributes), so a
+    hot shape such as `<td class="cell">` is assembled once and then reused
+    by every row of every table.
+
+    Args:
+        max_entries (int): Number of distinct shapes kept before the least
+            recently used one is evicted.
+    """
+
+    __slots__ = ("max_entries", "hits", "misses", "_store", "_lock")
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._store: OrderedDict[tuple, TagTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: tuple) -> TagTemplate | None:
+        with self._lock:
+            template = self._store.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._store.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def put(self, key: tuple, template: TagTemplate) -> TagTemplate:
+        with self._lock:
+            self._store[key] = template
+            if len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self.hits = self.misses = 0
+
+
+TAG_TEMPLATES = TagTemplateCache()
+
 class Element:
     """A dynamic HTML element factory and renderer.
 
@@ -261,7 +331,7 @@ class Element:
         self.use_sibling = False
         self.sibling_element = str()
         if self.tag:
-            self.element = ProboSourceString(self.build_tag(Tag.get(self.tag)).replace(MARKER, "")) if not self.is_list else self.build_tag(Tag.get(self.tag))
+            self.element = ProboSourceString(self.build_tag(Tag.get(self.tag), separator="")) if not self.is_list else self.build_tag(Tag.get(self.tag))
         if use_deque and is_list:
             self.use_deque()
 
@@ -398,13 +468,7 @@ class Element:
                     self.content = content + self.content
 
         string = self.build_tag(tag_enum)
-        if self.is_list:
-            self.element = string
-        else:
-            if self.is_natural:
-                self.element = ProboSourceString(string.replace(MARKER, "\n"))
-            else:
-                self.element = ProboSourceString(string.replace(MARKER, ""))
+        self.element = string if self.is_list else ProboSourceString(string)
         if self.use_sibling and self.element and not set_as_content:
             if type(self.element) is str and type(self.sibling_element) is str:
                 self.sibling_element += self.element    
@@ -533,19 +597,23 @@ class Element:
         attrs_dict.clear()
         return content
 
-    def build_tag(self, tag: Tag, is_custom: bool = False) -> str|list[str]:
+    def build_tag(
+        self, tag: Tag, is_custom: bool = False, separator: str | None = None
+    ) -> str|list[str]:
         """Constructs the physical HTML string for a given tag.
 
         Handles the distinction between void elements (like <img/>) and
-        standard elements (like <div>content</div>), and manages
-        internal MARKER placement.
+        standard elements (like <div>content</div>). Opening/closing strings
+        come from the shared tag template cache.
 
         Args:
             tag: The tag definition (usually a member of the Tag Enum).
             is_custom: If True, bypasses standard tag health checks.
+            separator: Placed between tags and content in string mode.
+                Defaults to a newline for `is_natural` builders, else nothing.
 
         Returns:
-            str: The raw HTML string including MARKERs.
+            str: The final HTML string (or list of fragments when `is_list`).
         """
         tag_value = tag.value
         if not is_custom:
@@ -580,12 +648,14 @@ class Element:
                     else:
                         self.content += self.element
         content = self.render_content()
-        if tag_value[1]["void"]:
+        template = self.tag_template(tag_value)
+        sep = ("\n" if self.is_natural else "") if separator is None else separator
+        if template.void:
             if self.tag == "doctype":
                 if '<html' in content or '<html' in (content[0] if isinstance(content, (list, deque)) else content):
                     if self.is_list:
                         result = None
-                        opening = ProboSourceString(f"<{tag_value[0]}{self.render_attrs()}>",)
+                        opening = template.opening
                         if self._use_deque and isinstance(content, deque):
                             content.appendleft(opening)
                             return content
@@ -600,27 +670,18 @@ class Element:
                                 result.append(content)
                         return result
                     else:
-                        return f"<{tag_value[0]}{self.render_attrs()}>{MARKER}{content}"
-                else:
-                    if self.is_list:
-                        result = list() if not self._use_deque else deque()
-                        result.append(ProboSourceString(f"<{tag_value[0]}{self.render_attrs()}>",))
-                        return result
-                    else:
-                        return f"<{tag_value[0]}{self.render_attrs()}>"
-            else:
-                if self.is_list:
-                    result = list() if not self._use_deque else deque()
-                    result.append(ProboSourceString(f"<{tag_value[0]}{self.render_attrs()}/>",))
-                    return result
-                else:
-                    return f"<{tag_value[0]}{self.render_attrs()}/>"
+                        return f"{template.opening}{sep}{content}"
+            if self.is_list:
+                result = list() if not self._use_deque else deque()
+                result.append(template.opening)
+                return result
+            return template.opening
         else:
             if self.is_list:
 
                 result = None
-                opening = ProboSourceString(f"<{tag_value[0]}{self.render_attrs()}>",)
-                closing = ProboSourceString(f"</{tag_value[0]}>",)
+                opening = template.opening
+                closing = template.closing
                 if self._use_deque and isinstance(content, deque):
                     content.appendleft(opening)
                     content.append(closing)
@@ -638,7 +699,83 @@ class Element:
                     result.append(closing)
                 return result
             else:
-                return f"<{tag_value[0]}{self.render_attrs()}>{MARKER}{content}{MARKER}</{tag_value[0]}>"
+                return f"{template.opening}{sep}{content}{sep}{template.closing}"
+
+    def tag_template(self, tag_value: tuple) -> TagTemplate:
+        """Returns the compiled opening/closing strings for the current attrs.
+
+        Templates are shared through the bounded `TAG_TEMPLATES` cache; attrs
+        holding unhashable values are compiled without caching.
+        """
+        name, void = tag_value[0], tag_value[1]["void"]
+        try:
+            key = (
+                name,
+                self.tag,
+                void,
+                tuple(
+                    (k, type(v), tuple(v) if type(v) is list else v)
+                    for k, v in self.attrs.items()
+                ),
+            )
+            template = TAG_TEMPLATES.get(key)
+        except TypeError:
+            return self._compile_tag_template(name, void)
+        if template is None:
+            template = TAG_TEMPLATES.put(key, self._compile_tag_template(name, void))
+        return template
+
+    def _compile_tag_template(self, name: str, void: bool) -> TagTemplate:
+        attrs = self.render_attrs()
+        if not void:
+            return TagTemplate(
+                ProboSourceString(f"<{name}{attrs}>"),
+                ProboSourceString(f"</{name}>"),
+                False,
+            )
+        if self.tag == "doctype":
+            return TagTemplate(ProboSourceString(f"<{name}{attrs}>"), None, True)
+        return TagTemplate(ProboSourceString(f"<{name}{attrs}/>"), None, True)
+
+    def tag_frame(self, tag_string: str, attrs: dict[str, Any], shared_cache: bool = True) -> TagTemplate | str | None:
+        """Validates `attrs` for one tag and returns its open/close template.
+
+        This is a tag method call without the content: render sinks use it to
+        write a tag around children that write themselves. The returned
+        template is what `build_tag` would wrap the content with.
+
+        Args:
+            tag_string: The tag method name (e.g. 'div', 'del').
+            attrs: The element's attributes.
+            shared_cache: False compiles the template without going through
+                `TAG_TEMPLATES`, for callers that keep their own table.
+
+        Returns:
+            The TagTemplate; the pretty-error HTML when validation fails under
+            `probo_pretty_error`; or None when this builder cannot frame tags
+            (list mode, history collection, siblings, or an unknown tag).
+        """
+        if self.is_list or self.collect_history or self.use_sibling:
+            return None
+        if tag_string.lower() in self.RESERVED_TAGS:
+            tag_string = tag_string.capitalize()
+        else:
+            tag_string = tag_string.lower()
+        tag = Tag.get(tag_string)
+        if tag is None or tag is Tag.DOCTYPE:
+            # The doctype's output depends on its content, so it is never framed.
+            return None
+        self.tag = tag_string
+        self.attrs = dict(attrs)
+        try:
+            flag = self.element_health(opening_tag=f"<{tag.value[0]}>")
+            if isinstance(flag, str):
+                return ProboSourceString(flag)
+            if not shared_cache:
+                return self._compile_tag_template(tag.value[0], tag.value[1]["void"])
+            return self.tag_template(tag.value)
+        finally:
+            self.attrs.clear()
 
     def render_attrs(self) -> str:
         """Render the attributes of the element as a string."""
@@ -776,23 +913,15 @@ class Element:
         is_void_element: bool = False,
         **attrs: dict[str, Any],
     ) -> Self:
-        Tag.thaw()
-        if cstm_tag.upper() in Tag.keys_set:
-            tag = Tag.values_map[cstm_tag]
-        else:
-            tag = None
-        if not tag:
-            tag = Enum(
-                "tag",
-                {
-                    cstm_tag.upper(): [
-                        cstm_tag.lower(),
-                        {
-                            "void": is_void_element,
-                        },
-                    ]
-                },
-            )[cstm_tag.upper()]
+        tag = Tag.values_map.get(cstm_tag.lower()) or custom_elements.get(
+            cstm_tag, is_void_element
+        )
+        if attrs and type(tag) is CustomTag:
+            invalid = tag.invalid_attributes(attrs)
+            if invalid:
+                raise ValueError(
+                    f'"{tag.name}" element doesn\'t accept these attributes: {", ".join(invalid)}'
+                )
         if tag or attrs:
             self.attrs.update(attrs)
             if isinstance(self.content, (list, deque)):
@@ -806,14 +935,7 @@ class Element:
                     self.content += ''.join(content)
                 else:
                     self.content += content
-        string = self.build_tag(tag, is_custom=True)
-        if self.is_list:
-            self.element = string
-        else:
-            if self.is_natural:
-                self.element = string.replace(MARKER, "\n")
-            else:
-                self.element = string.replace(MARKER, "")
+        self.element = self.build_tag(tag, is_custom=True)
         self.attrs.clear()
         return self
 
@@ -870,6 +992,13 @@ class Element:
         if buffer:
             yield ProboSourceString("".join(buffer))
 
+    def astream(self, batch: int = 50) -> AsyncGenerator[str, None]:
+        """
+        Async counterpart of `stream()`. Generator content may carry
+        awaitables or async iterables, which are resolved in place.
+        """
+        return astream_chunks(self.stream(batch), batch=batch)
+
     def __str__( self,) -> str:
         return str(self.stringify_element().element)
 
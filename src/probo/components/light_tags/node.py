@@ -1,9 +1,37 @@
-from typing import Generator, Any, Union, Optional
+from typing import AsyncIterator, Generator, Any, Union, Optional
 from collections import deque
-from probo.utility import StreamManager,ProboSourceString,markup_escape
+from probo.utility import (
+    StreamManager,
+    ProboSourceString,
+    markup_escape,
+    astream_chunks,
+    defer_async,
+    is_async_content,
+)
+from probo.streaming.sinks import RenderSink
+from probo.components.compiler import CompiledTemplate, compile_tree
+from probo.components.compact import CompactNodeMixin, intern_attributes
 import inspect
+from functools import partial
 
-class LightNode:
+def _write_light(sink: RenderSink, item: "LightNode", EL) -> None:
+    sink.write(item.render(EL))
+
+
+def _write_generator(sink: RenderSink, item) -> None:
+    sink.write("".join((x if isinstance(x, ProboSourceString) else markup_escape(x)) if not hasattr(x, "render") else x.render() for x in item))
+
+
+def _write_rendered(sink: RenderSink, item) -> None:
+    rendered_item = item.render()
+    sink.write(rendered_item if isinstance(rendered_item, ProboSourceString) else markup_escape(rendered_item))
+
+
+def _write_value(sink: RenderSink, item) -> None:
+    sink.write(item if isinstance(item, ProboSourceString) else markup_escape(item))
+
+
+class LightNode(CompactNodeMixin):
     """
     Light SSDOM Node v1.3.4.
 
@@ -17,23 +45,18 @@ class LightNode:
 
     __slots__ = (
         "tag_name",
-        "content",
-        "attributes",
+        "_content",
+        "_attributes",
         "node_children",
         "_ElementNodeMixin__void_node",
         "parent",
-        "light_tag"
+        "light_tag",
+        "_node_index",
     )
 
     def __init__(self, *content: Any, tag: str|None = None, **attributes: Any):
-        self.content = (
-            deque(
-                content,
-            )
-            if isinstance(content, tuple)
-            else deque((content,))
-        )
-        self.attributes = attributes
+        self._content = content if isinstance(content, tuple) else (content,)
+        self._attributes = intern_attributes(attributes)
         # Logic to use class name as tag if not provided
         self.tag_name = (
             tag
@@ -55,7 +78,7 @@ class LightNode:
         content = self._get_rendered_content(EL)
         method = getattr(EL, self.tag_name, None)
         if method:
-            method(content,**self.attributes)
+            method(content,**self._attributes)
 
         res = EL.element
         return res
@@ -63,7 +86,7 @@ class LightNode:
     def _get_rendered_content(self, EL) -> str|list[str]|deque[str]:
         """Recursively renders children to strings."""
         collector = []
-        for item in self.content:
+        for item in self._content:
 
             if isinstance(item, LightNode):
                 if EL.is_list or EL.is_list and EL.use_deque:
@@ -92,6 +115,58 @@ class LightNode:
             return collector  # Return list of strings for the caller to join
         return ProboSourceString("".join(collector))
 
+    def _write_node(self, sink: RenderSink, EL) -> bool:
+        """
+        Writes this node and its subtree into `sink` in one pass. Returns
+        False, having written nothing, if EL cannot frame the tag.
+        """
+        frame = EL.tag_frame(self.tag_name, self._attributes)
+        if frame is None:
+            return False
+        if isinstance(frame, str):
+            sink.write(frame)
+            return True
+        sink.write(frame.opening)
+        if frame.void:
+            return True
+        separator = "\n" if EL.is_natural else ""
+        if separator:
+            sink.write(separator)
+        for item in self._content:
+            if isinstance(item, LightNode):
+                if not item._write_node(sink, EL):
+                    sink.write_dynamic(partial(_write_light, item=item, EL=EL))
+            elif inspect.isgenerator(item):
+                sink.write_dynamic(partial(_write_generator, item=item))
+            elif hasattr(item, "render"):
+                if hasattr(item, "_write_node") and item._write_node(sink, item.EL):
+                    continue
+                sink.write_dynamic(partial(_write_rendered, item=item))
+            elif callable(item) or is_async_content(item):
+                sink.write_dynamic(partial(_write_value, item=item))
+            else:
+                _write_value(sink, item)
+        if separator:
+            sink.write(separator)
+        sink.write(frame.closing)
+        return True
+
+    def render_into(self, EL, sink: RenderSink) -> RenderSink:
+        """
+        Writes the string rendering of this node into `sink` in one pass,
+        driving the shared EL for tag templates only. Equals `render(EL)`.
+        """
+        if not self._write_node(sink, EL):
+            sink.write(self.render(EL))
+        return sink
+
+    def compile(self, EL=None) -> CompiledTemplate:
+        """
+        Freezes the static parts of this tree into precomputed markup; only
+        generators, callables and heavy components stay as per-render slots.
+        """
+        return compile_tree(self, EL)
+
     def stream(self, EL, batch_size: int = 50) -> Generator[str, None, None]:
         """
         Drives the shared EL engine for streaming without building metadata.
@@ -101,7 +176,7 @@ class LightNode:
 
         # 2. Configure the shared EL
         method = getattr(EL, self.tag_name, None)
-        EL.set_attrs(**self.attributes)
+        EL.set_attrs(**self._attributes)
 
         if not method:
             elment_info = [f"<{self.tag_name}>", "", f"</{self.tag_name}>"]
@@ -119,6 +194,13 @@ class LightNode:
         )
         yield from stream_manager
 
+    def astream(self, EL, batch: int = 50) -> AsyncIterator[str]:
+        """
+        Async counterpart of `stream()`: awaitables and async iterables in the
+        content are resolved in place; sync content streams unchanged.
+        """
+        return astream_chunks(self.stream(EL, batch), batch=batch)
+
     def _get_stream_content(self, EL, batch_size):
         """Pulls streams from children into the pipeline."""
 
@@ -138,8 +220,10 @@ class LightNode:
                     yield from res
                 else:
                     yield res
+            elif is_async_content(item):
+                yield defer_async(item, EL=EL)
             else:
                 yield str(item)
 
-        for item in self.content:
+        for item in self._content:
             yield from _process_item(item)
@@ -1,7 +1,306 @@
 # probo/core/tree.py
+import inspect
+import math
 import uuid
+from fractions import Fraction
 from typing import Generator, List, Optional, Callable, Any, Self
 from probo.utility import ProboSourceString, StreamManager
+from probo.components.compact import EMPTY_MAPPING, AttributeSet, attributes_view, content_view
+
+def _is_node(item: Any) -> bool:
+    return hasattr(item, "node_children")
+
+
+def iter_subtree(
+    root: Any, is_node: Callable[[Any], bool] = _is_node
+) -> Generator[Any, None, None]:
+    """Yields `root` and its descendant nodes in document (pre-)order.
+
+    The traversal keeps its own stack instead of recursing, so tree depth is
+    bounded by memory rather than by Python's recursion limit, and no frame
+    is set up per node. `walk`, `find`, `find_all`,
+    `delegate_render_conditions`, `NodeIndex` and the selector engine all
+    run on it.
+
+    Args:
+        root: The node to start from; it is always yielded.
+        is_node: Decides which entries of `node_children` are descended into.
+            Defaults to anything that has `node_children` itself.
+    """
+    stack = [root]
+    pop, extend = stack.pop, stack.extend
+    default = is_node is _is_node
+    while stack:
+        node = pop()
+        yield node
+        children = getattr(node, "node_children", None)
+        if children:
+            if default:
+                extend([child for child in reversed(children) if hasattr(child, "node_children")])
+            else:
+                extend([child for child in reversed(children) if is_node(child)])
+
+
+class NodeIndex:
+    """Id, class and tag lookup tables for one subtree.
+
+    Built by `ElementNodeMixin.build_index()` and kept on the node that owns
+    it. `add` and `remove` anywhere below the owner update the tables for the
+    whole attached or detached subtree, and `mark_dirty()` (called by
+    `attr_manager`, `style_manager`, `inner_html` and `modify`) queues a node
+    to be re-read before the next lookup. After editing `attributes`
+    directly, call `mark_dirty()`.
+
+    Lookups answer in document order. Every indexed node has a position
+    key: consecutive integers for the tree the index was built from, and
+    fractions between the neighbouring keys for subtrees attached later, so
+    placing an attached subtree costs a walk up its ancestors rather than
+    over the tree. A bucket that receives a node out of order is re-sorted
+    on its next lookup; the rest of the tables are left alone.
+
+    Attributes:
+        ids (dict): id -> {node key: node}.
+        classes (dict): class name -> {node key: node}.
+        tags (dict): lowercase tag name -> {node key: node}.
+
+    Example:
+        >>> index = page.build_index()
+        >>> page.find_by_id("cart-count")  # dict lookup instead of a tree walk
+        >>> badge.attr_manager.set_id("cart-total")
+        >>> page.find_by_id("cart-total") is badge
+        True
+    """
+
+    __slots__ = ("ids", "classes", "tags", "_entries", "_positions", "_unsorted", "_end", "_stale", "_root")
+
+    def __init__(self, root: Any = None):
+        self.ids: dict[str, dict[int, Any]] = {}
+        self.classes: dict[str, dict[int, Any]] = {}
+        self.tags: dict[str, dict[int, Any]] = {}
+        self._entries: dict[int, tuple] = {}
+        self._positions: dict[int, Any] = {}
+        self._unsorted: set[tuple[str, str]] = set()
+        self._end = 0
+        self._stale: dict[int, Any] = {}
+        self._root = root
+        if root is not None:
+            self.add_subtree(root)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, node: Any) -> bool:
+        return id(node) in self._entries
+
+    @staticmethod
+    def node_keys(node: Any) -> tuple[Optional[str], tuple[str, ...], str]:
+        """Returns the (id, classes, tag) a node is indexed under."""
+        attributes = attributes_view(node)
+        if not isinstance(attributes, dict):
+            attributes = getattr(node, "attrs", None)
+        tag = (
+            getattr(node, "element_tag", None)
+            or getattr(node, "tag_name", None)
+            or getattr(node, "tag", "")
+        )
+        return NodeIndex._attribute_keys(attributes) + (str(tag).lower(),)
+
+    @staticmethod
+    def _attribute_keys(attributes: Any) -> tuple[Optional[str], tuple[str, ...]]:
+        node_id, classes = None, ()
+        if isinstance(attributes, dict) and attributes:
+            value = attributes.get("Id", attributes.get("id"))
+            if value is not None:
+                node_id = str(value)
+            value = attributes.get("Class") or attributes.get("class")
+            if value:
+                names = value.split() if isinstance(value, str) else map(str, value)
+                classes = tuple(dict.fromkeys(names))
+        return node_id, classes
+
+    def add_subtree(self, node: Any) -> None:
+        """Indexes `node` and every node below it, in document order."""
+        if not _is_node(node):
+            return
+        nodes = list(iter_subtree(node))
+        before, after = self._neighbour_positions(node)
+        if after is None:
+            start = math.floor(before) + 1
+            positions = range(start, start + len(nodes))
+            self._end = max(self._end, start + len(nodes))
+        else:
+            step = (Fraction(after) - Fraction(before)) / (len(nodes) + 1)
+            positions = [before + step * (i + 1) for i in range(len(nodes))]
+        self._index_nodes(nodes, positions)
+
+    def _neighbour_positions(self, node: Any) -> tuple[Any, Any]:
+        """The positions of the indexed nodes just before and just after
+        `node`'s subtree in document order; `after` is None at the end."""
+        positions = self._positions
+        parent = getattr(node, "parent", None)
+        if node is self._root or parent is None or id(parent) not in positions:
+            return self._end - 1, None
+        siblings = parent.node_children
+        at = siblings.index(node)
+        before = positions[id(parent)]
+        for sibling in reversed(siblings[:at]):
+            if id(sibling) in positions:
+                before = positions[id(self._last_descendant(sibling))]
+                break
+        current = node
+        while True:
+            for sibling in siblings[at + 1 :]:
+                position = positions.get(id(sibling))
+                if position is not None:
+                    return before, position
+            if current is self._root or parent is self._root:
+                return before, None
+            current, parent = parent, getattr(parent, "parent", None)
+            if parent is None or id(parent) not in positions:
+                return before, None
+            siblings = parent.node_children
+            at = siblings.index(current)
+
+    def _last_descendant(self, node: Any) -> Any:
+        while True:
+            children = getattr(node, "node_children", None)
+            last = next((child for child in reversed(children) if id(child) in self._positions), None) if children else None
+            if last is None:
+                return node
+            node = last
+
+    def _index_nodes(self, nodes: Any, positions: Any) -> None:
+        # The bulk path behind build_index and add. Most nodes share an
+        # interned AttributeSet and a tag, so their keys are worked out once
+        # per distinct pair and the keys tuple itself is shared. While the
+        # index is empty (build_index) positions only grow, so buckets are
+        # in order by construction and the order check is skipped.
+        entries, order = self._entries, self._positions
+        ids, classes, tags = self.ids, self.classes, self.tags
+        discard = self._discard if entries else None
+        unsorted = self._unsorted
+        shared_keys: dict[tuple, tuple] = {}
+        for node, position in zip(nodes, positions):
+            key = id(node)
+            attributes = getattr(node, "_attributes", None)
+            tag = getattr(node, "element_tag", None)
+            if type(attributes) is AttributeSet and type(tag) is str:
+                # The set is immutable and kept alive by the node.
+                pair = (id(attributes), tag)
+                keys = shared_keys.get(pair)
+                if keys is None:
+                    keys = shared_keys[pair] = self._attribute_keys(attributes) + (tag.lower(),)
+            else:
+                keys = self.node_keys(node)
+            if discard is not None and key in entries:
+                discard(node)
+            entries[key] = keys
+            order[key] = position
+            node_id, names, tag = keys
+            if node_id is not None:
+                bucket = ids.get(node_id)
+                if bucket is None:
+                    ids[node_id] = {key: node}
+                else:
+                    if discard is not None and order[next(reversed(bucket))] > position:
+                        unsorted.add(("ids", node_id))
+                    bucket[key] = node
+            for name in names:
+                bucket = classes.get(name)
+                if bucket is None:
+                    classes[name] = {key: node}
+                else:
+                    if discard is not None and order[next(reversed(bucket))] > position:
+                        unsorted.add(("classes", name))
+                    bucket[key] = node
+            bucket = tags.get(tag)
+            if bucket is None:
+                tags[tag] = {key: node}
+            else:
+                if discard is not None and order[next(reversed(bucket))] > position:
+                    unsorted.add(("tags", tag))
+                bucket[key] = node
+
+    def discard_subtree(self, node: Any) -> None:
+        """Drops `node` and every node below it from the tables."""
+        if _is_node(node):
+            for current in iter_subtree(node):
+                self._discard(current)
+
+    def touch(self, node: Any) -> None:
+        """Queues an indexed node to be re-read before the next lookup."""
+        if id(node) in self._entries:
+            self._stale[id(node)] = node
+
+    def refresh(self) -> None:
+        """Re-reads the keys of every node queued by `touch()`."""
+        stale, self._stale = self._stale, {}
+        for key, node in stale.items():
+            if key in self._entries and self._entries[key] != self.node_keys(node):
+                position = self._positions[key]
+                self._discard(node)
+                self._index_nodes((node,), (position,))
+
+    def by_id(self, node_id: str) -> Optional[Any]:
+        bucket = self._bucket("ids", node_id)
+        return next(iter(bucket.values())) if bucket else None
+
+    def by_class(self, name: str) -> List[Any]:
+        bucket = self._bucket("classes", name)
+        return list(bucket.values()) if bucket else []
+
+    def by_tag(self, tag: str) -> List[Any]:
+        bucket = self._bucket("tags", tag.lower())
+        return list(bucket.values()) if bucket else []
+
+    def first_by_class(self, name: str) -> Optional[Any]:
+        bucket = self._bucket("classes", name)
+        return next(iter(bucket.values())) if bucket else None
+
+    def first_by_tag(self, tag: str) -> Optional[Any]:
+        bucket = self._bucket("tags", tag.lower())
+        return next(iter(bucket.values())) if bucket else None
+
+    def bucket(self, kind: str, key: str) -> dict[int, Any]:
+        """Returns the live {node key: node} bucket for an "id", "class" or
+        "tag" key, or an empty dict."""
+        table = {"id": "ids", "class": "classes", "tag": "tags"}[kind]
+        return self._bucket(table, key) or {}
+
+    def _bucket(self, table: str, key: str) -> Optional[dict]:
+        if self._stale:
+            self.refresh()
+        tables = getattr(self, table)
+        bucket = tables.get(key)
+        if self._unsorted and (table, key) in self._unsorted:
+            self._unsorted.discard((table, key))
+            if bucket:
+                position = self._positions.__getitem__
+                bucket = tables[key] = {k: bucket[k] for k in sorted(bucket, key=position)}
+        return bucket
+
+    def _discard(self, node: Any) -> None:
+        key = id(node)
+        keys = self._entries.pop(key, None)
+        self._stale.pop(key, None)
+        if keys is None:
+            return
+        del self._positions[key]
+        node_id, classes, tag = keys
+        if node_id is not None:
+            self._drop(self.ids, node_id, key)
+        for name in classes:
+            self._drop(self.classes, name, key)
+        self._drop(self.tags, tag, key)
+
+    @staticmethod
+    def _drop(table: dict, name: str, key: int) -> None:
+        bucket = table.get(name)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del table[name]
+
 
 class ElementNodeMixin:
     """Adds hierarchical tree capabilities and traversal methods to a class.
@@ -34,7 +333,9 @@ class ElementNodeMixin:
             **kwargs: Configuration options, including optional 'id' prefix.
         """
         cls._id = f"{(kwargs.get('id', None) or 'probo')}-{uuid.uuid4().hex[:8]}"
-        cls.tag=cls.__name__.upper()
+        if not hasattr(inspect.getattr_static(cls, "tag", None), "__set__"):
+            # Classes that keep the tag per instance (a `tag` slot) keep their descriptor.
+            cls.tag=cls.__name__.upper()
         is_light = cls.__name__ == cls.__name__.capitalize() and cls.__name__[0]=="L"
         if is_light:
             cls.light_tag = f"L-{cls.__name__.lower()[1:]}"
@@ -44,8 +345,8 @@ class ElementNodeMixin:
                 self.__void_node = True
                 return None
             for item in content:
-                if isinstance(item, ElementNodeMixin):
-                    self.add(item)
+                if isinstance(item, ElementNodeMixin) and item is not self:
+                    self._attach(item)
         cls._set_node_children = __normalize_node_children
 
     @property
@@ -69,7 +370,20 @@ class ElementNodeMixin:
             return self
         if child is None or child is self:
             return self
+        if hasattr(self, "_content"):
+            if child not in self._content:
+                self.content.append(child)
+        elif hasattr(self, "content") and child not in self.content:
+            self.content.append(child)
+        return self._attach(child, index)
+
+    def _attach(self, child: Any, index: Optional[int] = None) -> Self:
+        """Links a child that is already part of this node's content.
 
+        Constructors use it directly: their children are in `content` by
+        definition, and checking each one with `add` would make building a
+        node with n children O(n^2).
+        """
         if hasattr(child, 'parent'):
             child.parent = self
 
@@ -77,8 +391,12 @@ class ElementNodeMixin:
             self.node_children.append(child)
         else:
             self.node_children.insert(index, child)
-        if hasattr(self, "content") and child not in self.content:
-            self.content.append(child)
+        if getattr(self, "_memoize", False) and hasattr(child, "memoize"):
+            child.memoize()
+        for node_index in self._indexes_above():
+            node_index.add_subtree(child)
+        if hasattr(self, "mark_dirty"):
+            self.mark_dirty()
         return self
 
     def remove(self, child: Any) ->Self:
@@ -92,10 +410,14 @@ class ElementNodeMixin:
         """
         if child in self.node_children:
             self.node_children.remove(child)
+            for node_index in self._indexes_above():
+                node_index.discard_subtree(child)
             if hasattr(child, 'parent'):
                 child.parent = None
             if hasattr(self,'content'):
                 self.content.remove(child)
+            if hasattr(self, "mark_dirty"):
+                self.mark_dirty()
         return self
 
     def pop(self, child: Any) -> Any:
@@ -126,10 +448,13 @@ class ElementNodeMixin:
     def find(self, predicate: Callable[[Any], bool],stream_mode=False) -> Optional[Any]:
         """Searches the tree for the first node that matches a condition.
 
-        Uses a recursive Depth-First Search (DFS) algorithm.
+        Depth-first, in document order, on an explicit stack (see
+        `iter_subtree`), so arbitrarily deep trees can be searched.
 
         Args:
             predicate: A function that takes a node and returns True if matched.
+            stream_mode: Detaches a matched descendant from the shared
+                builder so it can be streamed on its own.
 
         Returns:
             The first matching node found, or None if no match exists.
@@ -138,16 +463,11 @@ class ElementNodeMixin:
             >>> # Find an element with a specific ID
             >>> target = root.find(lambda node: getattr(node, "_id", "").startswith("btn"))
         """
-        if predicate(self):
-            return self
-
-        for child in self.node_children:
-            if hasattr(child, 'find'):
-                result = child.find(predicate)
-                if result:
-                    if stream_mode:
-                        result.toggle_share_element(share=False)
-                    return result
+        for node in iter_subtree(self):
+            if predicate(node):
+                if stream_mode and node is not self:
+                    node.toggle_share_element(share=False)
+                return node
         return None
 
     def find_all(self, predicate: Callable[[Any], bool]) -> List[Any]:
@@ -159,19 +479,14 @@ class ElementNodeMixin:
         Returns:
             A list containing all matching nodes found in the subtree.
         """
-        results = []
-        if predicate(self):
-            results.append(self)
-
-        for child in self.node_children:
-            if hasattr(child, 'find_all'):
-                results.extend(child.find_all(predicate))
-        return results
+        return [node for node in iter_subtree(self) if predicate(node)]
 
     def select(self, selector: str) -> Optional[Any]:
         """Retrieves a node using CSS-style selectors.
 
-        Supports class (.name), ID (#name), and Tag (NAME) lookups.
+        Supports class (.name), ID (#name), and Tag (NAME) lookups. Uses the
+        node's index when `build_index()` was called, a tree walk otherwise.
+        Use `select_one` for full CSS selectors.
 
         Args:
             selector: The CSS selector string.
@@ -179,14 +494,96 @@ class ElementNodeMixin:
         Returns:
             The first matching node found.
         """
+        node_index = self.node_index
         if selector.startswith("."):
-            # Search by class in attrs
-            return self.find(lambda n: selector[1:] in n.attrs.get("class", []))
+            if node_index is not None:
+                return node_index.first_by_class(selector[1:])
+            return self.find(lambda n: selector[1:] in NodeIndex.node_keys(n)[1])
         if selector.startswith("#"):
-            # Search by ID
-            return self.find(lambda n: n.attrs.get("id") == selector[1:])
-        # Search by tag
-        return self.find(lambda n: n.tag == selector)
+            return self.find_by_id(selector[1:])
+        if node_index is not None:
+            return node_index.first_by_tag(selector)
+        tag = selector.lower()
+        return self.find(lambda n: NodeIndex.node_keys(n)[2] == tag)
+
+    def select_one(self, selector: str) -> Optional[Any]:
+        """Returns the first node of the subtree matching a CSS selector.
+
+        Handles descendant, child, sibling and attribute selectors and
+        `:nth-child` (see `probo.components.query.CompiledSelector`). The
+        selector is compiled once and cached.
+
+        Args:
+            selector: The CSS selector string, e.g. "ul.menu > li:first-child a".
+
+        Returns:
+            The first matching node in document order, or None.
+        """
+        from probo.components.query import compile_selector
+
+        return compile_selector(selector).select_one(self)
+
+    def select_all(self, selector: str) -> List[Any]:
+        """Returns every node of the subtree matching a CSS selector, in
+        document order. See `select_one`."""
+        from probo.components.query import compile_selector
+
+        return compile_selector(selector).select_all(self)
+
+    @property
+    def node_index(self) -> Optional[NodeIndex]:
+        """The index built by `build_index()`, or None."""
+        return getattr(self, "_node_index", None)
+
+    def build_index(self) -> NodeIndex:
+        """Indexes this subtree by id, class and tag.
+
+        `find_by_id`, `find_all_by_class`, `find_all_by_tag` and `select`
+        on this node then answer from dictionaries instead of walking the
+        tree. The index follows `add`, `remove` and attribute changes made
+        through the element's managers (see `NodeIndex`).
+
+        Returns:
+            The new NodeIndex.
+        """
+        self._node_index = NodeIndex(self)
+        return self._node_index
+
+    def drop_index(self) -> Self:
+        """Discards the index built by `build_index()`."""
+        self._node_index = None
+        return self
+
+    def find_by_id(self, node_id: str) -> Optional[Any]:
+        """Returns the first node in the subtree whose id is `node_id`."""
+        node_index = self.node_index
+        if node_index is not None:
+            return node_index.by_id(node_id)
+        return self.find(lambda n: NodeIndex.node_keys(n)[0] == node_id)
+
+    def find_all_by_class(self, name: str) -> List[Any]:
+        """Returns every node in the subtree carrying the class `name`."""
+        node_index = self.node_index
+        if node_index is not None:
+            return node_index.by_class(name)
+        return self.find_all(lambda n: name in NodeIndex.node_keys(n)[1])
+
+    def find_all_by_tag(self, tag: str) -> List[Any]:
+        """Returns every node in the subtree with the tag name `tag`."""
+        node_index = self.node_index
+        if node_index is not None:
+            return node_index.by_tag(tag)
+        tag = tag.lower()
+        return self.find_all(lambda n: NodeIndex.node_keys(n)[2] == tag)
+
+    def _indexes_above(self) -> Generator[NodeIndex, None, None]:
+        """Yields the index of this node and of every ancestor that has one."""
+        node = self
+        while node is not None:
+            node_index = getattr(node, "_node_index", None)
+            if node_index is not None:
+                yield node_index
+            node = getattr(node, "parent", None)
 
     def deep_remove(self,child:Any)-> Optional[Self]:
         """Locates the parent of a specific node and removes the child from it.
@@ -233,12 +630,14 @@ class ElementNodeMixin:
         index order, just the content (e.g., swapping a placeholder for 
         real recipe data).
         """
-        target = self.find(lambda n: old_child in n.content)
+        target = self.find(lambda n: old_child in content_view(n))
         if target:
-            content_list = list(target.content)
+            content_list = list(content_view(target))
             idx = content_list.index(old_child)
             content_list[idx] = new_child
             target.content = tuple(content_list)
+            if hasattr(target, "mark_dirty"):
+                target.mark_dirty()
         return self
 
     def modify(
@@ -253,14 +652,16 @@ class ElementNodeMixin:
         if target:
             # 2. Modify Content if provided
             if content is not None:
-                if isinstance(target.content, list):
+                if isinstance(content_view(target), list):
                     target.inner_html(content)
                      
                 else:
                     target.content.append(content)
 
-            if hasattr(target, "attributes"):
+            if kwargs and hasattr(target, "attributes"):
                 target.attributes.update(kwargs)
+            if hasattr(target, "mark_dirty"):
+                target.mark_dirty()
         return self
 
     def stream_node(
@@ -289,62 +690,111 @@ class ElementNodeMixin:
         Yields:
             Node | str: The current node, followed by all its descendants.
         """
-        # 1. Yield the current node first (pre-order traversal)
+        if not include_text:
+            yield from iter_subtree(self)
+            return
+        # Pre-order over `content`, one iterator per open node.
         yield self
-        
-        # 2. Safely iterate through children
-        for child in self.node_children if not include_text else self.content:
-            if hasattr(child, "walk") and callable(child.walk):
-                # Recursively walk child nodes
-                yield from child.walk(include_text=include_text)
-            elif include_text:
-                # Yield raw strings/data if requested
-                yield child
+        stack = [iter(content_view(self))]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, ElementNodeMixin):
+                    yield child
+                    stack.append(iter(content_view(child)))
+                    break
+                if hasattr(child, "walk") and callable(child.walk):
+                    yield from child.walk(include_text=True)
+                else:
+                    yield child
+            else:
+                stack.pop()
 
 class ElementMutatorMixin:
     """
     Mixin to share a single Element builder across an SSDOM branch to save memory,
     while allowing detached nodes to independently manage their own state.
+
+    The state lives in slots declared by the element base class
+    (`BaseHTMLElement`), so mixing this in does not add a `__dict__` of its
+    own.
     """
 
+    __slots__ = ()
+
     def __init__(self, use_list: bool = False, use_deque: bool = False, **data):
         self._el_instance = None
         self.use_list = use_list
         self.use_deque = use_deque
-        self.element_data = data
+        self.element_data = data or EMPTY_MAPPING
+        self._el_owner = None  # The node whose builder we share; None: our own
 
         self._share_element = True  # Flag to control whether to share the Element instance with children
     @property
     def EL(self):
         """
         LAZY PROPAGATION:
-        1. If I already have an Element, return it.
+        1. If I already have an Element that is still current, return it.
         2. If I have a parent, climb up and grab the parent's Element!
         3. If I have no parent, I am the Root. I will spawn the Element.
-        """
-        if self._el_instance is not None  and self._share_element:
-            return self._el_instance
 
-        # 🚀 Climb the tree! If we have a parent, steal their EL builder.
-        if hasattr(self, "parent") and self.parent is not None and self._share_element:
-            if hasattr(self.parent, 'EL'):
-                # This recursively climbs all the way to the Root node!
-                self._el_instance = self.parent.EL 
+        A shared builder stays current while the node that spawned it (its
+        owner) still holds it, which is one identity check. When an owner
+        drops its builder (`use_render_conditions`), every node below it
+        re-derives the new builder and flags on its next access, without a
+        pass over the subtree. The climb is a loop, so the first access at
+        the bottom of a deep chain does not recurse.
+        """
+        builder = self._current_builder()
+        if builder is not None:
+            return builder
+
+        chain = []
+        node = self
+        while True:
+            parent = getattr(node, "parent", None) if node._share_element else None
+            if parent is None or not hasattr(type(parent), "EL"):
+                # We have no parent. We must be the Root Node! Spawn the singleton.
+                node._spawn_element()
+                builder, owner = node._el_instance, node
+                break
+            chain.append(node)
+            if type(parent).EL is not ElementMutatorMixin.EL:
+                builder, owner = parent.EL, None
+                break
+            builder = parent._current_builder()
+            if builder is not None:
+                owner = getattr(parent, "_el_owner", None) or parent
+                break
+            node = parent
+
+        # 🚀 Hand the builder down, inheriting the high-performance flags.
+        for node in reversed(chain):
+            node._el_instance = builder
+            node._el_owner = owner
+            node.use_list = getattr(node.parent, 'use_list', node.use_list)
+            node.use_deque = getattr(node.parent, 'use_deque', node.use_deque)
+        return self._el_instance
 
-                # Inherit the high-performance flags from the root
-                self.use_list = getattr(self.parent, 'use_list', self.use_list)
-                self.use_deque = getattr(self.parent, 'use_deque', self.use_deque)
+    def _current_builder(self):
+        """The cached builder if its owner still holds it, else None."""
+        builder = self._el_instance
+        if builder is None or not self._share_element:
+            return None
+        owner = getattr(self, "_el_owner", None)
+        if owner is None or owner is self or owner._el_instance is builder:
+            return builder
+        return None
 
-                return self._el_instance
-        # We have no parent. We must be the Root Node! Spawn the singleton.
+    def _spawn_element(self) -> None:
         from probo.components.elements import Element
         self._el_instance = Element(
             is_list=self.use_list, 
         )
         if self.use_deque:
             self._el_instance.use_deque()
-        self.toggle_share_element(share=True)  
-        return self._el_instance
+        self._el_owner = None
+        self.toggle_share_element(share=True)
+
     def toggle_share_element(self, share=True):
         """Utility to enable or disable sharing the Element instance with children.
 
@@ -358,23 +808,33 @@ class ElementMutatorMixin:
     def delegate_render_conditions(self, use_list: bool = False, use_deque: bool = False):
         """
         Broadcasting method: Sets the engine flags for this node and 
-        recursively pushes them down to every child in the tree.
+        pushes them down to every child in the tree (iteratively, see
+        `iter_subtree`). Prefer `use_render_conditions`, which lets the
+        children pick the flags up lazily.
         """
-        # 1. Update this node's flags
-        # self.toggle_share_element(share=True)
-        if hasattr(self, 'use_list'):
-            self.use_list = use_list
-        if hasattr(self, 'use_deque'):
-            self.use_deque = use_deque
-
-        if hasattr(self, '_el_instance'):
-            self._el_instance = None 
-        for child in getattr(self, 'node_children', []):
-            if hasattr(child, 'delegate_render_conditions'):
-                child.delegate_render_conditions(use_list=use_list, use_deque=use_deque)
+        for node in iter_subtree(self, is_node=lambda n: hasattr(n, 'delegate_render_conditions')):
+            if hasattr(node, 'use_list'):
+                node.use_list = use_list
+            if hasattr(node, 'use_deque'):
+                node.use_deque = use_deque
+            if hasattr(node, '_el_instance'):
+                node._el_instance = None
 
         return self # Allow chaining: el.delegate(...).render()
 
+    def use_render_conditions(self, use_list: bool = False, use_deque: bool = False):
+        """
+        Sets the engine flags for this node and drops its builder, leaving
+        the subtree untouched: descendants sharing that builder re-derive it,
+        and these flags, from their parent the next time they read `EL`.
+        `stream()` calls this, so starting a stream is O(1) instead of a
+        pass over the whole subtree.
+        """
+        self.use_list = use_list
+        self.use_deque = use_deque
+        self._el_instance = None
+        return self
+
     def el_is_attached(self) -> bool:
         """Utility to check if the node is currently bound to a parent Element."""
         return self._el_instance is not None
@@ -383,8 +843,12 @@ class ElementMutatorMixin:
         """
         Rule 3: Injects the parent's Element builder into this child.
         This prevents the child from creating a new object in memory.
+        A different builder invalidates any memoised render of the node.
         """
+        if self._el_instance is not parent_element and hasattr(self, "mark_dirty"):
+            self.mark_dirty()
         self._el_instance = parent_element
+        self._el_owner = None
 
         # Inherit the parent's high-performance flags automatically
         self.use_list = parent_element.is_list
@@ -410,6 +874,7 @@ class ComponentNode(ElementNodeMixin,):
         "parent",
         "node_children",
         "_ElementNodeMixin__void_node",
+        "_node_index",
     )
 
     def __init__(self):
@@ -513,19 +978,19 @@ class ProxyElement(BaseHTMLElement, ElementNodeMixin, ElementMutatorMixin):
         from probo.components.elements import Element
 
         if self._logic_obj and self.render_callable and obj_as_arg:
-            return ProboSourceString(self.render_callable(self._logic_obj)) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self.render_callable(self._logic_obj)),**self.attributes).element  
+            return ProboSourceString(self.render_callable(self._logic_obj)) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self.render_callable(self._logic_obj)),**self._attributes).element  
         if not self._logic_obj and self.render_callable:
-            return ProboSourceString(self.render_callable()) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self.render_callable()),**self.attributes).element  
+            return ProboSourceString(self.render_callable()) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self.render_callable()),**self._attributes).element  
         if self._logic_obj and hasattr(self._logic_obj,'render'):
-            return ProboSourceString(self._logic_obj.render()) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self._logic_obj.render()),**self.attributes).element  
+            return ProboSourceString(self._logic_obj.render()) if not self.wrap_result else Element(tag=self._proxy_tag,content= ProboSourceString(self._logic_obj.render()),**self._attributes).element  
         if self._proxy_tag and self.wrap_result:
             content = "".join(self._get_rendered_content())
-            return Element(tag=self._proxy_tag,content=ProboSourceString(content),**self.attributes).element
+            return Element(tag=self._proxy_tag,content=ProboSourceString(content),**self._attributes).element
         return ProboSourceString()
 
     def stream(self,obj_as_arg=True,batch=50):
         from probo.components.elements import Element
-        EL = Element(is_list=True,tag=self._proxy_tag,**self.attributes)
+        EL = Element(is_list=True,tag=self._proxy_tag,**self._attributes)
 
         if self.wrap_result:
             yield EL.element[0]
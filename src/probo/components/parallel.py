@@ -0,0 +1,246 @@
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional
+
+from probo.components.base import BaseHTMLElement, _write_rendered
+from probo.components.elements import Element
+from probo.components.light_tags.node import LightNode, _write_light
+from probo.components.light_tags.node import _write_rendered as _write_light_rendered
+from probo.components.node import iter_subtree
+from probo.streaming.sinks import ListSink, RenderSink
+from probo.utility import ProboSourceString
+
+DEFAULT_THRESHOLD = 20_000
+DEFAULT_MIN_CHUNK = 2_000
+# Runs per worker: more than one evens out rows of different sizes.
+_RUNS_PER_WORKER = 4
+
+# Runs of the renders in progress, by render token. Workers are forked after
+# a render publishes its runs, so they find them here without any pickling.
+_RUNS: dict[str, list[tuple[Any, bool, list]]] = {}
+
+
+def _render_run(token: str, index: int) -> str:
+    """Worker entry point: renders one run of sibling nodes."""
+    EL, heavy_parent, items = _RUNS[token][index]
+    sink = ListSink()
+    for item in items:
+        _write_item(sink, item, EL, heavy_parent)
+    return str(sink.getvalue())
+
+
+def _write_item(sink: RenderSink, item: Any, EL: Any, heavy_parent: bool) -> None:
+    # Writes a child node the way its parent's `_write_content` (heavy) or
+    # `_write_node` (light) would.
+    if heavy_parent:
+        if hasattr(item, "light_tag"):
+            if item._write_node(sink, EL):
+                return
+        else:
+            item.bind_element(EL)
+            if item._write_node(sink, item.EL):
+                return
+        _write_rendered(sink, item, EL)
+    elif isinstance(item, LightNode):
+        if not item._write_node(sink, EL):
+            _write_light(sink, item, EL)
+    elif not item._write_node(sink, item.EL):
+        _write_light_rendered(sink, item)
+
+
+def _is_node(item: Any) -> bool:
+    return isinstance(item, (BaseHTMLElement, LightNode))
+
+
+def _subtree_size(node: Any) -> int:
+    return sum(1 for _ in iter_subtree(node))
+
+
+def _stitchable(node: Any) -> bool:
+    """True if `node` writes its content through the standard sink path, so
+    runs of its children can be swapped for rendered placeholders."""
+    if getattr(node, "_memoize", False):
+        # A memoised element replays its cache; the placeholders would be baked into it.
+        return False
+    cls = type(node)
+    if isinstance(node, LightNode):
+        return cls._write_node is LightNode._write_node
+    return (
+        isinstance(node, BaseHTMLElement)
+        and cls._write_node is BaseHTMLElement._write_node
+        and cls._write_frame is BaseHTMLElement._write_frame
+        and cls._write_content is BaseHTMLElement._write_content
+        and not node._render_conditions
+    )
+
+
+def _child_builder(item: Any, EL: Any, heavy_parent: bool) -> Any:
+    """The builder a stitched parent's content writer hands to `item`."""
+    if isinstance(item, LightNode):
+        return EL
+    if heavy_parent:
+        item.bind_element(EL)
+    return item.EL
+
+
+class _RenderedRun:
+    """Stands in for a run of sibling nodes while a worker renders them."""
+
+    __slots__ = ("future",)
+
+    # Light parents write non-light children with `item.EL`.
+    EL = None
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+
+    def render(self, EL: Any = None) -> ProboSourceString:
+        return ProboSourceString(self.future.result())
+
+    def _write_node(self, sink: RenderSink, EL: Any) -> bool:
+        sink.write(self.future.result())
+        return True
+
+
+def _render_serial(root: Any, EL: Any) -> ProboSourceString:
+    if isinstance(root, LightNode):
+        return root.render_into(EL, ListSink()).getvalue()
+    return root.render_into(ListSink()).getvalue()
+
+
+def _plan(root: Any, EL: Any, target: int, min_chunk: int) -> tuple[list, list, list]:
+    """Splits the tree into runs of sibling nodes of about `target` nodes.
+
+    Elements too large for one run and able to be stitched are descended
+    into; runs smaller than `min_chunk` stay in place and render in the
+    parent process.
+
+    Returns:
+        The runs, as (builder, heavy parent, nodes) tuples; a placeholder per
+        run; and the stitched elements, as (element, content with the
+        placeholders in place of the runs) pairs.
+    """
+    runs, placeholders, stitched = [], [], []
+    stack = [(root, EL)]
+    while stack:
+        node, node_EL = stack.pop()
+        heavy = not isinstance(node, LightNode)
+        content, run, run_size, split = [], [], 0, False
+
+        for item in (*node._content, None):
+            size = _subtree_size(item) if _is_node(item) else 0
+            descend = size > target and _stitchable(item)
+            if run and (not size or descend or run_size >= target):
+                if run_size >= min_chunk:
+                    placeholders.append(_RenderedRun())
+                    content.append(placeholders[-1])
+                    runs.append((node_EL, heavy, run))
+                    split = True
+                else:
+                    content.extend(run)
+                run, run_size = [], 0
+            if descend:
+                stack.append((item, _child_builder(item, node_EL, heavy)))
+                content.append(item)
+            elif size:
+                run.append(item)
+                run_size += size
+            elif item is not None:
+                content.append(item)
+
+        if split:
+            stitched.append((node, tuple(content)))
+    return runs, placeholders, stitched
+
+
+def render_parallel(
+    root: Any,
+    EL: Optional[Element] = None,
+    workers: Optional[int] = None,
+    threshold: int = DEFAULT_THRESHOLD,
+    min_chunk: int = DEFAULT_MIN_CHUNK,
+) -> ProboSourceString:
+    """Renders a heavy or light tree with its large sibling runs spread over
+    several processes.
+
+    The tree is split into runs of consecutive sibling nodes (table body
+    rows, sections...) of roughly equal size, a process pool is forked, and
+    each worker renders its runs from the copy of the tree it inherited, so
+    only the rendered strings cross process boundaries. The elements above
+    the runs are rendered in this process, with each run written back in
+    its place, so the result equals the string render of the tree.
+
+    Trees under `threshold` nodes, single-worker setups and platforms
+    without `fork` render serially and start no processes. Memoised
+    elements and elements with render conditions are not split.
+
+    Args:
+        root: A BaseHTMLElement or LightNode.
+        EL (Element, optional): The builder driving light trees; a fresh
+            string-mode Element is used when omitted. Heavy trees use their
+            own.
+        workers: Worker processes; defaults to `os.cpu_count()`.
+        threshold: Smallest tree, in nodes, worth rendering in parallel.
+        min_chunk: Smallest run, in nodes, worth sending to a worker.
+
+    Returns:
+        The rendered markup.
+
+    Raises:
+        ValueError: If the builder is in list mode.
+
+    Example:
+        >>> html = render_parallel(TABLE(TBODY(*rows)), workers=8)
+    """
+    if isinstance(root, LightNode):
+        EL = EL if EL is not None else Element()
+    else:
+        EL = root.EL
+    if EL.is_list:
+        raise ValueError("Parallel rendering writes strings; use a string-mode Element.")
+
+    workers = workers or os.cpu_count() or 1
+    if (
+        workers < 2
+        or "fork" not in multiprocessing.get_all_start_methods()
+        or not _stitchable(root)
+    ):
+        return _render_serial(root, EL)
+    total = _subtree_size(root)
+    if total < threshold:
+        return _render_serial(root, EL)
+
+    target = max(min_chunk, total // (workers * _RUNS_PER_WORKER))
+    runs, placeholders, stitched = _plan(root, EL, target, min_chunk)
+    if len(runs) < 2:
+        return _render_serial(root, EL)
+
+    token = uuid.uuid4().hex
+    _RUNS[token] = runs
+    originals = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(runs)),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as pool:
+            try:
+                for index, placeholder in enumerate(placeholders):
+                    placeholder.future = pool.submit(_render_run, token, index)
+            finally:
+                # Every worker has been forked by now; the tree may change again.
+                del _RUNS[token]
+            try:
+                for node, content in stitched:
+                    originals.append((node, node._content))
+                    node._content = content
+                return _render_serial(root, EL)
+            finally:
+                for node, content in originals:
+                    node._content = content
+                for placeholder in placeholders:
+                    if placeholder.future is not None:
+                        placeholder.future.cancel()
+    finally:
+        _RUNS.pop(token, None)
@@ -0,0 +1,409 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+
+from probo.components.compact import attributes_view
+from probo.components.node import NodeIndex, iter_subtree
+
+_IDENT = re.compile(r"-?[_a-zA-Z0-9\u00a0-\uffff][-_a-zA-Z0-9\u00a0-\uffff]*")
+_ATTRIBUTE = re.compile(
+    r"\[\s*([^\s~|^$*=\]]+)\s*(?:([~|^$*]?=)\s*(\"[^\"]*\"|'[^']*'|[^\s\]]+)\s*(i)?\s*)?\]"
+)
+_NTH = re.compile(r"^([+-]?\d*)n(?:\s*([+-])\s*(\d+))?$")
+_COMBINATOR = re.compile(r"\s*([>+~])\s*|\s+")
+
+Check = Callable[[Any, "_Scope"], bool]
+
+
+class SelectorSyntaxError(ValueError):
+    """Raised when a selector string cannot be compiled."""
+
+
+class _Scope:
+    """Per-query state: the query root, and the keys and sibling positions
+    of the nodes seen so far."""
+
+    __slots__ = ("root", "positions", "_keys")
+
+    def __init__(self, root: Any):
+        self.root = root
+        self.positions: dict[int, tuple[int, int]] = {}
+        self._keys: dict[int, tuple] = {}
+
+    def keys(self, node: Any) -> tuple[Optional[str], tuple[str, ...], str]:
+        """The node's (id, classes, tag), read once per query."""
+        keys = self._keys.get(id(node))
+        if keys is None:
+            keys = self._keys[id(node)] = NodeIndex.node_keys(node)
+        return keys
+
+    def siblings(self, node: Any) -> List[Any]:
+        parent = getattr(node, "parent", None)
+        if node is self.root or parent is None:
+            return [node]
+        return [child for child in parent.node_children if hasattr(child, "node_children")]
+
+    def position(self, node: Any) -> tuple[int, int]:
+        """Returns the node's 1-based index among its element siblings and
+        the number of those siblings, computing the whole family at once."""
+        cached = self.positions.get(id(node))
+        if cached is not None:
+            return cached
+        family = self.siblings(node)
+        count = len(family)
+        for index, sibling in enumerate(family, 1):
+            self.positions[id(sibling)] = (index, count)
+        return self.positions[id(node)]
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return None if node is self.root else getattr(node, "parent", None)
+
+
+def _attribute(node: Any, name: str) -> Optional[str]:
+    attributes = attributes_view(node)
+    if not isinstance(attributes, dict):
+        attributes = getattr(node, "attrs", None)
+    if not isinstance(attributes, dict):
+        return None
+    found = None
+    # The last spelling wins, as when the tag is rendered ("id" then "Id").
+    for key, value in attributes.items():
+        if key.lower().replace("_", "-") == name:
+            found = value
+    if found is None or found is False:
+        return None
+    if found is True:
+        return ""
+    return " ".join(map(str, found)) if isinstance(found, (list, tuple)) else str(found)
+
+
+def _nth(argument: str) -> tuple[int, int]:
+    text = argument.strip().lower()
+    if text == "odd":
+        return 2, 1
+    if text == "even":
+        return 2, 0
+    if re.fullmatch(r"[+-]?\d+", text):
+        return 0, int(text)
+    found = _NTH.match(text)
+    if found is None:
+        raise SelectorSyntaxError(f"Invalid :nth-child argument {argument!r}.")
+    step = found.group(1)
+    a = -1 if step == "-" else 1 if step in ("", "+") else int(step)
+    b = int(found.group(3)) if found.group(3) else 0
+    return a, -b if found.group(2) == "-" else b
+
+
+def _matches_nth(a: int, b: int, position: int) -> bool:
+    if a == 0:
+        return position == b
+    return (position - b) % a == 0 and (position - b) // a >= 0
+
+
+def _tag_check(tag: str) -> Check:
+    return lambda node, scope: scope.keys(node)[2] == tag
+
+
+def _id_check(node_id: str) -> Check:
+    return lambda node, scope: scope.keys(node)[0] == node_id
+
+
+def _class_check(name: str) -> Check:
+    return lambda node, scope: name in scope.keys(node)[1]
+
+
+def _all_of(checks: tuple[Check, ...]) -> Check:
+    def compound(node: Any, scope: "_Scope") -> bool:
+        for check in checks:
+            if not check(node, scope):
+                return False
+        return True
+
+    return compound
+
+
+class _Parser:
+    """Turns a selector string into lists of (combinator, compound check)."""
+
+    __slots__ = ("text", "pos")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def fail(self, message: str) -> SelectorSyntaxError:
+        return SelectorSyntaxError(f"{message} at position {self.pos} in {self.text!r}.")
+
+    def parse_list(self) -> List[List[tuple[Optional[str], Check, Any]]]:
+        alternatives = []
+        while True:
+            self.skip_space()
+            alternatives.append(self.parse_complex())
+            self.skip_space()
+            if self.pos >= len(self.text):
+                return alternatives
+            if self.text[self.pos] != ",":
+                raise self.fail("Unexpected character")
+            self.pos += 1
+
+    def skip_space(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def parse_complex(self) -> List[tuple[Optional[str], Check, Any]]:
+        steps = [(None, *self.parse_compound())]
+        while self.pos < len(self.text) and self.text[self.pos] not in ",)":
+            found = _COMBINATOR.match(self.text, self.pos)
+            if found is None:
+                raise self.fail("Expected a combinator")
+            self.pos = found.end()
+            if self.pos >= len(self.text) or self.text[self.pos] in ",)":
+                if found.group(1):
+                    raise self.fail("Dangling combinator")
+                break
+            steps.append((found.group(1) or " ", *self.parse_compound()))
+        return steps
+
+    def ident(self) -> str:
+        found = _IDENT.match(self.text, self.pos)
+        if found is None:
+            raise self.fail("Expected a name")
+        self.pos = found.end()
+        return found.group(0)
+
+    def parse_compound(self) -> tuple[Check, Optional[tuple[str, str]]]:
+        """Returns the compound's check and the most selective index key it
+        requires, as ("id" | "class" | "tag", value), if any."""
+        checks: List[Check] = []
+        hints: dict[str, str] = {}
+        text = self.text
+        universal = self.pos < len(text) and text[self.pos] == "*"
+        if universal:
+            self.pos += 1
+        elif _IDENT.match(text, self.pos):
+            tag = hints["tag"] = self.ident().lower()
+            checks.append(_tag_check(tag))
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "#":
+                self.pos += 1
+                node_id = hints.setdefault("id", self.ident())
+                checks.append(_id_check(node_id))
+            elif char == ".":
+                self.pos += 1
+                name = self.ident()
+                hints.setdefault("class", name)
+                checks.append(_class_check(name))
+            elif char == "[":
+                checks.append(self.parse_attribute())
+            elif char == ":":
+                self.pos += 1
+                checks.append(self.parse_pseudo())
+            else:
+                break
+        hint = next(((kind, hints[kind]) for kind in ("id", "class", "tag") if kind in hints), None)
+        if not checks:
+            if not universal:
+                raise self.fail("Expected a selector")
+            return (lambda node, scope: True), hint
+        if len(checks) == 1:
+            return checks[0], hint
+        return _all_of(tuple(checks)), hint
+
+    def parse_attribute(self) -> Check:
+        found = _ATTRIBUTE.match(self.text, self.pos)
+        if found is None:
+            raise self.fail("Malformed attribute selector")
+        self.pos = found.end()
+        name = found.group(1).lower().replace("_", "-")
+        operator, raw, fold = found.group(2), found.group(3), bool(found.group(4))
+        if operator is None:
+            return lambda node, scope: _attribute(node, name) is not None
+        expected = raw[1:-1] if raw[0] in "\"'" else raw
+        if fold:
+            expected = expected.lower()
+        tests = {
+            "=": lambda value: value == expected,
+            "~=": lambda value: expected in value.split(),
+            "|=": lambda value: value == expected or value.startswith(expected + "-"),
+            "^=": lambda value: bool(expected) and value.startswith(expected),
+            "$=": lambda value: bool(expected) and value.endswith(expected),
+            "*=": lambda value: bool(expected) and expected in value,
+        }
+        test = tests[operator]
+
+        def check(node: Any, scope: _Scope) -> bool:
+            value = _attribute(node, name)
+            if value is None:
+                return False
+            return test(value.lower() if fold else value)
+
+        return check
+
+    def parse_pseudo(self) -> Check:
+        name = self.ident().lower()
+        argument = None
+        if self.pos < len(self.text) and self.text[self.pos] == "(":
+            close = self.text.find(")", self.pos)
+            if name == "not":
+                self.pos += 1
+                self.skip_space()
+                inner, _ = self.parse_compound()
+                self.skip_space()
+                if self.pos >= len(self.text) or self.text[self.pos] != ")":
+                    raise self.fail("Unclosed :not(")
+                self.pos += 1
+                return lambda node, scope: not inner(node, scope)
+            if close == -1:
+                raise self.fail(f"Unclosed :{name}(")
+            argument = self.text[self.pos + 1 : close]
+            self.pos = close + 1
+        if name in ("first-child", "last-child", "only-child") and argument is None:
+            if name == "first-child":
+                return lambda node, scope: scope.position(node)[0] == 1
+            if name == "last-child":
+                return lambda node, scope: scope.position(node)[0] == scope.position(node)[1]
+            return lambda node, scope: scope.position(node)[1] == 1
+        if name in ("nth-child", "nth-last-child") and argument is not None:
+            a, b = _nth(argument)
+            if name == "nth-child":
+                return lambda node, scope: _matches_nth(a, b, scope.position(node)[0])
+
+            def from_end(node: Any, scope: _Scope) -> bool:
+                index, count = scope.position(node)
+                return _matches_nth(a, b, count - index + 1)
+
+            return from_end
+        raise self.fail(f"Unsupported pseudo-class :{name}")
+
+
+def _chain(steps: List[tuple[Optional[str], Check, Any]]) -> Check:
+    """Builds a right-to-left matcher: the last compound is tested on the
+    candidate, then each combinator walks parent pointers or siblings."""
+    _, check, _ = steps[0]
+    matcher = check
+    for combinator, check, _ in steps[1:]:
+        matcher = _combine(matcher, combinator, check)
+    return matcher
+
+
+def _combine(left: Check, combinator: str, right: Check) -> Check:
+    if combinator == ">":
+
+        def child(node: Any, scope: _Scope) -> bool:
+            if not right(node, scope):
+                return False
+            parent = scope.parent(node)
+            return parent is not None and left(parent, scope)
+
+        return child
+    if combinator == " ":
+
+        def descendant(node: Any, scope: _Scope) -> bool:
+            if not right(node, scope):
+                return False
+            ancestor = scope.parent(node)
+            while ancestor is not None:
+                if left(ancestor, scope):
+                    return True
+                ancestor = scope.parent(ancestor)
+            return False
+
+        return descendant
+
+    adjacent = combinator == "+"
+
+    def sibling(node: Any, scope: _Scope) -> bool:
+        if not right(node, scope):
+            return False
+        family = scope.siblings(node)
+        index = scope.position(node)[0] - 1
+        earlier = family[index - 1 : index] if adjacent else reversed(family[:index])
+        return any(left(previous, scope) for previous in earlier)
+
+    return sibling
+
+
+class CompiledSelector:
+    """
+    A CSS selector compiled into matcher functions over SSDOM trees.
+
+    Supports type, universal, `#id`, `.class` and attribute selectors
+    (`[a]`, `=`, `~=`, `|=`, `^=`, `$=`, `*=`, with an `i` flag), the
+    descendant, `>`, `+` and `~` combinators, selector lists, and the
+    `:first-child`, `:last-child`, `:only-child`, `:nth-child()`,
+    `:nth-last-child()` and `:not()` pseudo-classes.
+
+    Each candidate is tested right to left: its own compound first, then
+    the combinators follow the parent pointers and sibling lists the tree
+    already keeps, so nothing is rendered or reparsed. Matching is scoped to
+    the queried root: ancestors and siblings outside it are not considered.
+    When the root has a `NodeIndex`, candidates come from the index bucket
+    of the rightmost compound's id, class or tag instead of a full walk.
+
+    Obtain instances through `compile_selector`, which caches them.
+
+    Example:
+        >>> rows = compile_selector("table.orders > tbody tr:nth-child(odd)")
+        >>> rows.select_all(page)
+        [<TR ...>, <TR ...>]
+    """
+
+    __slots__ = ("selector", "_matchers", "_hints")
+
+    def __init__(self, selector: str):
+        alternatives = _Parser(selector).parse_list()
+        self.selector = selector
+        self._matchers = tuple(_chain(steps) for steps in alternatives)
+        hints = tuple(steps[-1][2] for steps in alternatives)
+        self._hints = hints if all(hints) else None
+
+    def __repr__(self) -> str:
+        return f"CompiledSelector({self.selector!r})"
+
+    def _matches(self, node: Any, scope: _Scope) -> bool:
+        return any(matcher(node, scope) for matcher in self._matchers)
+
+    def matches(self, node: Any, root: Any = None) -> bool:
+        """Tells whether `node` matches, looking no higher than `root`."""
+        return self._matches(node, _Scope(node if root is None else root))
+
+    def _candidates(self, root: Any) -> List[Any]:
+        node_index = getattr(root, "_node_index", None)
+        if node_index is not None and self._hints is not None:
+            buckets = [node_index.bucket(kind, key) for kind, key in self._hints]
+            if len(buckets) == 1:
+                return list(buckets[0].values())
+            found = {}
+            for bucket in buckets:
+                found.update(bucket)
+            # Each bucket is in document order, but the union of a selector
+            # list's buckets is not: several hits need the walk.
+            if len(found) <= 1:
+                return list(found.values())
+        return list(iter_subtree(root))
+
+    def select_all(self, root: Any) -> List[Any]:
+        """Returns every node of `root`'s subtree that matches, in document order."""
+        scope = _Scope(root)
+        return [node for node in self._candidates(root) if self._matches(node, scope)]
+
+    def select_one(self, root: Any) -> Optional[Any]:
+        """Returns the first matching node of `root`'s subtree, or None."""
+        scope = _Scope(root)
+        candidates = self._candidates(root) if self._hints else iter_subtree(root)
+        for node in candidates:
+            if self._matches(node, scope):
+                return node
+        return None
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> CompiledSelector:
+    """Compiles `selector` once; later calls with the same string reuse it.
+
+    Raises:
+        SelectorSyntaxError: If the selector is malformed or uses an
+            unsupported pseudo-class.
+    """
+    return CompiledSelector(selector)
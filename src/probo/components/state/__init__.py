@@ -2,10 +2,12 @@ from probo.components.state.props import StateProps
 from probo.components.state.component_state import (
     ComponentState,
     ElementState,
+    PlaceholderIndex,
 )
 
 __all__ = [
     "StateProps",
     "ComponentState",
     "ElementState",
+    "PlaceholderIndex",
 ]
@@ -2,10 +2,65 @@ from probo.components.state.props import StateProps
 from probo.components.elements import Element
 from probo.components.attributes import ElementAttributeValidator
 import re
+from functools import lru_cache
 from typing import Any, Self, Callable
 
 from probo.utility import ProboSourceString
 
+_STATE_TAG = re.compile(r"<\$\s.*?</\$>", re.DOTALL)
+_STATE_TAG_CONTENT = re.compile(r"<\$\s[^>]*>(.*?)</\$>", re.DOTALL)
+
+
+class PlaceholderIndex:
+    """
+    One-scan index of the `<$ ...>...</$>` state tags in a template.
+
+    The template is split once into literal segments and state tags, so
+    substituting any number of element states is a single join instead of
+    one regex pass per state. Tags without a replacement fall back to their
+    inner markup, which is what `remove_state_tag` used to produce.
+
+    Args:
+        template (str): The markup containing element state placeholders.
+
+    Example:
+        >>> index = PlaceholderIndex('<p><$ s="x" c=""><b>x</b></$></p>')
+        >>> index.substitute({})
+        '<p><b>x</b></p>'
+    """
+
+    __slots__ = ("literals", "tags", "fallbacks")
+
+    def __init__(self, template: str):
+        literals, tags, fallbacks = [], [], []
+        position = 0
+        for match in _STATE_TAG.finditer(template):
+            literals.append(template[position : match.start()])
+            tag = match.group()
+            tags.append(tag)
+            fallbacks.append(_STATE_TAG_CONTENT.sub(r"\1", tag))
+            position = match.end()
+        literals.append(template[position:] if position else template)
+        self.literals = tuple(literals)
+        self.tags = tuple(tags)
+        self.fallbacks = tuple(fallbacks)
+
+    def substitute(self, replacements: dict[str, str]) -> str:
+        """Builds the output in one pass from a placeholder -> markup map."""
+        if not self.tags:
+            return self.literals[0]
+        parts = [self.literals[0]]
+        for tag, fallback, literal in zip(self.tags, self.fallbacks, self.literals[1:]):
+            parts.append(replacements.get(tag, fallback))
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def placeholder_index(template: str) -> PlaceholderIndex:
+    """Cached `PlaceholderIndex` per template, so repeat renders skip the scan."""
+    return PlaceholderIndex(template)
+
 
 class ComponentState:
     """
@@ -165,8 +220,7 @@ class ComponentState:
         """
         Removes all <$ ... > ... </$> state tags and keeps everything else intact.
         """
-        pattern = r"<\$\s[^>]*>(.*?)</\$>"
-        return re.sub(pattern, r"\1", markup, flags=re.DOTALL)
+        return placeholder_index(markup).substitute({})
 
     def resolved_template(self, template: str) -> str:
         self.use_state()
@@ -174,18 +228,13 @@ class ComponentState:
             template=template.render()
         if not self._should_render:
             return str()
-        if self.resolved_state_elements:
-            for k, el in self.resolved_state_elements.items():
-                if el.placeholder in template:
-                    if el.state_placeholder is None or self.state_errors:
-                        # template = template.replace(el.placeholder, '')
-                        template = re.sub(re.escape(el.placeholder), "", template)
-                    else:
-                        # template = template.replace(el.placeholder, el.state_placeholder)
-                        template = re.sub(
-                            re.escape(el.placeholder), el.state_placeholder, template
-                        )
-        return ProboSourceString(self.remove_state_tag(template))
+        replacements = {}
+        for el in self.resolved_state_elements.values():
+            if el.state_placeholder is None or self.state_errors:
+                replacements.setdefault(el.placeholder, "")
+            else:
+                replacements.setdefault(el.placeholder, el.state_placeholder)
+        return ProboSourceString(placeholder_index(template).substitute(replacements))
 
 
 class ElementState:
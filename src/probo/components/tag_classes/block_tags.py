@@ -9,7 +9,7 @@ class A(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
 
     """Represents an A HTML <a> element."""
 
-    __slots__ = ("_el_instance", "use_list", "use_deque", "element_data")
+    __slots__ = ()
     def __init__(self, *content:str | Any, **attrs:Any):
         super().__init__(*content, **attrs)
         ElementNodeMixin.__init__(self)
@@ -24,7 +24,7 @@ class A(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .a()
             .element
@@ -35,14 +35,14 @@ class A(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks. 
         Note: The builder's .a() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .a()
             .element
@@ -53,7 +53,7 @@ class A(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
 class ABBR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
     """Represents an ABBR HTML <abbr> element."""
 
-    __slots__ = ("_el_instance", "use_list", "use_deque", "element_data")
+    __slots__ = ()
     def __init__(self, *content:str | Any, **attrs:Any):
         super().__init__(*content, **attrs)
         ElementNodeMixin.__init__(self)
@@ -67,7 +67,7 @@ class ABBR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content = self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .abbr()
             .element
@@ -77,13 +77,13 @@ class ABBR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:abbr = Element(
         ).set_attrs(**self.attributes).set_content(self.content).abbr().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .abbr()
             .element
@@ -109,7 +109,7 @@ class ADDRESS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .address()
             .element
@@ -119,13 +119,13 @@ class ADDRESS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:address = Element(
         ).set_attrs(**self.attributes).set_content(self.content).address().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .address()
             .element
@@ -156,7 +156,7 @@ class ARTICLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .article()
             .element
@@ -166,13 +166,13 @@ class ARTICLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:article = Element(
         ).set_attrs(**self.attributes).set_content(self.content).article().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .article()
             .element
@@ -202,7 +202,7 @@ class ASIDE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .aside()
             .element
@@ -212,13 +212,13 @@ class ASIDE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:aside = Element(
         ).set_attrs(**self.attributes).set_content(self.content).aside().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .aside()
             .element
@@ -248,7 +248,7 @@ class AUDIO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .audio()
             .element
@@ -258,13 +258,13 @@ class AUDIO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:audio = Element(
         ).set_attrs(**self.attributes).set_content(self.content).audio().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .audio()
             .element
@@ -294,7 +294,7 @@ class B(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .b()
             .element
@@ -304,13 +304,13 @@ class B(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:b = Element(
         ).set_attrs(**self.attributes).set_content(self.content).b().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .b()
             .element
@@ -340,7 +340,7 @@ class BDI(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .bdi()
             .element
@@ -350,13 +350,13 @@ class BDI(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:bdi = Element(
         ).set_attrs(**self.attributes).set_content(self.content).bdi().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .bdi()
             .element
@@ -386,7 +386,7 @@ class BDO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .bdo()
             .element
@@ -396,13 +396,13 @@ class BDO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:bdo = Element(
         ).set_attrs(**self.attributes).set_content(self.content).bdo().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .bdo()
             .element
@@ -432,7 +432,7 @@ class BLOCKQUOTE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .blockquote()
             .element
@@ -442,13 +442,13 @@ class BLOCKQUOTE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:blockquote = Element(
         ).set_attrs(**self.attributes).set_content(self.content).blockquote().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .blockquote()
             .element
@@ -478,7 +478,7 @@ class BODY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .body()
             .element
@@ -488,13 +488,13 @@ class BODY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:body = Element(
         ).set_attrs(**self.attributes).set_content(self.content).body().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .body()
             .element
@@ -524,7 +524,7 @@ class BUTTON(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .button()
             .element
@@ -534,13 +534,13 @@ class BUTTON(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:button = Element(
         ).set_attrs(**self.attributes).set_content(self.content).button().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .button()
             .element
@@ -570,7 +570,7 @@ class CANVAS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .canvas()
             .element
@@ -580,13 +580,13 @@ class CANVAS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:canvas = Element(
         ).set_attrs(**self.attributes).set_content(self.content).canvas().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .canvas()
             .element
@@ -616,7 +616,7 @@ class CAPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .caption()
             .element
@@ -626,13 +626,13 @@ class CAPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:caption = Element(
         ).set_attrs(**self.attributes).set_content(self.content).caption().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .caption()
             .element
@@ -662,7 +662,7 @@ class CITE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .cite()
             .element
@@ -672,13 +672,13 @@ class CITE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:cite = Element(
         ).set_attrs(**self.attributes).set_content(self.content).cite().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .cite()
             .element
@@ -708,7 +708,7 @@ class CODE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .code()
             .element
@@ -718,13 +718,13 @@ class CODE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:code = Element(
         ).set_attrs(**self.attributes).set_content(self.content).code().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .code()
             .element
@@ -754,7 +754,7 @@ class COLGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .colgroup()
             .element
@@ -764,13 +764,13 @@ class COLGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:colgroup = Element(
         ).set_attrs(**self.attributes).set_content(self.content).colgroup().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .colgroup()
             .element
@@ -800,7 +800,7 @@ class DATA(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .data()
             .element
@@ -810,13 +810,13 @@ class DATA(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:data = Element(
         ).set_attrs(**self.attributes).set_content(self.content).data().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .data()
             .element
@@ -846,7 +846,7 @@ class DATALIST(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .datalist()
             .element
@@ -856,13 +856,13 @@ class DATALIST(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:datalist = Element(
         ).set_attrs(**self.attributes).set_content(self.content).datalist().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .datalist()
             .element
@@ -892,7 +892,7 @@ class DD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .dd()
             .element
@@ -902,13 +902,13 @@ class DD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:dd = Element(
         ).set_attrs(**self.attributes).set_content(self.content).dd().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .dd()
             .element
@@ -938,7 +938,7 @@ class DEL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .Del()
             .element
@@ -948,13 +948,13 @@ class DEL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:del = Element(
         ).set_attrs(**self.attributes).set_content(self.content).del().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .Del()
             .element
@@ -984,7 +984,7 @@ class DETAILS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .details()
             .element
@@ -994,13 +994,13 @@ class DETAILS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:details = Element(
         ).set_attrs(**self.attributes).set_content(self.content).details().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .details()
             .element
@@ -1030,7 +1030,7 @@ class DFN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .dfn()
             .element
@@ -1040,13 +1040,13 @@ class DFN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:dfn = Element(
         ).set_attrs(**self.attributes).set_content(self.content).dfn().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .dfn()
             .element
@@ -1076,7 +1076,7 @@ class DIALOG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .dialog()
             .element
@@ -1086,13 +1086,13 @@ class DIALOG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:dialog = Element(
         ).set_attrs(**self.attributes).set_content(self.content).dialog().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .dialog()
             .element
@@ -1123,7 +1123,7 @@ class DIV(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .div()
             .element
@@ -1133,13 +1133,13 @@ class DIV(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:div = Element(
         ).set_attrs(**self.attributes).set_content(self.content).div().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .div()
             .element
@@ -1170,7 +1170,7 @@ class DL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .dl()
             .element
@@ -1180,13 +1180,13 @@ class DL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:dl = Element(
         ).set_attrs(**self.attributes).set_content(self.content).dl().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .dl()
             .element
@@ -1216,7 +1216,7 @@ class DT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .dt()
             .element
@@ -1226,13 +1226,13 @@ class DT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:dt = Element(
         ).set_attrs(**self.attributes).set_content(self.content).dt().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .dt()
             .element
@@ -1262,7 +1262,7 @@ class EM(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .em()
             .element
@@ -1272,13 +1272,13 @@ class EM(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:em = Element(
         ).set_attrs(**self.attributes).set_content(self.content).em().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .em()
             .element
@@ -1308,7 +1308,7 @@ class FIELDSET(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .fieldset()
             .element
@@ -1318,13 +1318,13 @@ class FIELDSET(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:fieldset = Element(
         ).set_attrs(**self.attributes).set_content(self.content).fieldset().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .fieldset()
             .element
@@ -1354,7 +1354,7 @@ class FIGCAPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .figcaption()
             .element
@@ -1364,13 +1364,13 @@ class FIGCAPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:figcaption = Element(
         ).set_attrs(**self.attributes).set_content(self.content).figcaption().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .figcaption()
             .element
@@ -1400,7 +1400,7 @@ class FIGURE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .figure()
             .element
@@ -1410,13 +1410,13 @@ class FIGURE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:figure = Element(
         ).set_attrs(**self.attributes).set_content(self.content).figure().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .figure()
             .element
@@ -1446,7 +1446,7 @@ class FOOTER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .footer()
             .element
@@ -1456,13 +1456,13 @@ class FOOTER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:footer = Element(
         ).set_attrs(**self.attributes).set_content(self.content).footer().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .footer()
             .element
@@ -1492,7 +1492,7 @@ class FORM(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .form()
             .element
@@ -1502,13 +1502,13 @@ class FORM(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:form = Element(
         ).set_attrs(**self.attributes).set_content(self.content).form().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .form()
             .element
@@ -1538,7 +1538,7 @@ class H1(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h1()
             .element
@@ -1548,13 +1548,13 @@ class H1(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h1 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h1().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h1()
             .element
@@ -1584,7 +1584,7 @@ class H2(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h2()
             .element
@@ -1594,13 +1594,13 @@ class H2(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h2 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h2().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h2()
             .element
@@ -1630,7 +1630,7 @@ class H3(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h3()
             .element
@@ -1640,13 +1640,13 @@ class H3(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h3 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h3().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h3()
             .element
@@ -1676,7 +1676,7 @@ class H4(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h4()
             .element
@@ -1686,13 +1686,13 @@ class H4(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h4 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h4().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h4()
             .element
@@ -1723,7 +1723,7 @@ class H5(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h5()
             .element
@@ -1733,13 +1733,13 @@ class H5(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h5 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h5().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h5()
             .element
@@ -1770,7 +1770,7 @@ class H6(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .h6()
             .element
@@ -1780,13 +1780,13 @@ class H6(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:h6 = Element(
         ).set_attrs(**self.attributes).set_content(self.content).h6().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .h6()
             .element
@@ -1817,7 +1817,7 @@ class HEAD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .head()
             .element
@@ -1827,12 +1827,12 @@ class HEAD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:head = Element(
         ).set_attrs(**self.attributes).set_content(self.content).head().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .head()
             .element
@@ -1863,7 +1863,7 @@ class HEADER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .header()
             .element
@@ -1873,13 +1873,13 @@ class HEADER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:header = Element(
         ).set_attrs(**self.attributes).set_content(self.content).header().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .header()
             .element
@@ -1910,7 +1910,7 @@ class HGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .hgroup()
             .element
@@ -1920,13 +1920,13 @@ class HGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:hgroup = Element(
         ).set_attrs(**self.attributes).set_content(self.content).hgroup().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .hgroup()
             .element
@@ -1957,7 +1957,7 @@ class HTML(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .html()
             .element
@@ -1967,13 +1967,13 @@ class HTML(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:html = Element(
         ).set_attrs(**self.attributes).set_content(self.content).html().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .html()
             .element
@@ -2004,7 +2004,7 @@ class I(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .i()
             .element
@@ -2014,13 +2014,13 @@ class I(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:i = Element(
         ).set_attrs(**self.attributes).set_content(self.content).i().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .i()
             .element
@@ -2051,7 +2051,7 @@ class IFRAME(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .iframe()
             .element
@@ -2061,13 +2061,13 @@ class IFRAME(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:iframe = Element(
         ).set_attrs(**self.attributes).set_content(self.content).iframe().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .iframe()
             .element
@@ -2098,7 +2098,7 @@ class INS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .ins()
             .element
@@ -2108,13 +2108,13 @@ class INS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:ins = Element(
         ).set_attrs(**self.attributes).set_content(self.content).ins().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .ins()
             .element
@@ -2145,7 +2145,7 @@ class KBD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .kbd()
             .element
@@ -2155,13 +2155,13 @@ class KBD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:kbd = Element(
         ).set_attrs(**self.attributes).set_content(self.content).kbd().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .kbd()
             .element
@@ -2192,7 +2192,7 @@ class LABEL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .label()
             .element
@@ -2202,13 +2202,13 @@ class LABEL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:label = Element(
         ).set_attrs(**self.attributes).set_content(self.content).label().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .label()
             .element
@@ -2239,7 +2239,7 @@ class LEGEND(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .legend()
             .element
@@ -2249,13 +2249,13 @@ class LEGEND(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:legend = Element(
         ).set_attrs(**self.attributes).set_content(self.content).legend().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .legend()
             .element
@@ -2286,7 +2286,7 @@ class LI(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .li()
             .element
@@ -2296,13 +2296,13 @@ class LI(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:li = Element(
         ).set_attrs(**self.attributes).set_content(self.content).li().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .li()
             .element
@@ -2333,7 +2333,7 @@ class MAIN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .main()
             .element
@@ -2343,13 +2343,13 @@ class MAIN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:main = Element(
         ).set_attrs(**self.attributes).set_content(self.content).main().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .main()
             .element
@@ -2380,7 +2380,7 @@ class MATH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .math()
             .element
@@ -2390,13 +2390,13 @@ class MATH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:math = Element(
         ).set_attrs(**self.attributes).set_content(self.content).math().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .math()
             .element
@@ -2427,7 +2427,7 @@ class MAP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .Map()
             .element
@@ -2437,13 +2437,13 @@ class MAP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:map = Element(
         ).set_attrs(**self.attributes).set_content(self.content).map().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .Map()
             .element
@@ -2474,7 +2474,7 @@ class MARK(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .mark()
             .element
@@ -2484,13 +2484,13 @@ class MARK(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:mark = Element(
         ).set_attrs(**self.attributes).set_content(self.content).mark().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .mark()
             .element
@@ -2521,7 +2521,7 @@ class MENU(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .menu()
             .element
@@ -2531,13 +2531,13 @@ class MENU(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:menu = Element(
         ).set_attrs(**self.attributes).set_content(self.content).menu().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .menu()
             .element
@@ -2568,7 +2568,7 @@ class METER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .meter()
             .element
@@ -2578,13 +2578,13 @@ class METER(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).set_content(self.content).meter().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .meter()
             .element
@@ -2615,7 +2615,7 @@ class NAV(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .nav()
             .element
@@ -2625,13 +2625,13 @@ class NAV(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:nav = Element(
         ).set_attrs(**self.attributes).set_content(self.content).nav().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .nav()
             .element
@@ -2662,7 +2662,7 @@ class NOSCRIPT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .noscript()
             .element
@@ -2672,13 +2672,13 @@ class NOSCRIPT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:noscript = Element(
         ).set_attrs(**self.attributes).set_content(self.content).noscript().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .noscript()
             .element
@@ -2709,7 +2709,7 @@ class OBJECT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .object()
             .element
@@ -2719,13 +2719,13 @@ class OBJECT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:object = Element(
         ).set_attrs(**self.attributes).set_content(self.content).object().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .object()
             .element
@@ -2756,7 +2756,7 @@ class OL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .ol()
             .element
@@ -2766,13 +2766,13 @@ class OL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:ol = Element(
         ).set_attrs(**self.attributes).set_content(self.content).ol().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .ol()
             .element
@@ -2803,7 +2803,7 @@ class OPTGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .optgroup()
             .element
@@ -2813,13 +2813,13 @@ class OPTGROUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:optgroup = Element(
         ).set_attrs(**self.attributes).set_content(self.content).optgroup().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .optgroup()
             .element
@@ -2850,7 +2850,7 @@ class OPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .option()
             .element
@@ -2860,13 +2860,13 @@ class OPTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:option = Element(
         ).set_attrs(**self.attributes).set_content(self.content).option().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .option()
             .element
@@ -2897,7 +2897,7 @@ class OUTPUT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .output()
             .element
@@ -2907,13 +2907,13 @@ class OUTPUT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:output = Element(
         ).set_attrs(**self.attributes).set_content(self.content).output().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .output()
             .element
@@ -2943,7 +2943,7 @@ class P(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .p()
             .element
@@ -2953,13 +2953,13 @@ class P(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:p = Element(
         ).set_attrs(**self.attributes).set_content(self.content).p().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .p()
             .element
@@ -2990,7 +2990,7 @@ class PORTAL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .portal()
             .element
@@ -3000,13 +3000,13 @@ class PORTAL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:portal = Element(
         ).set_attrs(**self.attributes).set_content(self.content).portal().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .portal()
             .element
@@ -3037,7 +3037,7 @@ class PICTURE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .picture()
             .element
@@ -3047,13 +3047,13 @@ class PICTURE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:picture = Element(
         ).set_attrs(**self.attributes).set_content(self.content).picture().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .picture()
             .element
@@ -3084,7 +3084,7 @@ class PRE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .pre()
             .element
@@ -3094,13 +3094,13 @@ class PRE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:pre = Element(
         ).set_attrs(**self.attributes).set_content(self.content).pre().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .pre()
             .element
@@ -3131,7 +3131,7 @@ class PROGRESS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .progress()
             .element
@@ -3141,13 +3141,13 @@ class PROGRESS(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:progress = Element(
         ).set_attrs(**self.attributes).set_content(self.content).progress().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .progress()
             .element
@@ -3178,7 +3178,7 @@ class Q(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .q()
             .element
@@ -3188,13 +3188,13 @@ class Q(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:q = Element(
         ).set_attrs(**self.attributes).set_content(self.content).q().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .q()
             .element
@@ -3225,7 +3225,7 @@ class RP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .rp()
             .element
@@ -3235,13 +3235,13 @@ class RP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:rp = Element(
         ).set_attrs(**self.attributes).set_content(self.content).rp().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .rp()
             .element
@@ -3272,7 +3272,7 @@ class RT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .rt()
             .element
@@ -3282,13 +3282,13 @@ class RT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:rt = Element(
         ).set_attrs(**self.attributes).set_content(self.content).rt().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .rt()
             .element
@@ -3319,7 +3319,7 @@ class RUBY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .ruby()
             .element
@@ -3329,13 +3329,13 @@ class RUBY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:ruby = Element(
         ).set_attrs(**self.attributes).set_content(self.content).ruby().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .ruby()
             .element
@@ -3366,7 +3366,7 @@ class S(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .s()
             .element
@@ -3376,13 +3376,13 @@ class S(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:s = Element(
         ).set_attrs(**self.attributes).set_content(self.content).s().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .s()
             .element
@@ -3413,7 +3413,7 @@ class SAMP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .samp()
             .element
@@ -3423,13 +3423,13 @@ class SAMP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:samp = Element(
         ).set_attrs(**self.attributes).set_content(self.content).samp().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .samp()
             .element
@@ -3460,7 +3460,7 @@ class SCRIPT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .script()
             .element
@@ -3470,13 +3470,13 @@ class SCRIPT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:script = Element(
         ).set_attrs(**self.attributes).set_content(self.content).script().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .script()
             .element
@@ -3507,7 +3507,7 @@ class SEARCH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .search()
             .element
@@ -3517,13 +3517,13 @@ class SEARCH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:search = Element(
         ).set_attrs(**self.attributes).set_content(self.content).search().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .search()
             .element
@@ -3554,7 +3554,7 @@ class SECTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .section()
             .element
@@ -3564,13 +3564,13 @@ class SECTION(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:section = Element(
         ).set_attrs(**self.attributes).set_content(self.content).section().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .section()
             .element
@@ -3601,7 +3601,7 @@ class SELECT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .select()
             .element
@@ -3611,13 +3611,13 @@ class SELECT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:select = Element(
         ).set_attrs(**self.attributes).set_content(self.content).select().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .select()
             .element
@@ -3648,7 +3648,7 @@ class SLOT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .slot()
             .element
@@ -3658,13 +3658,13 @@ class SLOT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:slot = Element(
         ).set_attrs(**self.attributes).set_content(self.content).slot().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .slot()
             .element
@@ -3695,7 +3695,7 @@ class SMALL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .small()
             .element
@@ -3705,13 +3705,13 @@ class SMALL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:small = Element(
         ).set_attrs(**self.attributes).set_content(self.content).small().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .small()
             .element
@@ -3742,7 +3742,7 @@ class SPAN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .span()
             .element
@@ -3752,13 +3752,13 @@ class SPAN(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:span = Element(
         ).set_attrs(**self.attributes).set_content(self.content).span().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .span()
             .element
@@ -3789,7 +3789,7 @@ class STRONG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .strong()
             .element
@@ -3799,13 +3799,13 @@ class STRONG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:strong = Element(
         ).set_attrs(**self.attributes).set_content(self.content).strong().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .strong()
             .element
@@ -3836,7 +3836,7 @@ class STYLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .style()
             .element
@@ -3846,13 +3846,13 @@ class STYLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:style = Element(
         ).set_attrs(**self.attributes).set_content(self.content).style().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .style()
             .element
@@ -3883,7 +3883,7 @@ class SUB(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .sub()
             .element
@@ -3893,13 +3893,13 @@ class SUB(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:sub = Element(
         ).set_attrs(**self.attributes).set_content(self.content).sub().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .sub()
             .element
@@ -3930,7 +3930,7 @@ class SUMMARY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .summary()
             .element
@@ -3940,13 +3940,13 @@ class SUMMARY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:summary = Element(
         ).set_attrs(**self.attributes).set_content(self.content).summary().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .summary()
             .element
@@ -3977,7 +3977,7 @@ class SUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .sup()
             .element
@@ -3987,13 +3987,13 @@ class SUP(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:sup = Element(
         ).set_attrs(**self.attributes).set_content(self.content).sup().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .sup()
             .element
@@ -4023,7 +4023,7 @@ class TABLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .table()
             .element
@@ -4033,13 +4033,13 @@ class TABLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:table = Element(
         ).set_attrs(**self.attributes).set_content(self.content).table().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .table()
             .element
@@ -4070,7 +4070,7 @@ class TBODY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .tbody()
             .element
@@ -4080,13 +4080,13 @@ class TBODY(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:tbody = Element(
         ).set_attrs(**self.attributes).set_content(self.content).tbody().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .tbody()
             .element
@@ -4117,7 +4117,7 @@ class TD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .td()
             .element
@@ -4127,13 +4127,13 @@ class TD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:td = Element(
         ).set_attrs(**self.attributes).set_content(self.content).td().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .td()
             .element
@@ -4164,7 +4164,7 @@ class TEMPLATE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .template()
             .element
@@ -4174,13 +4174,13 @@ class TEMPLATE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:template = Element(
         ).set_attrs(**self.attributes).set_content(self.content).template().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .template()
             .element
@@ -4211,7 +4211,7 @@ class TEXTAREA(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .textarea()
             .element
@@ -4221,13 +4221,13 @@ class TEXTAREA(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:textarea = Element(
         ).set_attrs(**self.attributes).set_content(self.content).textarea().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .textarea()
             .element
@@ -4258,7 +4258,7 @@ class TFOOT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .tfoot()
             .element
@@ -4268,13 +4268,13 @@ class TFOOT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:tfoot = Element(
         ).set_attrs(**self.attributes).set_content(self.content).tfoot().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .tfoot()
             .element
@@ -4305,7 +4305,7 @@ class TH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .th()
             .element
@@ -4315,13 +4315,13 @@ class TH(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:th = Element(
         ).set_attrs(**self.attributes).set_content(self.content).th().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .th()
             .element
@@ -4352,7 +4352,7 @@ class THEAD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .thead()
             .element
@@ -4362,13 +4362,13 @@ class THEAD(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:thead = Element(
         ).set_attrs(**self.attributes).set_content(self.content).thead().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .thead()
             .element
@@ -4399,7 +4399,7 @@ class TIME(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .time()
             .element
@@ -4409,13 +4409,13 @@ class TIME(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:time = Element(
         ).set_attrs(**self.attributes).set_content(self.content).time().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .time()
             .element
@@ -4446,7 +4446,7 @@ class TITLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .title()
             .element
@@ -4456,13 +4456,13 @@ class TITLE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:title = Element(
         ).set_attrs(**self.attributes).set_content(self.content).title().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .title()
             .element
@@ -4493,7 +4493,7 @@ class TR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .tr()
             .element
@@ -4503,13 +4503,13 @@ class TR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:tr = Element(
         ).set_attrs(**self.attributes).set_content(self.content).tr().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .tr()
             .element
@@ -4540,7 +4540,7 @@ class U(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .u()
             .element
@@ -4550,13 +4550,13 @@ class U(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:u = Element(
         ).set_attrs(**self.attributes).set_content(self.content).u().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .u()
             .element
@@ -4587,7 +4587,7 @@ class UL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .ul()
             .element
@@ -4597,13 +4597,13 @@ class UL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:ul = Element(
         ).set_attrs(**self.attributes).set_content(self.content).ul().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .ul()
             .element
@@ -4634,7 +4634,7 @@ class VAR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .var()
             .element
@@ -4644,13 +4644,13 @@ class VAR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:var = Element(
         ).set_attrs(**self.attributes).set_content(self.content).var().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .var()
             .element
@@ -4681,7 +4681,7 @@ class VIDEO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .video()
             .element
@@ -4691,13 +4691,13 @@ class VIDEO(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         '''
         Blueprint:video = Element(
         ).set_attrs(**self.attributes).set_content(self.content).video().element'''
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
            .video()
             .element
@@ -25,14 +25,14 @@ class DOCTYPE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
             self.html_doc = content
     def render(self):
         content=self._get_rendered_content()
-        return self.EL.set_attrs(**self.attributes).set_content(content).doctype().element
+        return self.EL.set_attrs(**self._attributes).set_content(content).doctype().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
 
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
         if self.html_doc is not None:        
@@ -40,7 +40,7 @@ class DOCTYPE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         else:
             content_generator = self._get_stream_content(batch=batch)
 
-        yield from (self.EL.set_attrs(**self.attributes)
+        yield from (self.EL.set_attrs(**self._attributes)
         # .set_generator_content((x for x in []))
             .doctype()
             .reset_generator_content()
@@ -65,20 +65,20 @@ class AREA(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
 
     def render(self):
 
-        return self.EL.set_attrs(**self.attributes).area().element
+        return self.EL.set_attrs(**self._attributes).area().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .area()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -99,19 +99,19 @@ class BASE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).base().element
+        return self.EL.set_attrs(**self._attributes).base().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .base()
             .reset_generator_content()
             .stream(batch=batch)
@@ -132,19 +132,19 @@ class BR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).br().element
+        return self.EL.set_attrs(**self._attributes).br().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .br()
             .reset_generator_content()
             .stream(batch=batch)
@@ -165,19 +165,19 @@ class COL(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).col().element
+        return self.EL.set_attrs(**self._attributes).col().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .col()
             .reset_generator_content()
             .stream(batch=batch)
@@ -198,19 +198,19 @@ class EMBED(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).embed().element
+        return self.EL.set_attrs(**self._attributes).embed().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .embed()
             .reset_generator_content()
             .stream(batch=batch)
@@ -231,19 +231,19 @@ class HR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).hr().element
+        return self.EL.set_attrs(**self._attributes).hr().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .hr()
             .reset_generator_content()
             .stream(batch=batch)
@@ -264,19 +264,19 @@ class IMG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).img().element
+        return self.EL.set_attrs(**self._attributes).img().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .img()
             .reset_generator_content()
             .stream(batch=batch)
@@ -297,19 +297,19 @@ class INPUT(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).input().element
+        return self.EL.set_attrs(**self._attributes).input().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .input()
             .reset_generator_content()
             .stream(batch=batch)
@@ -330,19 +330,19 @@ class LINK(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).link().element
+        return self.EL.set_attrs(**self._attributes).link().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .link()
             .reset_generator_content()
             .stream(batch=batch)
@@ -363,19 +363,19 @@ class META(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).meta().element
+        return self.EL.set_attrs(**self._attributes).meta().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .meta()
             .reset_generator_content()
             .stream(batch=batch)
@@ -396,19 +396,19 @@ class PARAM(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).param().element
+        return self.EL.set_attrs(**self._attributes).param().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .param()
             .reset_generator_content()
             .stream(batch=batch)
@@ -429,19 +429,19 @@ class SOURCE(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).source().element
+        return self.EL.set_attrs(**self._attributes).source().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .source()
             .reset_generator_content()
             .stream(batch=batch)
@@ -462,19 +462,19 @@ class TRACK(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).track().element
+        return self.EL.set_attrs(**self._attributes).track().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .track()
             .reset_generator_content()
             .stream(batch=batch)
@@ -495,19 +495,19 @@ class WBR(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ElementMutatorMixin.__init__(self)
 
     def render(self):
-        return self.EL.set_attrs(**self.attributes).wbr().element
+        return self.EL.set_attrs(**self._attributes).wbr().element
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).meter().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .wbr()
             .reset_generator_content()
             .stream(batch=batch)
@@ -19,7 +19,7 @@ class G(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .g()
             .element
@@ -30,14 +30,14 @@ class G(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .g() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .g()
             .element
@@ -66,7 +66,7 @@ class DEFS(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .defs()
             .element
@@ -77,14 +77,14 @@ class DEFS(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .defs() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .defs()
             .element
@@ -114,7 +114,7 @@ class TEXT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .text()
             .element
@@ -125,14 +125,14 @@ class TEXT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .text() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .text()
             .element
@@ -162,7 +162,7 @@ class TSPAN(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .tspan()
             .element
@@ -173,14 +173,14 @@ class TSPAN(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .tspan() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .tspan()
             .element
@@ -210,7 +210,7 @@ class SVG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .svg()
             .element
@@ -221,14 +221,14 @@ class SVG(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .svg() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .svg()
             .element
@@ -258,7 +258,7 @@ class SYMBOL(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .symbol()
             .element
@@ -269,14 +269,14 @@ class SYMBOL(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .symbol() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .symbol()
             .element
@@ -306,7 +306,7 @@ class MARKER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .marker()
             .element
@@ -317,14 +317,14 @@ class MARKER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .marker() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .marker()
             .element
@@ -354,7 +354,7 @@ class PATTERN(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .pattern()
             .element
@@ -365,14 +365,14 @@ class PATTERN(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .pattern() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .pattern()
             .element
@@ -402,7 +402,7 @@ class MASK(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .mask()
             .element
@@ -413,14 +413,14 @@ class MASK(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .mask() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .mask()
             .element
@@ -450,7 +450,7 @@ class CLIPPATH(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .clipPath()
             .element
@@ -461,14 +461,14 @@ class CLIPPATH(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .clipPath() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .clipPath()
             .element
@@ -498,7 +498,7 @@ class LINEARGRADIENT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .linearGradient()
             .element
@@ -509,14 +509,14 @@ class LINEARGRADIENT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .linearGradient() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .linearGradient()
             .element
@@ -546,7 +546,7 @@ class RADIALGRADIENT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .radialGradient()
             .element
@@ -557,14 +557,14 @@ class RADIALGRADIENT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .radialGradient() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .radialGradient()
             .element
@@ -594,7 +594,7 @@ class FILTER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .filter()
             .element
@@ -605,14 +605,14 @@ class FILTER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .filter() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .filter()
             .element
@@ -642,7 +642,7 @@ class FECOMPONENTTRANSFER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin)
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .feComponentTransfer()
             .element
@@ -653,14 +653,14 @@ class FECOMPONENTTRANSFER(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin)
         Yields HTML in chunks.
         Note: The builder's .feComponentTransfer() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .feComponentTransfer()
             .element
@@ -690,7 +690,7 @@ class FEDIFFUSELIGHTING(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .feDiffuseLighting()
             .element
@@ -701,14 +701,14 @@ class FEDIFFUSELIGHTING(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .feDiffuseLighting() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .feDiffuseLighting()
             .element
@@ -738,7 +738,7 @@ class FEMERGE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .feMerge()
             .element
@@ -749,14 +749,14 @@ class FEMERGE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .feMerge() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .feMerge()
             .element
@@ -786,7 +786,7 @@ class FESPECULARLIGHTING(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .feSpecularLighting()
             .element
@@ -797,14 +797,14 @@ class FESPECULARLIGHTING(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .feSpecularLighting() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .feSpecularLighting()
             .element
@@ -834,7 +834,7 @@ class ANIMATEMOTION(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .animateMotion()
             .element
@@ -845,14 +845,14 @@ class ANIMATEMOTION(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .animateMotion() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .animateMotion()
             .element
@@ -882,7 +882,7 @@ class FOREIGNOBJECT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         content=self._get_rendered_content()
         return (
             self.EL
-            .set_attrs(**self.attributes)
+            .set_attrs(**self._attributes)
             .set_content(content)
             .foreignObject()
             .element
@@ -893,14 +893,14 @@ class FOREIGNOBJECT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         Yields HTML in chunks.
         Note: The builder's .foreignObject() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=batch)
 
         elment_info = (
-            self.EL.set_attrs(**self.attributes)
+            self.EL.set_attrs(**self._attributes)
             .set_generator_content(content_generator)
             .foreignObject()
             .element
@@ -926,20 +926,20 @@ class PATH(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).path().element
+        return self.EL.set_attrs(**self._attributes).path().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).path().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .path()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -959,20 +959,20 @@ class CIRCLE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).circle().element
+        return self.EL.set_attrs(**self._attributes).circle().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).circle().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .circle()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -992,20 +992,20 @@ class RECT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).rect().element
+        return self.EL.set_attrs(**self._attributes).rect().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).rect().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .rect()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1025,20 +1025,20 @@ class LINE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).line().element
+        return self.EL.set_attrs(**self._attributes).line().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).line().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .line()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1058,20 +1058,20 @@ class POLYLINE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).polyline().element
+        return self.EL.set_attrs(**self._attributes).polyline().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).polyline().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .polyline()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1091,20 +1091,20 @@ class POLYGON(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).polygon().element
+        return self.EL.set_attrs(**self._attributes).polygon().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).polygon().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .polygon()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1124,20 +1124,20 @@ class ELLIPSE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).ellipse().element
+        return self.EL.set_attrs(**self._attributes).ellipse().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).ellipse().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .ellipse()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1157,20 +1157,20 @@ class IMAGE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).image().element
+        return self.EL.set_attrs(**self._attributes).image().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).image().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .image()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1190,20 +1190,20 @@ class FEBLEND(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feBlend().element
+        return self.EL.set_attrs(**self._attributes).feBlend().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feBlend().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feBlend()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1223,20 +1223,20 @@ class FECOLORMATRIX(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feColorMatrix().element
+        return self.EL.set_attrs(**self._attributes).feColorMatrix().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feColorMatrix().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feColorMatrix()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1256,20 +1256,20 @@ class FECOMPOSITE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feComposite().element
+        return self.EL.set_attrs(**self._attributes).feComposite().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feComposite().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feComposite()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1289,20 +1289,20 @@ class FECONVOLVEMATRIX(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feConvolveMatrix().element
+        return self.EL.set_attrs(**self._attributes).feConvolveMatrix().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feConvolveMatrix().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feConvolveMatrix()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1322,20 +1322,20 @@ class FEDISPLACEMENTMAP(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feDisplacementMap().element
+        return self.EL.set_attrs(**self._attributes).feDisplacementMap().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feDisplacementMap().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feDisplacementMap()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1355,20 +1355,20 @@ class FEDROPSHADOW(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feDropShadow().element
+        return self.EL.set_attrs(**self._attributes).feDropShadow().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feDropShadow().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feDropShadow()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1388,20 +1388,20 @@ class FEFLOOD(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feFlood().element
+        return self.EL.set_attrs(**self._attributes).feFlood().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feFlood().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feFlood()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1421,20 +1421,20 @@ class FEFUNCA(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feFuncA().element
+        return self.EL.set_attrs(**self._attributes).feFuncA().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feFuncA().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feFuncA()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1454,20 +1454,20 @@ class FEFUNCB(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feFuncB().element
+        return self.EL.set_attrs(**self._attributes).feFuncB().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feFuncB().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feFuncB()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1487,20 +1487,20 @@ class FEFUNCG(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feFuncG().element
+        return self.EL.set_attrs(**self._attributes).feFuncG().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feFuncG().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feFuncG()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1520,20 +1520,20 @@ class FEFUNCR(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feFuncR().element
+        return self.EL.set_attrs(**self._attributes).feFuncR().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feFuncR().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feFuncR()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1553,20 +1553,20 @@ class FEGAUSSIANBLUR(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feGaussianBlur().element
+        return self.EL.set_attrs(**self._attributes).feGaussianBlur().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feGaussianBlur().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feGaussianBlur()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1586,20 +1586,20 @@ class FEIMAGE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feImage().element
+        return self.EL.set_attrs(**self._attributes).feImage().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feImage().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feImage()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1619,20 +1619,20 @@ class FEMERGENODE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feMergeNode().element
+        return self.EL.set_attrs(**self._attributes).feMergeNode().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feMergeNode().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feMergeNode()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1652,20 +1652,20 @@ class FEMORPHOLOGY(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feMorphology().element
+        return self.EL.set_attrs(**self._attributes).feMorphology().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feMorphology().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feMorphology()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1685,20 +1685,20 @@ class FEOFFSET(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feOffset().element
+        return self.EL.set_attrs(**self._attributes).feOffset().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feOffset().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feOffset()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1718,20 +1718,20 @@ class FEPOINTLIGHT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).fePointLight().element
+        return self.EL.set_attrs(**self._attributes).fePointLight().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).fePointLight().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .fePointLight()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1751,20 +1751,20 @@ class FESPOTLIGHT(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feSpotLight().element
+        return self.EL.set_attrs(**self._attributes).feSpotLight().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feSpotLight().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feSpotLight()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1784,20 +1784,20 @@ class FETILE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feTile().element
+        return self.EL.set_attrs(**self._attributes).feTile().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feTile().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feTile()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1817,20 +1817,20 @@ class FETURBULENCE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).feTurbulence().element
+        return self.EL.set_attrs(**self._attributes).feTurbulence().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).feTurbulence().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .feTurbulence()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1850,20 +1850,20 @@ class ANIMATE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).animate().element
+        return self.EL.set_attrs(**self._attributes).animate().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).animate().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .animate()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1883,20 +1883,20 @@ class ANIMATETRANSFORM(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).animateTransform().element
+        return self.EL.set_attrs(**self._attributes).animateTransform().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).animateTransform().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .animateTransform()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1916,20 +1916,20 @@ class SET(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).set().element
+        return self.EL.set_attrs(**self._attributes).set().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).set().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .set()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1949,20 +1949,20 @@ class VIEW(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).view().element
+        return self.EL.set_attrs(**self._attributes).view().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).view().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .view()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -1982,20 +1982,20 @@ class USE(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).use().element
+        return self.EL.set_attrs(**self._attributes).use().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).use().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .use()
                 .reset_generator_content()
                 .stream(batch=batch)
@@ -2015,20 +2015,20 @@ class STOP(BaseHTMLElement, ElementNodeMixin,ElementMutatorMixin):
         self._set_node_children([],True)
         ElementMutatorMixin.__init__(self)
     def render(self):
-        return self.EL.set_attrs(**self.attributes).stop().element
+        return self.EL.set_attrs(**self._attributes).stop().element
 
     def stream(self, batch: int = 50) -> Generator[str, None, None]:
         """
         Blueprint:meter = Element(
         ).set_attrs(**self.attributes).stop().element"""
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         stream_manager = StreamManager(
             None,
             (
-                self.EL.set_attrs(**self.attributes)
+                self.EL.set_attrs(**self._attributes)
                 .stop()
                 .reset_generator_content()
                 .stream(batch=batch)
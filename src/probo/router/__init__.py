@@ -1,25 +1,37 @@
 from probo.router.router import ProboRouter
 from probo.router.payload import RouterPayload
+from probo.router.asgi import ProboASGIApp
 from probo.router.cache import (
     ProboCache,
     CacheItem,
+    ResponseCache,
+    CachedResponse,
 )
 from probo.router.discovery import (
     route,
     ProboRoute,
     discover_pages,
     discover_routers,
+    LazyPage,
+)
+from probo.router.manifest import (
+    DiscoveryManifest,
 )
 from probo.router.global_cache import (
     get_or_render,
     global_cache,
+    configure_global_cache,
     file_hash,
+    FileFreshness,
+    file_freshness,
 )
 from probo.router.http import (
     get_cookie,
     get_upload,
+    etag_matches,
     get_wsgi_environ,
     hx_redirect,
+    make_etag,
     RouterRequestdata,
     save_upload,
     set_cookie,
@@ -27,6 +39,9 @@ from probo.router.http import (
 from probo.router.settings import (
     RouterSettings,
 )
+from probo.router.tcm_routes import (
+    TCMRouteTable,
+)
 from probo.router.single_file_prototyping import (
     run_file_server,
     run_project_server,
@@ -48,23 +63,34 @@ from probo.router.responses import (
 __all__ = [
     "ProboRouter",
     "RouterPayload",
+    "ProboASGIApp",
     "route",
     "ProboRoute",
     "discover_pages",
     "discover_routers",
+    "LazyPage",
+    "DiscoveryManifest",
     "ProboCache",
     "CacheItem",
+    "ResponseCache",
+    "CachedResponse",
     "get_or_render",
     "global_cache",
+    "configure_global_cache",
     "file_hash",
+    "FileFreshness",
+    "file_freshness",
     "get_cookie",
     "get_upload",
+    "etag_matches",
     "get_wsgi_environ",
     "hx_redirect",
+    "make_etag",
     "RouterRequestdata",
     "save_upload",
     "set_cookie",
     "RouterSettings",
+    "TCMRouteTable",
     "run_file_server",
     "run_project_server",
     "RouterViewMixin",
@@ -0,0 +1,307 @@
+import io
+import sys
+import asyncio
+from traceback import format_exc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from bottle import (
+    BaseRequest,
+    BaseResponse,
+    HTTPError,
+    HTTPResponse,
+    JSONPlugin,
+    TemplatePlugin,
+    request,
+    response,
+)
+
+_RESPONSE_FIELDS = ("_status_line", "_status_code", "_cookies", "_headers", "body")
+_BODYLESS_STATUS = (100, 101, 204, 304)
+_DEFAULT_PLUGINS = (JSONPlugin, TemplatePlugin)
+
+
+def build_environ(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+    """Translates an ASGI HTTP scope into a WSGI environ (PEP 3333 encoding)."""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf8").decode("latin1"),
+        "PATH_INFO": path.encode("utf8").decode("latin1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("ascii"),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "asgi.scope": scope,
+    }
+    server = scope.get("server") or ("localhost", 80)
+    environ["SERVER_NAME"] = server[0]
+    environ["SERVER_PORT"] = str(server[1] or 0)
+    client = scope.get("client")
+    if client:
+        environ["REMOTE_ADDR"] = client[0]
+        environ["REMOTE_PORT"] = str(client[1])
+
+    for raw_name, raw_value in scope.get("headers", ()):
+        name = raw_name.decode("latin1").lower()
+        if name == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        value = raw_value.decode("latin1")
+        if key in environ:
+            value = f"{environ[key]},{value}"
+        environ[key] = value
+    return environ
+
+
+class RequestScope:
+    """
+    Request-owned state for one ASGI request.
+
+    Bottle keeps the current request/response in thread-locals, and on an
+    event loop every request shares the loop thread. Entering the scope binds
+    those thread-locals to this request; leaving it copies the response
+    state back out, so the next `with scope:` (possibly after an `await`
+    that let other requests run) resumes exactly where it stopped.
+
+    Code running inside the scope may use the global `request`/`response`
+    proxies. Coroutines that await should use `scope.request` and
+    `scope.response`, which are never shared.
+    """
+
+    __slots__ = ("environ", "request", "response")
+
+    def __init__(self, environ: Dict[str, Any]):
+        self.environ = environ
+        self.request = BaseRequest(environ)
+        self.response = BaseResponse()
+
+    def __enter__(self) -> "RequestScope":
+        request.bind(self.environ)
+        for field in _RESPONSE_FIELDS:
+            setattr(response, field, getattr(self.response, field))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for field in _RESPONSE_FIELDS:
+            setattr(self.response, field, getattr(response, field))
+
+
+class ProboASGIApp:
+    """
+    Native ASGI application for a ProboRouter.
+
+    Routes registered through `ProboRouter.page` carry an `asgi_handler` and
+    are dispatched directly on the event loop: `async def` pages are awaited
+    without a thread hop and streamed pages are sent chunk by chunk as
+    `http.response.body` messages. Blocking work (plain handlers, rendering,
+    sync stream generators) runs on worker threads. Everything else (plain Bottle routes,
+    static files, mounted apps, TCM fallbacks and error pages) runs through
+    the regular WSGI stack in a worker thread, so behaviour is identical to
+    the WSGI entry point.
+
+    Args:
+        router (ProboRouter): The router whose route table is served.
+
+    Example:
+        >>> app = ProboRouter().asgi_app
+        >>> # uvicorn.run(app)
+    """
+
+    __slots__ = ("router",)
+
+    def __init__(self, router):
+        self.router = router
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Dict[str, Any]]],
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"ProboASGIApp cannot handle {scope['type']!r} scopes")
+
+        body = await self._read_body(receive)
+        if body is None:
+            return
+        environ = build_environ(scope, body)
+
+        native = self._match_native(environ)
+        if native is None:
+            loop = asyncio.get_running_loop()
+            await asyncio.to_thread(self._run_wsgi, environ, send, loop)
+            return
+        route, url_args, native_environ = native
+        await self._dispatch(route, url_args, native_environ, send)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes | None:
+        """Buffers the request body. Returns None if the client went away."""
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    def _match_native(self, environ: Dict[str, Any]):
+        """Returns (route, url_args, environ) for natively served routes, else None."""
+        app = self.router.wsgi_app
+        environ = dict(environ)
+        path = environ["bottle.raw_path"] = environ["PATH_INFO"]
+        environ["PATH_INFO"] = path.encode("latin1").decode("utf8", "ignore")
+        try:
+            route, url_args = app.router.match(environ)
+        except HTTPError:
+            return None
+        if not hasattr(route.callback, "asgi_handler"):
+            return None
+        if any(not isinstance(p, _DEFAULT_PLUGINS) for p in route.all_plugins()):
+            # Installed plugins wrap `route.call`; only the WSGI path applies them.
+            return None
+        environ["bottle.app"] = app
+        environ["route.handle"] = environ["bottle.route"] = route
+        environ["route.url_args"] = url_args
+        return route, url_args, environ
+
+    async def _dispatch(self, route, url_args, environ, send) -> None:
+        app = self.router.wsgi_app
+        scope = RequestScope(environ)
+        try:
+            # Inside the try, like Bottle's `_handle`: an abort() or redirect()
+            # raised by a hook becomes the response.
+            with scope:
+                app.trigger_hook("before_request")
+            out = await route.callback.asgi_handler(scope, url_args)
+        except HTTPResponse as exc:
+            out = exc
+        except (KeyboardInterrupt, SystemExit, MemoryError):
+            raise
+        except Exception as exc:
+            if not app.catchall:
+                raise
+            stacktrace = format_exc()
+            environ["wsgi.errors"].write(stacktrace)
+            environ["wsgi.errors"].flush()
+            out = HTTPError(500, "Internal Server Error", exc, stacktrace)
+
+        with scope:
+            if isinstance(out, HTTPResponse):
+                out.apply(response)
+            try:
+                app.trigger_hook("after_request")
+            except HTTPResponse as exc:
+                out = exc
+                out.apply(response)
+            if not hasattr(out, "__aiter__"):
+                out = app._cast(out)
+            if (
+                response._status_code in _BODYLESS_STATUS
+                or environ["REQUEST_METHOD"] == "HEAD"
+            ):
+                if hasattr(out, "close"):
+                    out.close()
+                out = ()
+            status = response._status_code
+            headers = self._encode_headers(response.headerlist)
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        if hasattr(out, "__aiter__"):
+            async for chunk in out:
+                await self._send_chunk(send, chunk)
+        elif isinstance(out, (list, tuple)):
+            for chunk in out:
+                await self._send_chunk(send, chunk)
+        else:
+            # Sync generators (streamed pages) render as they are iterated,
+            # so each chunk is pulled on a worker thread.
+            iterator = iter(out)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(self._next_chunk, scope, iterator)
+                    if chunk is None:
+                        break
+                    await self._send_chunk(send, chunk)
+            finally:
+                if hasattr(out, "close"):
+                    out.close()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    @staticmethod
+    def _next_chunk(scope: RequestScope, iterator) -> Any:
+        with scope:
+            return next(iterator, None)
+
+    @staticmethod
+    async def _send_chunk(send, chunk: str | bytes) -> None:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if chunk:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    @staticmethod
+    def _encode_headers(headerlist: List[Tuple[str, str]]) -> List[Tuple[bytes, bytes]]:
+        return [
+            (name.lower().encode("latin1"), value.encode("latin1"))
+            for name, value in headerlist
+        ]
+
+    def _run_wsgi(self, environ, send, loop) -> None:
+        """Runs the full WSGI stack on this worker thread, relaying each chunk to `send`."""
+
+        def relay(message: Dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        started = {}
+
+        def start_response(status: str, headers, exc_info=None):
+            started["status"] = int(status.split(" ", 1)[0])
+            started["headers"] = self._encode_headers(headers)
+
+        result = self.router(environ, start_response)
+        try:
+            for chunk in result:
+                if "sent" not in started:
+                    relay(self._start_message(started))
+                    started["sent"] = True
+                if chunk:
+                    relay({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        if "sent" not in started:
+            relay(self._start_message(started))
+        relay({"type": "http.response.body", "body": b"", "more_body": False})
+
+    @staticmethod
+    def _start_message(started: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": "http.response.start",
+            "status": started["status"],
+            "headers": started["headers"],
+        }
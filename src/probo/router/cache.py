@@ -1,42 +1,167 @@
+import sys
 import time
-from typing import Any, Dict, Optional, Generator
+import threading
+from collections import OrderedDict
+from urllib.parse import quote, urlencode
+from typing import Any, Dict, Optional, Generator, Iterable, Tuple, Union
+from probo.streaming.streaming import CompressionEngine
+
+
+def estimate_size(value: Any) -> int:
+    """Cheap byte-size estimate used to enforce `max_bytes` limits."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, CachedResponse):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
 
 
 class CacheItem:
-    __slots__ = ("value", "expires_at")
+    __slots__ = ("value", "expires_at", "size")
 
-    def __init__(self, value: Any, ttl: int):
+    def __init__(self, value: Any, ttl: int, size: int = 0):
         self.value = value
         self.expires_at = time.time() + ttl if ttl > 0 else 0
+        self.size = size
 
     def is_expired(self) -> bool:
         if self.expires_at == 0:
             return False
         return time.time() > self.expires_at
 
+
 class ProboCache:
     """
     A lightning-fast, thread-safe In-Memory Cache for Probo.
+
+    Entries live in an LRU-ordered map guarded by a re-entrant lock. The
+    cache can be bounded by entry count and by estimated byte size; once a
+    bound is exceeded the least recently used entries are evicted. Expired
+    entries are dropped lazily on read, by `sweep()`, and optionally by a
+    background sweeper thread.
+
+    Args:
+        max_entries (int, optional): Maximum number of live entries. None means unbounded.
+        max_bytes (int, optional): Maximum total estimated size. None means unbounded.
+        sweep_interval (float): Seconds between background sweeps. 0 disables the thread.
+
+    Example:
+        >>> cache = ProboCache(max_entries=2)
+        >>> cache.set_cache("a", 1); cache.set_cache("b", 2); cache.set_cache("c", 3)
+        >>> cache.get("a") is None
+        True
+        >>> cache.stats()["evictions"]
+        1
     """
 
-    def __init__(self):
-        self._store: Dict[str, CacheItem] = {}
+    __slots__ = (
+        "_store",
+        "_lock",
+        "max_entries",
+        "max_bytes",
+        "sweep_interval",
+        "current_bytes",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "_sweeper",
+        "_stop_event",
+    )
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 0,
+    ):
+        self._store: Dict[str, CacheItem] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        if sweep_interval > 0:
+            self.start_sweeper(sweep_interval)
+
+    def configure(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 0,
+    ) -> "ProboCache":
+        """Re-applies bounds (evicting if needed) and (re)starts the sweeper."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._enforce_bounds()
+        if sweep_interval > 0:
+            self.start_sweeper(sweep_interval)
+        else:
+            self.stop_sweeper()
+        return self
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            item = self._store.get(key)
+            return item is not None and not item.is_expired()
 
     def get(self, key: str) -> Optional[Any]:
         """Retrieves an item if it exists and is not expired."""
-        item = self._store.get(key)
-        if not item:
-            return None
+        with self._lock:
+            item = self._store.get(key)
+            if not item:
+                self.misses += 1
+                return None
 
-        if item.is_expired():
-            del self._store[key]
-            return None
+            if item.is_expired():
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
 
-        return item.value
+            self._store.move_to_end(key)
+            self.hits += 1
+            return item.value
 
     def set_cache(self, key: str, value: Any, ttl: int = 60):
         """Stores an item with a Time-To-Live (TTL) in seconds."""
-        self._store[key] = CacheItem(value, ttl)
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._store:
+                self._discard(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # An entry larger than the whole budget would flush everything.
+                self.evictions += 1
+                return
+            self._store[key] = CacheItem(value, ttl, size)
+            self.current_bytes += size
+            self._enforce_bounds()
+
+    def delete(self, key: str) -> bool:
+        """Removes a single entry. Returns True if it was present."""
+        with self._lock:
+            if key not in self._store:
+                return False
+            self._discard(key)
+            return True
 
     def walk(
         self,
@@ -44,22 +169,200 @@ class ProboCache:
         on_values: bool = False,
         on_items: bool = False,
     ) -> Generator:
+        with self._lock:
+            snapshot = list(self._store.items())
         if on_keys:
-            yield from (item for item in self._store.keys())
+            yield from (k for k, _ in snapshot)
         if on_values:
-            yield from (item for item in self._store.values())
+            yield from (v for _, v in snapshot)
         if on_items:
-            yield from (item for item in self._store.items())
+            yield from snapshot
 
     def clear(self):
         """Flushes the entire cache."""
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self.current_bytes = 0
 
-    def sweep(self):
+    def sweep(self) -> int:
         """Background task to remove dead cache items and free RAM."""
         now = time.time()
-        expired_keys = [
-            k for k, v in self._store.items() if v.expires_at > 0 and now > v.expires_at
-        ]
-        for k in expired_keys:
-            del self._store[k]
+        with self._lock:
+            expired_keys = [
+                k
+                for k, v in self._store.items()
+                if v.expires_at > 0 and now > v.expires_at
+            ]
+            for k in expired_keys:
+                self._discard(k)
+            self.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of the cache counters for metrics scraping."""
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def start_sweeper(self, interval: float) -> None:
+        """Starts (or retunes) a daemon thread that calls `sweep()` every `interval` seconds."""
+        self.sweep_interval = interval
+        if self._sweeper and self._sweeper.is_alive():
+            return
+        self._stop_event.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop, name="probo-cache-sweeper", daemon=True
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self.sweep_interval = 0
+        self._stop_event.set()
+        if self._sweeper and self._sweeper is not threading.current_thread():
+            self._sweeper.join(timeout=1)
+        self._sweeper = None
+
+    def _sweep_loop(self) -> None:
+        while not self._stop_event.wait(self.sweep_interval or 1):
+            self.sweep()
+
+    def _discard(self, key: str) -> None:
+        item = self._store.pop(key)
+        self.current_bytes -= item.size
+
+    def _enforce_bounds(self) -> None:
+        """Evicts least recently used entries until both bounds hold. Caller holds the lock."""
+        while self._store and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            _, item = self._store.popitem(last=False)
+            self.current_bytes -= item.size
+            self.evictions += 1
+
+
+class CachedResponse:
+    """A fully encoded response body, ready to be replayed without rendering."""
+
+    __slots__ = ("body", "gzip_body", "headers", "status", "etag")
+
+    def __init__(
+        self,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        status: int = 200,
+        gzip_body: Optional[bytes] = None,
+        etag: Optional[str] = None,
+    ):
+        self.body = body
+        self.gzip_body = gzip_body
+        self.headers = headers or {}
+        self.status = status
+        self.etag = etag
+
+    def __len__(self) -> int:
+        return len(self.body) + len(self.gzip_body or b"")
+
+
+class ResponseCache:
+    """
+    A Vary-aware full-response cache layered on a ProboCache store.
+
+    Keys are built from the request path, a selection of query parameters
+    and the values of the declared Vary headers, so `/search?q=a` and
+    `/search?q=b` never collide. Entries hold the final encoded body (and
+    an optional gzipped copy) plus headers, so a hit bypasses rendering,
+    template wrapping and compression entirely.
+
+    Args:
+        store (ProboCache): The backing cache engine (bounds and TTL live there).
+        namespace (str): Key prefix separating response entries from other data.
+
+    Example:
+        >>> rc = ResponseCache(ProboCache())
+        >>> key = rc.build_key("/search", [("q", "a")], {"HX-Request": ""})
+        >>> rc.set(key, "<p>a</p>", ttl=60).body
+        b'<p>a</p>'
+    """
+
+    __slots__ = ("store", "namespace")
+
+    def __init__(self, store: ProboCache, namespace: str = "route"):
+        self.store = store
+        self.namespace = namespace
+
+    def build_key(
+        self,
+        path: str,
+        query_items: Iterable[Tuple[str, str]] = (),
+        headers: Optional[Any] = None,
+        query_params: Optional[Iterable[str]] = None,
+        vary: Iterable[str] = (),
+    ) -> str:
+        """Builds a deterministic cache key for one request variant.
+
+        Args:
+            path (str): The concrete request path (not the route pattern).
+            query_items: (name, value) pairs of the query string, duplicates allowed.
+            headers: Any mapping with a `.get()` method holding request headers.
+            query_params: Names of the query params that affect the output.
+                None keeps every param; an empty iterable ignores the query string.
+            vary: Header names whose values select a distinct variant.
+        """
+        if query_params is not None:
+            allowed = set(query_params)
+            query_items = [(k, v) for k, v in query_items if k in allowed]
+        # Every part is percent-encoded, so the `?`, `&`, `=` and `|`
+        # separators can only come from the key layout, never from a request.
+        key = f"{self.namespace}:{quote(path, safe='/')}"
+        query = urlencode(sorted(query_items))
+        if query:
+            key = f"{key}?{query}"
+        if vary:
+            headers = headers or {}
+            key += "|" + urlencode(
+                [(name.lower(), headers.get(name, "")) for name in sorted(vary)]
+            )
+        return key
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        cached = self.store.get(key)
+        return cached if isinstance(cached, CachedResponse) else None
+
+    def set(
+        self,
+        key: str,
+        body: Union[str, bytes],
+        ttl: int = 60,
+        headers: Optional[Dict[str, str]] = None,
+        status: int = 200,
+        compress: bool = False,
+        compress_level: int = 6,
+        compress_min_size: int = 0,
+        etag: Optional[str] = None,
+    ) -> CachedResponse:
+        """Encodes (and optionally gzips) a body once and stores it under `key`.
+
+        The optional `etag` is stored alongside so conditional requests can
+        be answered from the entry without touching the body.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        gzip_body = (
+            CompressionEngine(compress_level, min_size=compress_min_size).compress_body(body)
+            if compress
+            else None
+        )
+        entry = CachedResponse(bytes(body), headers, status, gzip_body, etag)
+        self.store.set_cache(key, entry, ttl=ttl)
+        return entry
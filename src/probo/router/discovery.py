@@ -1,7 +1,12 @@
 import os,sys
 import importlib.util
+import inspect
 import logging
-from typing import Dict, Callable, Any
+import json
+import threading
+from typing import Dict, Callable, Any, List, Optional, Tuple, Union
+from probo.templates.loader import template_loader
+from probo.router.manifest import DiscoveryManifest, ROUTERS_SECTION, describe_handler, pages_section
 
 logger = logging.getLogger("probo.discovery")
 
@@ -46,14 +51,233 @@ def _get_py_files(target_path: str) -> list:
     return py_files
 
 
+def _import_module(py_file_path: str, module_name: str) -> Any:
+    """Executes `py_file_path` as `module_name` and registers it in sys.modules."""
+    spec = importlib.util.spec_from_file_location(module_name, py_file_path)
+    if not (spec and spec.loader):
+        return None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    sys.modules[module_name] = mod
+    return mod
+
+
+def _template_component(mod: Any, prb_file_str: str) -> Callable:
+    """Builds the page callable for a module exporting `__prb_file__`."""
+    from probo.context.context_logic import TemplateProcessor
+
+    def resolve_template_context():
+        ctx = getattr(mod, "__prb_context_dict__", {})
+        if not isinstance(ctx, dict): ctx = {}
+        context_func = getattr(mod, "__prb_context__", None)
+        if callable(context_func):
+            dynamic_ctx = context_func()
+            if isinstance(dynamic_ctx, dict):
+                ctx = {**ctx, **dynamic_ctx}
+        return ctx
+
+    def generated_component():
+        processor = TemplateProcessor(**resolve_template_context())
+        return processor.render_template(template_loader.source(prb_file_str))
+
+    template_loader.warm(prb_file_str)
+    return generated_component
+
+
+def _module_routes(
+    mod: Any, stem: str, target: str | None, include_in_path: bool
+) -> Optional[List[Tuple[str, int, Any]]]:
+    """
+    Returns the `(full_path, index, route)` entries a page module exports, or
+    None if it exports nothing. `route` is the magic template callable (index
+    0) or the ProboRoute at `index` in the exported list.
+    """
+    prb_callable = None
+    exported_routes = []
+
+    # Look for Django-style prefix
+    prefix = getattr(mod, "app_name", "")
+    if prefix and not prefix.startswith("/"):
+        prefix = "/" + prefix
+    if prefix and not prefix.endswith("/"):
+        prefix = prefix+"/"
+
+    # 1. Check for the Parse Magic Variable
+    if not target:
+        prb_file = getattr(mod, "__prb_file__", getattr(mod, "__prb_html__", None))
+
+        if prb_file:
+            prb_file_str = str(prb_file)
+            if not prefix:
+                prefix = prb_file_str if "." not in prb_file_str else prb_file_str.split('.')[0]
+            prb_callable = _template_component(mod, prb_file_str)
+
+    # 2. Grab standard routes if no template magic is found
+    if include_in_path and target:
+
+        prefix =(f"/{str(target)}/")
+    if not prb_callable:
+        if target:
+            # If target is provided (e.g., target="xyz"), grab that exact list!
+            exported_routes = getattr(mod, target, [])
+        if not exported_routes:
+            # Default fallback
+
+            exported_routes = getattr(mod, "routes", getattr(mod, "url_patterns", []))
+
+        if not exported_routes:
+            return None
+
+    # 3. Map Magic Template Callable
+    if prb_callable:
+        r_path = f"/{stem}/" if stem != "home" else "/"
+        full_path = (
+            f"{prefix}{r_path}".replace("//", "/")
+            if include_in_path
+            else f"{r_path}".replace("//", "/")
+        )
+        return [(full_path if full_path else "/", 0, prb_callable)]
+
+    # 4. Map Explicit Routes List
+    entries = []
+    for index, r in enumerate(exported_routes):
+        if isinstance(r, ProboRoute):
+            r_path = r.path
+            if not r_path.startswith("/") and not (prefix and r_path == ""):
+                r_path = "/" + r_path
+            if not r_path.endswith("/") and not (prefix and r_path == ""):
+                r_path = r_path+"/"
+
+            full_path = (
+                f"{prefix}{r_path}".replace("//", "/")
+                if include_in_path
+                else f"{r_path}".replace("//", "/")
+            )
+            entries.append((full_path if full_path else "/", index, r))
+    return entries
+
+
+class LazyPage:
+    """
+    A page handler recorded in a `DiscoveryManifest` whose module is only
+    imported when the page is first requested.
+
+    `resolve()` imports the module once (reusing it if discovery or another
+    page already did), re-runs the discovery rules on it and returns the
+    real handler. Concurrent first requests import the module only once.
+
+    Attributes:
+        py_file (str): The page module.
+        index (int): Position of the route in the module's exported list.
+        resolved (bool): Whether the module was imported yet.
+    """
+
+    __slots__ = ("py_file", "module_name", "stem", "target", "include_in_path", "index", "_handler", "_lock")
+
+    def __init__(self, py_file: str, target: str | None, include_in_path: bool, index: int):
+        self.py_file = py_file
+        self.stem = os.path.splitext(os.path.basename(py_file))[0]
+        self.module_name = f"probo_auto_{self.stem}"
+        self.target = target
+        self.include_in_path = include_in_path
+        self.index = index
+        self._handler: Optional[Callable] = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        return self._handler is not None
+
+    def resolve(self) -> Callable:
+        """Returns the real handler, importing its module on first use.
+
+        Raises:
+            LookupError: If the module no longer exports the route.
+        """
+        handler = self._handler
+        if handler is not None:
+            return handler
+        with self._lock:
+            if self._handler is None:
+                mod = sys.modules.get(self.module_name)
+                if mod is None or getattr(mod, "__file__", None) != self.py_file:
+                    mod = _import_module(self.py_file, self.module_name)
+                for _, index, r in _module_routes(mod, self.stem, self.target, self.include_in_path) or ():
+                    if index == self.index:
+                        self._handler = r.component if isinstance(r, ProboRoute) else r
+                        break
+                else:
+                    raise LookupError(f"{self.py_file} no longer exports route #{self.index}")
+            return self._handler
+
+
+def _lazy_handler(page: LazyPage, name: str, params: List[List[str]], is_async: bool) -> Callable:
+    """A stand-in with the recorded signature that `ProboRouter.page` inspects,
+    forwarding calls to the handler resolved by `page`."""
+    if is_async:
+        async def handler(*args, **kwargs):
+            return await page.resolve()(*args, **kwargs)
+    else:
+        def handler(*args, **kwargs):
+            return page.resolve()(*args, **kwargs)
+
+    handler.__name__ = handler.__qualname__ = name
+    handler.__signature__ = inspect.Signature(
+        [inspect.Parameter(param, getattr(inspect.Parameter, kind)) for param, kind in params]
+    )
+    handler.lazy_page = page
+    return handler
+
+
+def _describe_routes(entries: List[Tuple[str, int, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """The manifest records for a module's routes, or None if one of them
+    cannot be restored without the module (e.g. non-JSON route options)."""
+    records = []
+    for full_path, index, r in entries:
+        component = r.component if isinstance(r, ProboRoute) else r
+        described = describe_handler(component)
+        if described is None:
+            return None
+        record = {
+            "path": full_path,
+            "index": index,
+            "handler": getattr(component, "__name__", "page"),
+            "params": described[0],
+            "is_async": described[1],
+        }
+        if isinstance(r, ProboRoute):
+            try:
+                json.dumps(r.kwargs)
+            except (TypeError, ValueError):
+                return None
+            record["route"] = {"path": r.path, "kwargs": r.kwargs}
+        records.append(record)
+    return records
+
+
+def _manifest(manifest: Union[str, os.PathLike, DiscoveryManifest, None]) -> Optional[DiscoveryManifest]:
+    if manifest is None or isinstance(manifest, DiscoveryManifest):
+        return manifest
+    return DiscoveryManifest(manifest)
+
+
 def discover_pages(
     *directories: str, target: str | None = None,include_in_path:bool=False,
+    manifest: Union[str, os.PathLike, DiscoveryManifest, None] = None,
 ) -> Dict[str, Any]:
     """
     Next.js + Django style Auto-Discovery.
     Scans directories OR single files for 'routes' or 'url_patterns'.
+
+    With a `manifest` (a path or a `DiscoveryManifest`), modules unchanged
+    since the manifest was written are not imported: their routes are
+    registered from the manifest with `LazyPage` handlers that import the
+    module on the first request. Changed or new modules are imported and
+    recorded, and the manifest is saved before returning.
     """
     master_routes: Dict[str, Any] = {}
+    manifest = _manifest(manifest)
+    section = pages_section(target, include_in_path)
 
     for directory in directories:
         py_files = _get_py_files(directory)
@@ -67,111 +291,65 @@ def discover_pages(
             stem = os.path.splitext(py_file)[0]
             module_name = f"probo_auto_{stem}"
 
+            fingerprint = None
+            if manifest is not None:
+                fingerprint = manifest.fingerprint(py_file_path)
+                entry = manifest.lookup(section, py_file_path, fingerprint)
+                if entry is not None and entry.get("routes") is not None:
+                    for record in entry["routes"]:
+                        page = LazyPage(py_file_path, target, include_in_path, record["index"])
+                        handler = _lazy_handler(page, record["handler"], record["params"], record["is_async"])
+                        route_info = record.get("route")
+                        master_routes[record["path"]] = (
+                            handler if route_info is None
+                            else ProboRoute(route_info["path"], handler, **route_info["kwargs"])
+                        )
+                    continue
+
             try:
                 # Dynamically import the file
-                spec = importlib.util.spec_from_file_location(module_name, py_file_path)
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    sys.modules[module_name] = mod
-
-                    prb_callable = None
-                    exported_routes = []
-
-                    # Look for Django-style prefix
-                    prefix = getattr(mod, "app_name", "")
-                    if prefix and not prefix.startswith("/"):
-                        prefix = "/" + prefix
-                    if prefix and not prefix.endswith("/"):
-                        prefix = prefix+"/"
-
-                    # 1. Check for the Parse Magic Variable
-                    if not target:
-                        prb_file = getattr(mod, "__prb_file__", getattr(mod, "__prb_html__", None))
-
-                        if prb_file:
-                            prb_file_str = str(prb_file)
-                            if not prefix:
-                                prefix = prb_file_str if "." not in prb_file_str else prb_file_str.split('.')[0]
-                            # FIX: Isolate the template logic
-                            from probo.context.context_logic import TemplateProcessor
-
-                            def resolve_template_context():
-                                ctx = getattr(mod, "__prb_context_dict__", {})
-                                if not isinstance(ctx, dict): ctx = {}
-                                context_func = getattr(mod, "__prb_context__", None)
-                                if callable(context_func):
-                                    dynamic_ctx = context_func()
-                                    if isinstance(dynamic_ctx, dict):
-                                        ctx = {**ctx, **dynamic_ctx}
-                                return ctx
-
-                            def generated_component():
-                                processor = TemplateProcessor(**resolve_template_context())
-                                with open(prb_file_str, "r") as f:
-                                    return processor.render_template(f.read())
-
-                            prb_callable = generated_component
-
-                    # 2. Grab standard routes if no template magic is found
-                    if include_in_path and target:
-
-                        prefix =(f"/{str(target)}/") 
-                    if not prb_callable:
-                        if target:
-                            # If target is provided (e.g., target="xyz"), grab that exact list!
-                            exported_routes = getattr(mod, target, [])
-                        if not exported_routes:
-                            # Default fallback
-
-                            exported_routes = getattr(mod, "routes", getattr(mod, "url_patterns", []))
-
-                        if not exported_routes:
-                            continue
-
-                    # 3. Map Magic Template Callable (FIX: Moved outside the for-loop!)
-                    if prb_callable:
-                        r_path = f"/{stem}/" if stem != "home" else "/"
-                        full_path = (
-                            f"{prefix}{r_path}".replace("//", "/")
-                            if include_in_path
-                            else f"{r_path}".replace("//", "/")
+                mod = _import_module(py_file_path, module_name)
+                if mod is not None:
+                    entries = _module_routes(mod, stem, target, include_in_path)
+                    if manifest is not None:
+                        # Modules that cannot be described are recorded as such
+                        # (routes=None) and imported on every discovery.
+                        manifest.record(
+                            section, py_file_path, fingerprint,
+                            routes=_describe_routes(entries) if entries else [],
                         )
-                        master_routes[full_path if full_path else "/"] = prb_callable
-                        logger.info(f"Discovered Magic Template Route in {py_file}")
+                    if entries is None:
                         continue
 
-                    # 4. Map Explicit Routes List
-                    for r in exported_routes:
-                        if isinstance(r, ProboRoute):
-                            r_path = r.path
-                            if not r_path.startswith("/") and not (prefix and r_path == ""):
-                                r_path = "/" + r_path
-                            if not r_path.endswith("/") and not (prefix and r_path == ""):
-                                r_path = r_path+"/"
-
-                            full_path = (
-                                f"{prefix}{r_path}".replace("//", "/")
-                                if include_in_path
-                                else f"{r_path}".replace("//", "/")
-                            )
-                            master_routes[full_path if full_path else "/"] = r
-
-                    logger.info(f"Discovered {len(exported_routes)} routes in {py_file}")
+                    for full_path, _, r in entries:
+                        master_routes[full_path] = r
+                    if entries and not isinstance(entries[0][2], ProboRoute):
+                        logger.info(f"Discovered Magic Template Route in {py_file}")
+                    else:
+                        logger.info(f"Discovered {len(entries)} routes in {py_file}")
 
             except Exception as e:
                 logger.error(f"Failed to load {py_file_path}: {e}")
 
+    if manifest is not None:
+        manifest.save()
     return master_routes
 
-def discover_routers(*directories: str) -> list:
+def discover_routers(
+    *directories: str, manifest: Union[str, os.PathLike, DiscoveryManifest, None] = None
+) -> list:
     """
     Scans directories OR single files for fully instantiated ProboRouter objects.
+
+    Routers have to exist to be mounted, so modules that define one are
+    always imported; with a `manifest`, unchanged modules that defined no
+    router are skipped without being imported.
     """
     # Inline import to prevent circular dependencies
     from probo.router.router import ProboRouter
 
     found_routers = []
+    manifest = _manifest(manifest)
 
     for directory in directories:
         py_files = _get_py_files(directory)
@@ -181,20 +359,29 @@ def discover_routers(*directories: str) -> list:
             stem = os.path.splitext(py_file)[0]
             module_name = f"probo_auto_router_{stem}"
 
-            try:
-                spec = importlib.util.spec_from_file_location(module_name, py_file_path)
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    sys.modules[module_name] = mod
+            fingerprint = entry = None
+            if manifest is not None:
+                fingerprint = manifest.fingerprint(py_file_path)
+                entry = manifest.lookup(ROUTERS_SECTION, py_file_path, fingerprint)
+                if entry is not None and not entry.get("routers"):
+                    continue
 
+            try:
+                mod = _import_module(py_file_path, module_name)
+                if mod is not None:
+                    found = 0
                     for name, obj in vars(mod).items():
                         if isinstance(obj, ProboRouter):
                             found_routers.append(obj)
+                            found += 1
                             logger.info(
                                 f"Discovered Sub-Router '{obj.app_name}' in {py_file}"
                             )
+                    if manifest is not None and entry is None:
+                        manifest.record(ROUTERS_SECTION, py_file_path, fingerprint, routers=found)
             except Exception as e:
                 logger.error(f"Failed to load Sub-Router from {py_file_path}: {e}")
 
+    if manifest is not None:
+        manifest.save()
     return found_routers
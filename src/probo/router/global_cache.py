@@ -1,8 +1,42 @@
-from probo.router.cache import ProboCache 
+from probo.router.cache import ProboCache
+from probo.router.settings import RouterSettings
+from probo.templates.loader import file_fingerprint
 import os, hashlib
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+_defaults = RouterSettings()
+global_cache = ProboCache(
+    max_entries=_defaults.CACHE_MAX_ENTRIES,
+    max_bytes=_defaults.CACHE_MAX_BYTES,
+)
+_applied_cache_settings: Optional[Tuple] = None
+
+
+def configure_global_cache(settings: RouterSettings, explicit: bool = True) -> ProboCache:
+    """Applies the CACHE_* bounds and sweep interval of `settings` to `global_cache`.
+
+    Every ProboRouter calls it on construction. A router built with explicit
+    settings applies them; one built with the defaults (typically a
+    sub-router) only does so while nothing configured the cache yet, so it
+    cannot undo the app's configuration. Applying the values already in
+    force does nothing, leaving the sweeper thread alone.
+
+    Args:
+        settings (RouterSettings): The settings to read the bounds from.
+        explicit (bool): False when `settings` are the defaults rather than
+            settings the caller passed.
+    """
+    global _applied_cache_settings
+    wanted = (settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_BYTES, settings.CACHE_SWEEP_INTERVAL)
+    if wanted == _applied_cache_settings or (not explicit and _applied_cache_settings is not None):
+        return global_cache
+    _applied_cache_settings = wanted
+    return global_cache.configure(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        sweep_interval=settings.CACHE_SWEEP_INTERVAL,
+    )
 
-global_cache = ProboCache()
 
 def file_hash(filepath: str) -> str:
     """Generates an MD5 hash of a file's contents to detect changes."""
@@ -11,14 +45,92 @@ def file_hash(filepath: str) -> str:
     with open(filepath, "rb") as f:
         return hashlib.md5(f.read()).hexdigest()
 
+
+class FileFreshness:
+    """
+    Decides whether files changed from their stat fingerprint, hashing
+    content only when the fingerprint moves.
+
+    The fingerprint is `(st_ino, st_size, st_mtime_ns)`: a save, a rename
+    over the file or a truncation all change it, while an unchanged file
+    costs one `os.stat` instead of a full read plus MD5. A file modified
+    less than two seconds before it was hashed is re-hashed on its next
+    check, since a second write within the same timestamp tick would keep
+    the fingerprint.
+
+    In frozen mode (production, after warmup) a file that was seen once is
+    never checked again: its last content hash is returned without a stat.
+
+    Args:
+        frozen (bool): Start in frozen mode.
+
+    Attributes:
+        stat_calls (int): `os.stat` calls made.
+        hash_calls (int): Files read and hashed.
+
+    Example:
+        >>> freshness = FileFreshness()
+        >>> freshness.version("pages/home.html")  # stat + hash
+        >>> freshness.version("pages/home.html")  # stat only
+        >>> freshness.freeze()
+        >>> freshness.version("pages/home.html")  # neither
+    """
+
+    __slots__ = ("_entries", "frozen", "stat_calls", "hash_calls")
+
+    def __init__(self, frozen: bool = False):
+        self._entries: Dict[str, Tuple[Optional[Tuple[int, int, int]], str]] = {}
+        self.frozen = frozen
+        self.stat_calls = 0
+        self.hash_calls = 0
+
+    def version(self, filepath: str) -> str:
+        """Returns the content hash of `filepath`, or "" if it does not exist."""
+        entry = self._entries.get(filepath)
+        if entry is not None and self.frozen:
+            return entry[1]
+        self.stat_calls += 1
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            self._entries.pop(filepath, None)
+            return ""
+        if entry is not None and entry[0] == (st.st_ino, st.st_size, st.st_mtime_ns):
+            return entry[1]
+        self.hash_calls += 1
+        digest = file_hash(filepath)
+        self._entries[filepath] = (file_fingerprint(st), digest)
+        return digest
+
+    def freeze(self) -> "FileFreshness":
+        """Stops checking files that were already seen."""
+        self.frozen = True
+        return self
+
+    def thaw(self) -> "FileFreshness":
+        """Resumes stat checks on every call."""
+        self.frozen = False
+        return self
+
+    def forget(self, filepath: Optional[str] = None) -> None:
+        """Drops what is known about `filepath` (every file when omitted),
+        so its next check reads and hashes it again."""
+        if filepath is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(filepath, None)
+
+
+file_freshness = FileFreshness()
+
 def get_or_render(filepath: str, render_func=None, ttl: int = 86400) -> Optional[str]:
     """
     Checks the global cache for a file's rendered output.
-    If the file hasn't changed (based on hash), returns the cached HTML.
+    If the file hasn't changed (see `FileFreshness`), returns the cached HTML.
     Otherwise, calls render_func(), caches the new HTML, and returns it.
     """
     key = f"file:{filepath}"
-    current_hash = file_hash(filepath)
+    current_hash = file_freshness.version(filepath)
     global global_cache
     cached = global_cache.get(key)
 
@@ -1,3 +1,4 @@
+import hashlib
 from bottle import request as _request
 from bottle import response as _response
 from bottle import redirect, abort, static_file
@@ -71,3 +72,31 @@ def save_upload(key: str, save_path: str, overwrite: bool = False):
         upload.save(save_path, overwrite=overwrite)
         return True
     return False
+
+
+def make_etag(body: str | bytes, weak: bool = False) -> str:
+    """
+    Builds a quoted ETag from a response body.
+    Strong tags change with every byte; weak tags (W/"...") only promise
+    semantic equivalence and survive re-encoding such as gzip.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    tag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag (RFC 9110).
+    Handles '*' and comma-separated lists of tags.
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,136 @@
+import inspect
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from probo.templates.loader import file_fingerprint
+
+logger = logging.getLogger("probo.discovery")
+
+
+class DiscoveryManifest:
+    """
+    An on-disk record of what discovery found in each module, so workers
+    can register routes without importing the modules.
+
+    Entries are kept per discovery section (`discover_pages` with its
+    `target`/`include_in_path` options, or `discover_routers`) and per file,
+    next to the file's `(st_ino, st_size, st_mtime_ns)` fingerprint. A file
+    whose fingerprint changed is imported again and its entry rebuilt; the
+    others are served from the manifest. Only the page files themselves are
+    fingerprinted: delete the manifest after changing a helper module that
+    a page builds its `routes` from.
+
+    The file is JSON, written atomically (temporary file + `os.replace`),
+    so gunicorn workers starting together never read a partial manifest.
+    An unreadable or outdated manifest is treated as empty.
+
+    Args:
+        path (str): Where the manifest is stored.
+
+    Attributes:
+        reused (int): Files served from the manifest.
+        rebuilt (int): Files imported and recorded.
+
+    Example:
+        >>> manifest = DiscoveryManifest(".probo/discovery.json")
+        >>> routes = discover_pages("pages", manifest=manifest)  # imports only changed files
+    """
+
+    VERSION = 1
+
+    __slots__ = ("path", "_sections", "_dirty", "reused", "rebuilt")
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+        self._sections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirty = False
+        self.reused = 0
+        self.rebuilt = 0
+        self._read()
+
+    def fingerprint(self, py_file: str) -> Optional[List[int]]:
+        """The fingerprint to record for `py_file`, or None if it cannot be
+        trusted yet (missing, or modified within the racy window)."""
+        try:
+            fingerprint = file_fingerprint(os.stat(py_file))
+        except OSError:
+            return None
+        return list(fingerprint) if fingerprint is not None else None
+
+    def lookup(self, section: str, py_file: str, fingerprint: Optional[List[int]]) -> Optional[Dict[str, Any]]:
+        """Returns the recorded entry for `py_file` if its fingerprint still matches."""
+        if fingerprint is None:
+            return None
+        entry = self._sections.get(section, {}).get(py_file)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        self.reused += 1
+        return entry
+
+    def record(self, section: str, py_file: str, fingerprint: Optional[List[int]], **entry: Any) -> None:
+        """Stores what discovery found in `py_file`. Files without a trusted
+        fingerprint are not recorded, so they are imported next time too."""
+        self.rebuilt += 1
+        if fingerprint is None:
+            return
+        self._sections.setdefault(section, {})[py_file] = {"fingerprint": fingerprint, **entry}
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Writes the manifest if anything was recorded. Returns True if it was written."""
+        if not self._dirty:
+            return False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".probo-manifest-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "sections": self._sections}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._dirty = False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "files": sum(len(files) for files in self._sections.values()),
+            "reused": self.reused,
+            "rebuilt": self.rebuilt,
+        }
+
+    def _read(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable discovery manifest {self.path}: {e}")
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION and isinstance(data.get("sections"), dict):
+            self._sections = data["sections"]
+
+
+def pages_section(target: Optional[str], include_in_path: bool) -> str:
+    """The manifest section for one set of `discover_pages` options."""
+    return f"pages:{target or ''}:{int(bool(include_in_path))}"
+
+
+ROUTERS_SECTION = "routers"
+
+
+def describe_handler(component: Any) -> Optional[Tuple[List[List[str]], bool]]:
+    """The parameter (name, kind) pairs and coroutine flag `ProboRouter.page`
+    reads from a handler, or None if its signature cannot be inspected."""
+    try:
+        signature = inspect.signature(component)
+    except (TypeError, ValueError):
+        return None
+    params = [[name, param.kind.name] for name, param in signature.parameters.items()]
+    return params, inspect.iscoroutinefunction(component)
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Any, Self
+from typing import Any, Dict, Optional, Self
 from probo.router.global_cache import global_cache
 
 class RouterPayload:
@@ -8,11 +8,26 @@ class RouterPayload:
     SSDOM Payload Handler (Modernized v1.3.4).
     Mirrors JS DOM functionalities by tracking component state changes
     via hashing. Now powered by ProboCache to prevent memory leaks!
+
+    Components are rendered lazily: registering them (at construction or
+    with `load`) costs nothing, and they are rendered and hashed the first
+    time the diff or a response is requested.
+
+    Baselines (the last hash sent for a component) live in `global_cache`,
+    which bounds them. A payload created with `for_client` compares against,
+    and updates, that client's own baselines, so concurrent clients never
+    overwrite each other's; a plain payload uses the shared baseline.
+
+    Example:
+        >>> payload = RouterPayload(**{f"card-{i}": Card(i) for i in range(1000)})  # nothing rendered
+        >>> payload.for_client(session_id, sidebar=sidebar).get_response("json")  # renders the sidebar only
     """
 
     __slots__ = (
         "payloads",
-        "diff",
+        "client",
+        "_diff",
+        "_pending",
     )
 
     def __init__(self, **payloads: Any) -> None:
@@ -21,17 +36,37 @@ class RouterPayload:
                          value is the component object.
         """
         self.payloads = payloads
-        self.diff = {}
-        self._process_payloads(**payloads)
+        self.client: Optional[str] = None
+        self._diff: Dict[str, Dict[str, str]] = {}
+        self._pending = dict.fromkeys(payloads)
+
+    @property
+    def diff(self) -> Dict[str, Dict[str, str]]:
+        """The changed components, rendering any that are still pending."""
+        if self._pending:
+            self._process_payloads(**{cid: self.payloads[cid] for cid in self._pending})
+        return self._diff
+
+    def for_client(self, client: str, **payloads: Any) -> "RouterPayload":
+        """A payload of `payloads` diffed against `client`'s own baselines."""
+        payload = RouterPayload(**payloads)
+        payload.client = client
+        return payload
 
     def clear_cache(self):
         global_cache.clear()
         self.payloads.clear()
-        self.diff.clear()
+        self._diff.clear()
+        self._pending.clear()
         return self
     def _generate_hash(self, content: str) -> str:
         """Creates a unique fingerprint for a component's rendered output."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_key(self, cid: str) -> str:
+        if self.client is None:
+            return f"payload::{cid}"
+        return f"payload:{self.client}::{cid}"
 
     def _process_payloads(self, **payloads):
         """
@@ -41,25 +76,27 @@ class RouterPayload:
         raw_payloads = payloads or self.payloads
 
         for cid, component in raw_payloads.items():
+            self._pending.pop(cid, None)
             # Render the component using ProboUI's rendering logic
             rendered_content = (
                 component.render() if hasattr(component, "render") else str(component)
             )
             new_hash = self._generate_hash(rendered_content)
 
-            cache_key = f"payload::{cid}"
+            cache_key = self._cache_key(cid)
             old_hash = global_cache.get(cache_key)
 
             # Check if state has changed
             if old_hash != new_hash:
-                self.diff[cid] = {"content": rendered_content, "hash": new_hash}
+                self._diff[cid] = {"content": rendered_content, "hash": new_hash}
                 # Update the cache with the new state (e.g., 24 hour TTL to prevent infinite bloat)
                 global_cache.set_cache(cache_key, new_hash, ttl=86400)
 
     def get_json_response(self) -> str:
         """Returns only the components that have changed in JSON format."""
+        diff = self.diff
         return json.dumps(
-            {"status": "update" if self.diff else "no-change", "payload": self.diff}
+            {"status": "update" if diff else "no-change", "payload": diff}
         )
 
     def get_xml_response(self) -> str:
@@ -72,10 +109,11 @@ class RouterPayload:
 
         return f'<ssdom_update>{"".join(xml_fragments)}</ssdom_update>'
 
-    def load(self, **new_loads):
-        """Dynamically loads new payloads for diffing."""
-        self._process_payloads(**new_loads)
-        return None
+    def load(self, **new_loads) -> Self:
+        """Registers new payloads for diffing; they are rendered when the diff is requested."""
+        self.payloads.update(new_loads)
+        self._pending.update(dict.fromkeys(new_loads))
+        return self
 
     def get_response(self, response_type: str) -> str:
         """Dynamically routes to the correct formatting function."""
@@ -1,11 +1,11 @@
-import gzip
 import json
 from typing import Any, Dict, Generator
+from probo.streaming.streaming import CompressionEngine
 
 
-def gzip_response(body: str, response) -> bytes:
+def gzip_response(body: str | bytes, response, compress_level: int = 6) -> bytes:
     """Compresses a string body using GZIP and sets appropriate headers."""
-    compressed = gzip.compress(body.encode("utf-8"))
+    compressed = CompressionEngine(compress_level).compress_body(body)
     response.set_header("Content-Encoding", "gzip")
     response.set_header("Content-Length", str(len(compressed)))
     return compressed
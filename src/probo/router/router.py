@@ -1,20 +1,28 @@
 import os
+import asyncio
+import secrets
 import inspect
 import importlib.util
 from functools import wraps
-from typing import Callable, Dict, Any, Union, Iterable
+from typing import TYPE_CHECKING, Callable, Dict, Any, Union, Iterable
 import dataclasses
 
 from bottle import Bottle, request, response, run, static_file
-from asgiref.wsgi import WsgiToAsgi
 from typing import Self
 
 from probo.components.elements import Template
 from probo.context import TemplateComponentMap
 from probo.router.payload import RouterPayload
-from probo.router.global_cache import global_cache
+from probo.router.global_cache import configure_global_cache, file_freshness, global_cache
+from probo.templates.loader import template_loader
+from probo.router.cache import ResponseCache, CachedResponse
 from probo.router.settings import RouterSettings
-from probo.router.responses import gzip_response
+from probo.router.tcm_routes import TCMRouteTable
+from probo.streaming.streaming import CompressionEngine
+from probo.router.http import make_etag, etag_matches
+
+if TYPE_CHECKING:
+    from probo.router.asgi import ProboASGIApp
 
 
 class ProboRouter:
@@ -34,11 +42,18 @@ class ProboRouter:
         "pages_dir",
         "routes",
         "tcm",
+        "tcm_routes",
         "document_template",
         "payload",
         "settings",
         "error_pages",
         "prefix",
+        "response_cache",
+    )
+
+    # Headers that are recomputed per response and never replayed from cache.
+    _UNCACHED_HEADERS = frozenset(
+        ("Content-Length", "Content-Encoding", "Vary", "Set-Cookie")
     )
 
     def __init__(
@@ -65,16 +80,22 @@ class ProboRouter:
         self.pages_dir = pages_dir
         self.routes: Dict[str, Any] = {}
         self.tcm: TemplateComponentMap = TemplateComponentMap()
+        self.tcm_routes = TCMRouteTable(
+            memoize=self.settings.TCM_MEMOIZE,
+            max_entries=self.settings.TCM_MAX_ENTRIES,
+        )
         self.error_pages = {}
         self.document_template = base_template or Template()
 
-        self.payload = (
-            RouterPayload(**self.tcm.url_name_comp)
-            if self.tcm.url_name_comp
-            else RouterPayload()
-        )
+        self.payload = RouterPayload(**self.tcm.url_name_comp)
         self.prefix = "/" + prefix.strip("/") + "/" if prefix else ""
 
+        configure_global_cache(self.settings, explicit=settings is not None)
+        if self.settings.CACHE_FROZEN_FILES:
+            file_freshness.freeze()
+            template_loader.freeze()
+        self.response_cache = ResponseCache(global_cache)
+
         self._setup_static_routes()
         self._setup_tcm_handler()
 
@@ -90,8 +111,7 @@ class ProboRouter:
         Delegates the request to the internal Bottle app but ensures
         the output is refined into the WSGI-compliant byte-stream format.
         """
-        result = self._maybe_compress(self.__app(environ, start_response))
-        return self._normalize_wsgi_output(result)
+        return self._normalize_wsgi_output(self.__app(environ, start_response))
 
     def set_error_page(self, code: int, component_func):
         """Allows developers to set a beautiful Probo UI for ANY HTTP error code."""
@@ -122,16 +142,68 @@ class ProboRouter:
             else:
                 yield chunk
 
-    def _maybe_compress(self, body: Any) -> Union[Any, bytes]:
-        if not self.settings.ENABLE_GZIP or "gzip" not in request.headers.get(
+    def _compression_engine(self) -> CompressionEngine:
+        """A fresh engine configured from the GZIP_* settings."""
+        return CompressionEngine(
+            compress_level=self.settings.GZIP_LEVEL,
+            flush_bytes=self.settings.GZIP_FLUSH_BYTES,
+            flush_interval=self.settings.GZIP_FLUSH_INTERVAL,
+            flush_markers=self.settings.GZIP_FLUSH_MARKERS,
+            min_size=self.settings.GZIP_MIN_SIZE,
+        )
+
+    def _accepts_gzip(self) -> bool:
+        return self.settings.ENABLE_GZIP and "gzip" in request.headers.get(
             "Accept-Encoding", ""
-        ):
+        )
+
+    def _maybe_compress(self, body: Any) -> Union[Any, bytes]:
+        """
+        Gzips buffered bodies (str or bytes) above GZIP_MIN_SIZE and wraps
+        streamed (sync or async) generators in the incremental engine. Must run inside the
+        handler, while headers can still be changed.
+        """
+        if not self._accepts_gzip() or response.headers.get("Content-Encoding"):
             return body
 
-        if isinstance(body, str):
-            return gzip_response(body, response)
+        if isinstance(body, (str, bytes)):
+            compressed = self._compression_engine().compress_body(body)
+            if compressed is None:
+                return body
+            response.set_header("Content-Encoding", "gzip")
+            response.set_header("Content-Length", str(len(compressed)))
+            self._add_vary("Accept-Encoding")
+            return compressed
+
+        if hasattr(body, "__next__"):
+            response.set_header("Content-Encoding", "gzip")
+            self._add_vary("Accept-Encoding")
+            return self._compression_engine().stream(body)
+        if hasattr(body, "__anext__"):
+            response.set_header("Content-Encoding", "gzip")
+            self._add_vary("Accept-Encoding")
+            return self._compression_engine().astream(body)
         return body
 
+    def _add_vary(self, header: str) -> None:
+        current = response.headers.get("Vary")
+        if not current:
+            response.set_header("Vary", header)
+        elif header not in current:
+            response.set_header("Vary", f"{current}, {header}")
+
+    def _payload_client(self) -> str:
+        """The id payload diffs are kept under for the current client,
+        issuing a PAYLOAD_CLIENT_COOKIE on its first request."""
+        name = self.settings.PAYLOAD_CLIENT_COOKIE
+        client = request.get_cookie(name)
+        if not client or len(client) > 64:
+            client = secrets.token_urlsafe(16)
+            response.set_cookie(
+                name, client, path="/", httponly=True, max_age=self.settings.SESSION_MAX_AGE
+            )
+        return client
+
     def _setup_tcm_handler(self) -> None:
         """
         Injects a hook into Bottle to check the TemplateComponentMap before
@@ -142,17 +214,26 @@ class ProboRouter:
         def catch_all_tcm(error) -> str:
             if self.tcm:
                 path = request.path
-                try:
-                    component_data = self.tcm.get_component(path)
-                except Exception:
-                    component_data = None
+                # Hits are recorded under the matched TCM key, so parameterised
+                # routes add one entry to self.routes, not one per URL.
+                route_key, component_data = path, None
+                if type(self.tcm).get_component is TemplateComponentMap.get_component:
+                    resolved = self.tcm_routes.sync(self.tcm).resolve(path)
+                    if resolved is not None:
+                        route_key, component_data = resolved
+                if component_data is None:
+                    # Subclasses may resolve paths the table does not know.
+                    try:
+                        component_data = self.tcm.get_component(path)
+                    except Exception:
+                        component_data = None
 
                 if component_data:
-                    self.routes[path] = lambda: component_data
+                    self.routes[route_key] = lambda: component_data
                     response.status = 200
                     if isinstance(component_data, tuple):
                         component_data = component_data[0]
-                    return self._wrap_in_template(component_data)
+                    return self._finalize(self._wrap_in_template(component_data))
 
             response.status = 404
 
@@ -236,39 +317,63 @@ class ProboRouter:
             return decorator
 
     def page(
-        self, path: str, stream: bool = False, batch_size: int = 50, cache_ttl: int = 0
+        self,
+        path: str,
+        stream: bool = False,
+        batch_size: int = 50,
+        cache_ttl: int = 0,
+        cache_query: Iterable[str] | None = None,
+        cache_vary: Iterable[str] = (),
     ) -> Any:
         """
         Hyper-Optimized Decorator.
         Now supports Page-Level Caching via `cache_ttl` (in seconds).
+
+        Handlers may be plain functions or `async def` coroutines. Under the
+        native ASGI app coroutines are awaited on the event loop; under WSGI
+        they are run to completion on the worker thread.
+
+        Cached pages are stored fully encoded (and gzipped when enabled), keyed
+        on the request path, the query params named in `cache_query` (all of
+        them when None) and the request headers named in `cache_vary`. The
+        `HX-Request` header is always part of the key because HTMX requests
+        receive the bare fragment instead of the full document. Routers with
+        a payload `respond_format` ("json"/"xml") do not cache responses, as
+        each client gets its own diff.
+
+        With `ENABLE_ETAG`, every non-streamed response carries an ETag and a
+        matching `If-None-Match` gets an empty 304. Cached pages keep their
+        ETag next to the body, so revalidating a hit costs one dict lookup.
         """
+        vary = tuple(dict.fromkeys(("HX-Request", *cache_vary)))
 
         def decorator(func):
             self.routes[path] = func
             sig = inspect.signature(func)
             pass_response = "response" in sig.parameters
             pass_request = "request" in sig.parameters
+            is_async = inspect.iscoroutinefunction(func)
+
+            def lookup() -> tuple[str | None, bytes | None]:
+                """Returns the cache key and, on a hit, the replayed body."""
+                if not self._shares_responses(cache_ttl):
+                    return None, None
+                cache_key = self.response_cache.build_key(
+                    request.path,
+                    request.query.allitems(),
+                    request.headers,
+                    query_params=cache_query,
+                    vary=vary,
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached:
+                    return cache_key, self._send_cached(cached, vary)
+                return cache_key, None
 
-            @self.__app.get(path)
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                if pass_response:
-                    kwargs["response"] = response
-                if pass_request:
-                    kwargs["request"] = request
-
-                cache_key = f"route:{path}"
-                if cache_ttl > 0:
-                    cached_html = global_cache.get(cache_key)
-                    if cached_html:
-                        response.content_type = "text/html; charset=UTF-8"
-                        return cached_html
-
-                result = func(*args, **kwargs)
-
+            def respond(result: Any, cache_key: str | None) -> Any:
                 if stream and hasattr(result, "stream") and cache_ttl == 0:
                     response.content_type = "text/html; charset=UTF-8"
-                    return result.stream(batch_size=batch_size)
+                    return self._maybe_compress(result.stream(batch_size=batch_size))
 
                 is_htmx = self.is_htmx()
                 if is_htmx:
@@ -282,17 +387,164 @@ class ProboRouter:
                     # BUGFIX: We dynamically unpack the string `path` as the dictionary key
                     # so payload tracking correctly recognizes the URL route ID.
                     self.payload.load(**{path: html_output})
-                    html_output = self.payload.get_response(self.respond_type)
+                    html_output = self.payload.for_client(
+                        self._payload_client(), **{path: html_output}
+                    ).get_response(self.respond_type)
+
+                if self._shares_responses(cache_ttl) and self._is_cacheable():
+                    cached = self.response_cache.set(
+                        cache_key,
+                        html_output,
+                        ttl=cache_ttl,
+                        headers={
+                            k: v
+                            for k, v in response.headerlist
+                            if k not in self._UNCACHED_HEADERS
+                        },
+                        status=response.status_code,
+                        compress=self.settings.ENABLE_GZIP,
+                        compress_level=self.settings.GZIP_LEVEL,
+                        compress_min_size=self.settings.GZIP_MIN_SIZE,
+                        etag=self._make_etag(html_output),
+                    )
+                    return self._send_cached(cached, vary)
 
-                if cache_ttl > 0:
-                    global_cache.set(cache_key, html_output, ttl=cache_ttl)
+                return self._finalize(html_output)
+
+            @self.__app.get(path)
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if pass_response:
+                    kwargs["response"] = response
+                if pass_request:
+                    kwargs["request"] = request
 
-                return html_output
+                cache_key, hit = lookup()
+                if hit is not None:
+                    return hit
 
+                result = func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    # WSGI worker threads have no running loop of their own.
+                    result = asyncio.run(result)
+
+                return respond(result, cache_key)
+
+            def start(scope, url_args: Dict[str, Any]) -> tuple:
+                """Runs the cache lookup and calls the handler inside `scope`.
+                Returns (cache_key, hit, result)."""
+                with scope:
+                    kwargs = dict(url_args)
+                    if pass_response:
+                        kwargs["response"] = scope.response if is_async else response
+                    if pass_request:
+                        kwargs["request"] = scope.request if is_async else request
+                    cache_key, hit = lookup()
+                    if hit is not None:
+                        return cache_key, hit, None
+                    return cache_key, None, func(**kwargs)
+
+            def finish(scope, result: Any, cache_key: str | None) -> Any:
+                with scope:
+                    return respond(result, cache_key)
+
+            async def asgi_handler(scope, url_args: Dict[str, Any]) -> Any:
+                """Native ASGI twin of `wrapper`, driven by `ProboASGIApp`.
+
+                Every synchronous step runs inside `scope`, which binds Bottle's
+                thread-local request/response to this request. Coroutine handlers
+                are awaited outside of it and receive the request-owned objects,
+                so concurrent requests never see each other's state.
+
+                Plain handlers and the rendering in `respond` may block, so they
+                run on a worker thread (binding the scope there) and never stall
+                the event loop.
+                """
+                if is_async:
+                    cache_key, hit, result = start(scope, url_args)
+                else:
+                    cache_key, hit, result = await asyncio.to_thread(start, scope, url_args)
+                if hit is not None:
+                    return hit
+                if inspect.isawaitable(result):
+                    result = await result
+                if stream and hasattr(result, "astream") and cache_ttl == 0:
+                    with scope:
+                        # Async-aware nodes resolve awaitable content on the loop.
+                        response.content_type = "text/html; charset=UTF-8"
+                        return self._maybe_compress(result.astream(batch=batch_size))
+                return await asyncio.to_thread(finish, scope, result, cache_key)
+
+            wrapper.asgi_handler = asgi_handler
             return wrapper
 
         return decorator
 
+    def _shares_responses(self, cache_ttl: int) -> bool:
+        """Whether a page's responses go through the shared response cache.
+
+        SSDOM payload responses (`respond_type` other than "txt") are diffed
+        against each client's own baseline, so they are never shared.
+        """
+        return cache_ttl > 0 and self.respond_type == "txt"
+
+    def _is_cacheable(self) -> bool:
+        """Only plain 200 responses without cookies are shared between clients."""
+        return response.status_code == 200 and not any(
+            k == "Set-Cookie" for k, _ in response.headerlist
+        )
+
+    def _make_etag(self, body: str | bytes) -> str | None:
+        if not self.settings.ENABLE_ETAG:
+            return None
+        return make_etag(body, weak=self.settings.WEAK_ETAG)
+
+    def _not_modified(self, etag: str | None) -> bool:
+        """Sets the ETag header and flips the response to 304 on a match."""
+        if not etag or response.status_code != 200:
+            return False
+        response.set_header("ETag", etag)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            response.status = 304
+            return True
+        return False
+
+    @staticmethod
+    def _variant_etag(etag: str | None, gzipped: bool) -> str | None:
+        """A strong tag identifies one exact encoding, so gzip gets its own."""
+        if etag and gzipped and not etag.startswith("W/"):
+            return etag[:-1] + '-gzip"'
+        return etag
+
+    def _finalize(self, body: str | bytes) -> str | bytes:
+        """ETag, conditional GET and compression for a freshly rendered body."""
+        etag = self._make_etag(body)
+        if etag:
+            size = len(body.encode("utf-8") if isinstance(body, str) else body)
+            gzipped = self._accepts_gzip() and size >= self.settings.GZIP_MIN_SIZE
+            if self._not_modified(self._variant_etag(etag, gzipped)):
+                return b""
+        return self._maybe_compress(body)
+
+    def _send_cached(self, cached: CachedResponse, vary: Iterable[str] = ()) -> bytes:
+        """Replays a cached response, picking the gzipped body when accepted."""
+        response.status = cached.status
+        for name, value in cached.headers.items():
+            response.set_header(name, value)
+        vary = list(vary)
+        body, gzipped = cached.body, False
+        if cached.gzip_body is not None:
+            vary.append("Accept-Encoding")
+            if "gzip" in request.headers.get("Accept-Encoding", ""):
+                body, gzipped = cached.gzip_body, True
+                response.set_header("Content-Encoding", "gzip")
+        if vary:
+            response.set_header("Vary", ", ".join(vary))
+        if self._not_modified(self._variant_etag(cached.etag, gzipped)):
+            return b""
+        response.set_header("Content-Length", str(len(body)))
+        return body
+
     def load_discovered_routes(self, **routes) -> Self:
         """BUGFIX: Corrected spelling to `load_discovered_routes`."""
         for path, route_obj in routes.items():
@@ -344,25 +596,32 @@ class ProboRouter:
         # Merge the TCMs so payload diffing works across sub-routers
         if router.tcm and router.tcm.url_name_comp:
             self.tcm.url_name_comp.update(router.tcm.url_name_comp)
-            from probo.router.payload import RouterPayload
-
-            self.payload = RouterPayload(**self.tcm.url_name_comp)
+            self.tcm_routes.invalidate()
+            self.payload.load(**router.tcm.url_name_comp)
 
         return self
 
-    def include_discoveries(self, *directories: str, for_router: bool = True) -> Self:
-        """Scans folders for exported ProboRouters and automatically mounts them."""
+    def include_discoveries(
+        self, *directories: str, for_router: bool = True, manifest: str | None = None
+    ) -> Self:
+        """Scans folders for exported ProboRouters and automatically mounts them.
+
+        `manifest` (default `settings.DISCOVERY_MANIFEST`) caches the scan on
+        disk; see `discover_pages`.
+        """
         from probo.router.discovery import discover_routers, discover_pages
 
+        if manifest is None:
+            manifest = self.settings.DISCOVERY_MANIFEST
         if for_router:
-            routers = discover_routers(*directories)
+            routers = discover_routers(*directories, manifest=manifest)
             for r in routers:
                 self.include_router(r)
         else:
             if directories:
-                routes = discover_pages(*directories)
+                routes = discover_pages(*directories, manifest=manifest)
             else:
-                routes = discover_pages(self.pages_dir or "pages")
+                routes = discover_pages(self.pages_dir or "pages", manifest=manifest)
             self.load_discovered_routes(**routes)
 
         return self
@@ -372,8 +631,11 @@ class ProboRouter:
         return self.__app
 
     @property
-    def asgi_app(self) -> WsgiToAsgi:
-        return WsgiToAsgi(self.__app)
+    def asgi_app(self) -> "ProboASGIApp":
+        """Native ASGI entry point (uvicorn, hypercorn) over the same route table."""
+        from probo.router.asgi import ProboASGIApp
+
+        return ProboASGIApp(self)
 
     def run(self) -> None:
         """Launch the Probo Development Server."""
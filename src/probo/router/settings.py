@@ -25,6 +25,44 @@ class RouterSettings:
         default=False,
         metadata={"description": "Enable GZIP compression for HTTP responses."},
     )
+    GZIP_LEVEL: int = field(
+        default=6,
+        metadata={"description": "zlib compression level (1 fastest - 9 smallest)."},
+    )
+    GZIP_MIN_SIZE: int = field(
+        default=128,
+        metadata={
+            "description": "Buffered bodies smaller than this many bytes are sent uncompressed."
+        },
+    )
+    GZIP_FLUSH_BYTES: int = field(
+        default=16384,
+        metadata={
+            "description": "Streamed responses sync-flush after this many uncompressed bytes (0 disables)."
+        },
+    )
+    GZIP_FLUSH_INTERVAL: float = field(
+        default=0,
+        metadata={
+            "description": "Streamed responses sync-flush after this many seconds (0 disables)."
+        },
+    )
+    GZIP_FLUSH_MARKERS: List[str] = field(
+        default_factory=lambda: ["</head>"],
+        metadata={
+            "description": "Streamed fragments containing any of these markers are flushed immediately."
+        },
+    )
+    ENABLE_ETAG: bool = field(
+        default=False,
+        metadata={
+            "description": "Send ETags on page and TCM responses and answer If-None-Match with 304."
+        },
+    )
+    WEAK_ETAG: bool = field(
+        default=False,
+        metadata={"description": "Emit weak (W/) ETags instead of strong ones."},
+    )
 
     # --- Server Configuration ---
     HOST: str = field(
@@ -70,6 +108,12 @@ class RouterSettings:
         default=31536000,
         metadata={"description": "Session duration in seconds (default 1 year)."},
     )
+    PAYLOAD_CLIENT_COOKIE: str = field(
+        default="probo_client",
+        metadata={
+            "description": "Cookie identifying a client for SSDOM payload diffing, so each client is diffed against what it was sent."
+        },
+    )
 
     # --- File System & Paths ---
     STATIC_FOLDER: str = field(
@@ -93,6 +137,50 @@ class RouterSettings:
         metadata={"description": "Local directory containing raw HTML templates."},
     )
 
+    # --- Caching ---
+    CACHE_MAX_ENTRIES: Optional[int] = field(
+        default=10000,
+        metadata={
+            "description": "Max entries held by the global cache before LRU eviction (None = unbounded)."
+        },
+    )
+    CACHE_MAX_BYTES: Optional[int] = field(
+        default=67108864,
+        metadata={
+            "description": "Max estimated size of the global cache in bytes (default 64MB, None = unbounded)."
+        },
+    )
+    CACHE_SWEEP_INTERVAL: float = field(
+        default=60,
+        metadata={
+            "description": "Seconds between background sweeps of expired cache entries (0 disables)."
+        },
+    )
+    CACHE_FROZEN_FILES: bool = field(
+        default=False,
+        metadata={
+            "description": "Stop checking template files for changes once they were loaded or hashed (production)."
+        },
+    )
+    TCM_MEMOIZE: bool = field(
+        default=False,
+        metadata={
+            "description": "Keep each TCM page's rendered output instead of re-rendering it on every hit."
+        },
+    )
+    TCM_MAX_ENTRIES: int = field(
+        default=1024,
+        metadata={
+            "description": "Max TCM components (and memoized renders) kept per route and URL parameters (LRU)."
+        },
+    )
+    DISCOVERY_MANIFEST: Optional[str] = field(
+        default=None,
+        metadata={
+            "description": "JSON file caching what include_discoveries found, so unchanged page modules are imported on their first request (None disables)."
+        },
+    )
+
     # --- Database (Optional/Future-proofing) ---
     DATABASE_URI: Optional[str] = field(
         default=None,
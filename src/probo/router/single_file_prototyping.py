@@ -135,10 +135,10 @@ def run_project_server(
             import uvicorn
         except ImportError:
             print(
-                "❌ [X] Uvicorn is not installed. Please run: pip install uvicorn asgiref"
+                "❌ [X] Uvicorn is not installed. Please run: pip install uvicorn"
             )
             sys.exit(1)
 
         print(f"🚀 Starting Uvicorn (ASGI) on {host}:{port} with {workers} workers...")
-        # Pass the asgi_app bridge property to Uvicorn
+        # Pass the native asgi_app entry point to Uvicorn
         uvicorn.run(app.asgi_app, host=host, port=port, workers=workers)
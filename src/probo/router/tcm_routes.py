@@ -0,0 +1,246 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from probo.context import TemplateComponentMap
+
+
+class _TCMEntry:
+    """One TCM mapping: a rendered string, a component, or a factory."""
+
+    __slots__ = ("key", "value", "is_factory", "param_names")
+
+    def __init__(self, key: str, value: Any):
+        self.key = key
+        self.value = value
+        self.param_names = tuple(
+            segment[1:-1].split(":", 1)[0]
+            for segment in key.split("/")
+            if segment.startswith("<") and segment.endswith(">")
+        )
+        # Classes and plain callables are built on first hit; components
+        # (anything with `render`) and strings are used as they are.
+        self.is_factory = callable(value) and (isinstance(value, type) or not hasattr(value, "render"))
+
+
+class _TrieNode:
+    __slots__ = ("static", "param", "entry")
+
+    def __init__(self):
+        self.static: Dict[str, "_TrieNode"] = {}
+        self.param: Optional["_TrieNode"] = None
+        self.entry: Optional[_TCMEntry] = None
+
+
+class TCMRouteTable:
+    """
+    A precompiled route table over a `TemplateComponentMap`, so a TCM hit
+    costs one lookup instead of a `get_component` call per request.
+
+    Keys without parameters go in a plain dict. Keys with `<name>` segments
+    (e.g. `"/users/<user_id>/"`) go in a segment trie, where a static
+    segment wins over a parameter at the same depth; the captured values
+    are passed to the entry.
+
+    Entries are resolved lazily:
+
+    - strings are returned as they are;
+    - components (objects with `render`) get the TCM request props, the
+      captured `url-params`, and are rendered, like `get_component` does;
+    - classes and other callables are factories, called with the captured
+      parameters on the first hit. The component they build is kept.
+
+    Built components live in an LRU of `max_entries` slots keyed by route
+    and parameters, so parameterised routes cannot grow it without bound.
+    With `memoize=True` the rendered output is kept in the same slot and
+    later hits skip rendering; only use it for pages that do not depend on
+    per-request props.
+
+    The table rebuilds itself when it is handed a different TCM or the
+    mapping changed size (`sync`), and when the entry a path matched was
+    replaced in place (`tcm.set_component("/about/", ...)`), so edits to the
+    map are served on the next hit without calling `invalidate()`.
+
+    Args:
+        tcm (TemplateComponentMap): The map to serve.
+        memoize (bool): Keep rendered output per route and parameters.
+        max_entries (int): LRU capacity for built components and renders.
+
+    Example:
+        >>> tcm = TemplateComponentMap(**{"/about/": AboutPage(), "/users/<user_id>/": UserCard})
+        >>> table = TCMRouteTable(tcm, memoize=True)
+        >>> table.render("/users/42/")  # UserCard(user_id="42").render(), once
+    """
+
+    __slots__ = (
+        "tcm", "memoize", "max_entries", "_source", "_size", "_static", "_trie",
+        "_built", "_lock", "hits", "misses", "builds", "renders",
+    )
+
+    def __init__(self, tcm: Optional[TemplateComponentMap] = None, memoize: bool = False, max_entries: int = 1024):
+        self.tcm = None
+        self.memoize = memoize
+        self.max_entries = max_entries
+        self._source: Optional[Dict[str, Any]] = None
+        self._size = -1
+        self._static: Dict[str, _TCMEntry] = {}
+        self._trie = _TrieNode()
+        self._built: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.renders = 0
+        if tcm is not None:
+            self.sync(tcm)
+
+    def __len__(self) -> int:
+        return self._size if self._size > 0 else 0
+
+    def sync(self, tcm: TemplateComponentMap) -> "TCMRouteTable":
+        """Serves `tcm`, rebuilding the table if it changed since the last call."""
+        if tcm is not self.tcm or tcm.url_name_comp is not self._source or len(tcm.url_name_comp) != self._size:
+            self.tcm = tcm
+            self._compile()
+        return self
+
+    def invalidate(self) -> None:
+        """Rebuilds the table and drops built components and renders."""
+        if self.tcm is not None:
+            self._compile()
+
+    def match(self, path: str) -> Optional[Tuple[_TCMEntry, Dict[str, str]]]:
+        """Returns the entry serving `path` and its captured parameters, or None."""
+        found = self._match_path(path)
+        source = self._source
+        if source is not None:
+            if found is not None:
+                stale = source.get(found[0].key) is not found[0].value
+            else:
+                # A static key whose value was falsy (skipped) when compiled.
+                stale = bool(source.get(path))
+            if stale:
+                self._compile()
+                found = self._match_path(path)
+        return found
+
+    def render(self, path: str) -> Any:
+        """Returns the rendered TCM page for `path`, or None if no entry matches."""
+        resolved = self.resolve(path)
+        return resolved[1] if resolved is not None else None
+
+    def resolve(self, path: str) -> Optional[Tuple[str, Any]]:
+        """Returns `(key, rendered page)` for `path`, where `key` is the TCM key
+        that matched (the pattern for parameterised routes), or None."""
+        found = self.match(path)
+        if found is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry, params = found
+        return entry.key, self._render_entry(entry, params)
+
+    def _render_entry(self, entry: _TCMEntry, params: Dict[str, str]) -> Any:
+        if not entry.is_factory and isinstance(entry.value, str):
+            return entry.value
+
+        key = (entry.key, tuple(params.items()))
+        with self._lock:
+            slot = self._built.get(key)
+            if slot is not None:
+                self._built.move_to_end(key)
+        if slot is None:
+            if entry.is_factory:
+                self.builds += 1
+                component = entry.value(**params)
+            else:
+                component = entry.value
+            slot = [component, None]
+            with self._lock:
+                self._built[key] = slot
+                while len(self._built) > self.max_entries:
+                    self._built.popitem(last=False)
+        elif slot[1] is not None:
+            return slot[1]
+
+        component = slot[0]
+        if isinstance(component, str) or not hasattr(component, "render"):
+            return component
+        props = getattr(component, "props", None)
+        if props is not None:
+            props["request-props"] = self.tcm.r_props.get("request-props", {})
+            props["state-prop"] = self.tcm.r_props.get("state-prop", {})
+            if params:
+                props["url-params"] = params
+        self.renders += 1
+        rendered = component.render()
+        if self.memoize:
+            slot[1] = rendered
+        return rendered
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "routes": len(self),
+            "built": len(self._built),
+            "hits": self.hits,
+            "misses": self.misses,
+            "builds": self.builds,
+            "renders": self.renders,
+        }
+
+    def _compile(self) -> None:
+        source = self.tcm.url_name_comp
+        static: Dict[str, _TCMEntry] = {}
+        trie = _TrieNode()
+        for key, value in source.items():
+            if not value:
+                # get_component treats falsy mappings as missing.
+                continue
+            entry = _TCMEntry(key, value)
+            if "<" not in key:
+                static[key] = entry
+                continue
+            node = trie
+            for segment in key.split("/"):
+                if segment.startswith("<") and segment.endswith(">"):
+                    if node.param is None:
+                        node.param = _TrieNode()
+                    node = node.param
+                else:
+                    node = node.static.setdefault(segment, _TrieNode())
+            node.entry = entry
+        with self._lock:
+            self._static = static
+            self._trie = trie
+            self._built.clear()
+            self._source = source
+            self._size = len(source)
+
+    def _match_path(self, path: str) -> Optional[Tuple[_TCMEntry, Dict[str, str]]]:
+        entry = self._static.get(path)
+        if entry is not None:
+            return entry, {}
+        if self._trie.static or self._trie.param is not None:
+            values: list = []
+            entry = self._match(self._trie, path.split("/"), 0, values)
+            if entry is not None:
+                return entry, dict(zip(entry.param_names, values))
+        return None
+
+    def _match(self, node: _TrieNode, segments: list, depth: int, values: list) -> Optional[_TCMEntry]:
+        if depth == len(segments):
+            return node.entry
+        segment = segments[depth]
+        child = node.static.get(segment)
+        if child is not None:
+            entry = self._match(child, segments, depth + 1, values)
+            if entry is not None:
+                return entry
+        child = node.param
+        if child is not None and segment:
+            values.append(segment)
+            entry = self._match(child, segments, depth + 1, values)
+            if entry is not None:
+                return entry
+            values.pop()
+        return None
@@ -1,7 +1,7 @@
 import inspect
-import os
 import importlib
 from typing import Callable, Any, Dict, Optional
+from probo.templates.loader import template_loader
 
 
 class RouterViewMixin:
@@ -10,6 +10,13 @@ class RouterViewMixin:
     Operates directly on the View instance attributes.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        lazy_layout = cls.__dict__.get("lazy_layout")
+        if isinstance(lazy_layout, str) and lazy_layout.endswith((".html", ".htm")):
+            # Views are defined at import time: load the layout before the first request.
+            template_loader.warm(lazy_layout)
+
     def resolve_layout_callable(self) -> Optional[Callable]:
         # Access via class first to prevent Python from accidentally binding
         # external functions as instance methods.
@@ -29,15 +36,15 @@ class RouterViewMixin:
             from probo.context.context_logic import TemplateProcessor
 
             def html_layout_wrapper(**context_kwargs):
-                if not os.path.exists(lazy_layout):
+                try:
+                    content = template_loader.source(str(lazy_layout))
+                except FileNotFoundError:
                     raise FileNotFoundError(
                         f"Lazy layout HTML file not found: {lazy_layout}"
-                    )
-                with open(str(lazy_layout), "r", encoding="utf-8") as f:
-                    content = f.read()
+                    ) from None
                 return TemplateProcessor(**context_kwargs).render_template(content)
 
-            # Cache it so we only read the file once!
+            # Cache the wrapper; the file itself is held by `template_loader`.
             self.layout = html_layout_wrapper
             return self.layout
 
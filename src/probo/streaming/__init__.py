@@ -1,11 +1,27 @@
 from probo.streaming.streaming import  (
     to_django_response,
     GzipStreamer,
+    CompressionEngine,
     stream_render
 )
+from probo.streaming.sinks import (
+    RenderSink,
+    ListSink,
+    StringSink,
+    BytesSink,
+    FileSink,
+    render_to,
+)
 
 __all__ = [
     'GzipStreamer',
+    'CompressionEngine',
     'to_django_response',
     'stream_render',
+    'RenderSink',
+    'ListSink',
+    'StringSink',
+    'BytesSink',
+    'FileSink',
+    'render_to',
 ]
\ No newline at end of file
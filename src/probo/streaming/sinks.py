@@ -0,0 +1,199 @@
+import io
+from abc import ABC, abstractmethod
+from os import PathLike
+from typing import Any, Callable, IO, Optional, Union
+from probo.utility import ProboSourceString
+
+
+class RenderSink(ABC):
+    """
+    Destination for a one-pass tree render.
+
+    A sink receives the HTML fragments of a whole tree in document order
+    through `write()`; every node writes its own tags and text straight
+    into it instead of returning a string for its parent to concatenate.
+    Each byte of output is therefore copied once, whatever the nesting
+    depth.
+
+    Subclasses must implement `write()`. Those that keep the output also
+    override `getvalue()`, which otherwise raises NotImplementedError.
+    Sinks are context managers; leaving the block calls `close()`.
+
+    Example:
+        >>> sink = DIV(SPAN("hi")).render_into(ListSink())
+        >>> sink.getvalue()
+        '<div><span>hi</span></div>'
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def write(self, chunk: str) -> None:
+        """Appends one fragment of output."""
+
+    def write_dynamic(self, writer: Callable[["RenderSink"], None]) -> None:
+        """Writes content that may change between renders.
+
+        `writer(sink)` writes it. Plain sinks call it at once; a compiling
+        sink (see `probo.components.compiler`) keeps it as a slot instead.
+        """
+        writer(self)
+
+    def getvalue(self) -> Any:
+        raise NotImplementedError(f"{type(self).__name__} does not keep its output.")
+
+    def close(self) -> None:
+        """Flushes and releases any underlying resource."""
+
+    def __enter__(self) -> "RenderSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ListSink(RenderSink):
+    """Appends fragments to a list and joins them once in `getvalue()`."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts: list[str] = []
+
+    def write(self, chunk: str) -> None:
+        self.parts.append(chunk)
+
+    def getvalue(self) -> ProboSourceString:
+        return ProboSourceString("".join(self.parts))
+
+    def drain(self) -> list[str]:
+        """Returns the fragments written so far and empties the sink."""
+        parts, self.parts = self.parts, []
+        return parts
+
+
+class StringSink(RenderSink):
+    """Writes into an `io.StringIO` buffer."""
+
+    __slots__ = ("buffer",)
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+
+    def write(self, chunk: str) -> None:
+        self.buffer.write(chunk)
+
+    def getvalue(self) -> ProboSourceString:
+        return ProboSourceString(self.buffer.getvalue())
+
+
+class BytesSink(RenderSink):
+    """Encodes fragments into a growing `bytearray`, ready to send as a body."""
+
+    __slots__ = ("buffer", "encoding")
+
+    def __init__(self, encoding: str = "utf-8"):
+        self.buffer = bytearray()
+        self.encoding = encoding
+
+    def write(self, chunk: str) -> None:
+        self.buffer += chunk.encode(self.encoding)
+
+    def getvalue(self) -> bytes:
+        return bytes(self.buffer)
+
+
+class FileSink(RenderSink):
+    """
+    Writes fragments to a text file through a bounded buffer.
+
+    Nothing is kept in memory beyond `buffer_size` characters, so a static
+    build can write arbitrarily large pages. `getvalue()` returns the number
+    of characters written.
+
+    Args:
+        target (str | PathLike | IO[str]): A path to open for writing, or an
+            already open text file. Files opened by the sink are closed by it.
+        encoding (str): Encoding used when `target` is a path.
+        buffer_size (int): Characters gathered before each `write()` to the file.
+
+    Example:
+        >>> with FileSink("dist/index.html") as sink:
+        ...     page.render_into(sink)
+    """
+
+    __slots__ = ("file", "owns_file", "buffer_size", "written", "_parts", "_pending")
+
+    def __init__(
+        self,
+        target: Union[str, PathLike, IO[str]],
+        encoding: str = "utf-8",
+        buffer_size: int = 65536,
+    ):
+        if hasattr(target, "write"):
+            self.file: Optional[IO[str]] = target
+            self.owns_file = False
+        else:
+            self.file = open(target, "w", encoding=encoding)
+            self.owns_file = True
+        self.buffer_size = buffer_size
+        self.written = 0
+        self._parts: list[str] = []
+        self._pending = 0
+
+    def write(self, chunk: str) -> None:
+        self._parts.append(chunk)
+        self._pending += len(chunk)
+        if self._pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self.file.write("".join(self._parts))
+            self.written += self._pending
+            self._parts.clear()
+            self._pending = 0
+
+    def getvalue(self) -> int:
+        return self.written + self._pending
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.flush()
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+        self.file = None
+
+
+def render_to(node: Any, sink: Optional[RenderSink] = None, EL: Any = None) -> RenderSink:
+    """Renders `node` into `sink` (a new ListSink by default) and returns the sink.
+
+    Element trees and light nodes write themselves in one pass; anything else
+    with a `render()` method is rendered and written as a single fragment, and
+    plain values are written as their string form.
+
+    Args:
+        node: An element, a light node (pass its shared builder as `EL`), a
+            component or a string.
+        sink (RenderSink, optional): Where the output goes.
+        EL (Element, optional): The builder driving light nodes. A fresh
+            string-mode Element is used when omitted.
+    """
+    sink = ListSink() if sink is None else sink
+    if hasattr(node, "render_into"):
+        if hasattr(node, "light_tag"):
+            if EL is None:
+                from probo.components.elements import Element
+
+                EL = Element()
+            return node.render_into(EL, sink)
+        return node.render_into(sink)
+    rendered = node.render() if hasattr(node, "render") else str(node)
+    if isinstance(rendered, tuple):
+        # Components render to (html, css).
+        rendered = rendered[0]
+    sink.write(rendered if isinstance(rendered, str) else "".join(rendered))
+    return sink
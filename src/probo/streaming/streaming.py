@@ -1,36 +1,175 @@
-import gzip
-import io
-from typing import Any, Iterator, Union, Iterable, Callable
+import time
+import zlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterator,
+    Union,
+    Iterable,
+    Callable,
+    Optional,
+)
+
+
+GZIP_WBITS = 31  # zlib window bits that emit a gzip header/trailer
+
+
+class CompressionEngine:
+    """
+    Incremental Gzip Engine shared by streamed and buffered responses.
+
+    Wraps one persistent `zlib.compressobj` so the whole response is a
+    single deflate stream. Fragments are fed in as they arrive and deflate
+    emits blocks at its own (ratio-optimal) pace; a sync-flush is forced
+    only when a flush policy fires:
+
+    - `flush_bytes`: that many uncompressed bytes are pending since the last flush.
+    - `flush_interval`: that many seconds have elapsed since the last flush.
+    - `flush_markers`: a fragment contains a marker such as "</head>", or the
+      caller passes `flush=True` explicitly.
+
+    Args:
+        compress_level (int): zlib level, 1 (fast) to 9 (small).
+        flush_bytes (int): Pending-bytes threshold. 0 disables it.
+        flush_interval (float): Seconds between forced flushes. 0 disables it.
+        flush_markers (Iterable[str]): Substrings that trigger a flush after the fragment.
+        min_size (int): Buffered bodies shorter than this are not compressed.
+
+    Example:
+        >>> engine = CompressionEngine(flush_markers=("</head>",))
+        >>> chunks = list(engine.stream(["<head></head>", "<body>...</body>"]))
+    """
+
+    __slots__ = (
+        "compress_level",
+        "flush_bytes",
+        "flush_interval",
+        "flush_markers",
+        "min_size",
+        "_compressor",
+        "_pending",
+        "_last_flush",
+    )
+
+    def __init__(
+        self,
+        compress_level: int = 6,
+        flush_bytes: int = 16384,
+        flush_interval: float = 0,
+        flush_markers: Iterable[str] = (),
+        min_size: int = 0,
+    ):
+        self.compress_level = compress_level
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.flush_markers = tuple(flush_markers)
+        self.min_size = min_size
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts a fresh gzip member; the engine can then be reused."""
+        self._compressor = zlib.compressobj(
+            self.compress_level, zlib.DEFLATED, GZIP_WBITS
+        )
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def compress(self, data: Union[str, bytes], flush: bool = False) -> bytes:
+        """Feeds one fragment and returns whatever compressed bytes are ready."""
+        if isinstance(data, str):
+            if not flush and self.flush_markers:
+                flush = any(marker in data for marker in self.flush_markers)
+            data = data.encode("utf-8")
+        out = self._compressor.compress(data)
+        self._pending += len(data)
+        if flush or self._should_flush():
+            out += self.flush()
+        return out
+
+    def flush(self) -> bytes:
+        """Forces a sync-flush so everything fed so far is decodable by the client."""
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Terminates the gzip member (trailer included) and resets the engine."""
+        out = self._compressor.flush(zlib.Z_FINISH)
+        self.reset()
+        return out
+
+    def stream(self, fragments: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+        """Compresses an iterable of fragments into a gzip byte stream."""
+        for fragment in fragments:
+            chunk = self.compress(fragment)
+            if chunk:
+                yield chunk
+        tail = self.finish()
+        if tail:
+            yield tail
+
+    async def astream(
+        self, fragments: AsyncIterable[Union[str, bytes]]
+    ) -> AsyncIterator[bytes]:
+        """Async twin of `stream` for fragments produced on an event loop."""
+        async for fragment in fragments:
+            chunk = self.compress(fragment)
+            if chunk:
+                yield chunk
+        tail = self.finish()
+        if tail:
+            yield tail
+
+    def compress_body(self, body: Union[str, bytes]) -> Optional[bytes]:
+        """One-shot compression of a buffered body.
+
+        Returns None when the body is below `min_size`, meaning it should be
+        sent uncompressed.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if len(body) < self.min_size:
+            return None
+        return self._compressor.compress(body) + self.finish()
+
+    def _should_flush(self) -> bool:
+        if self.flush_bytes and self._pending >= self.flush_bytes:
+            return True
+        return bool(
+            self.flush_interval
+            and self._pending
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
 
 
 class GzipStreamer:
     """
     Real-time Gzip Compressor.
-    Compresses fragments on-the-fly as they are yielded.
+    Compresses fragments on-the-fly as they are yielded, through a
+    CompressionEngine so deflate blocks follow the flush policy instead
+    of one sync-flush per fragment.
     """
 
-    def __init__(self, generator: Iterator[str], compress_level: int = 6):
+    def __init__(
+        self,
+        generator: Iterator[str],
+        compress_level: int = 6,
+        flush_bytes: int = 16384,
+        flush_interval: float = 0,
+        flush_markers: Iterable[str] = ("</head>",),
+    ):
         self.generator = generator
         self.compress_level = compress_level
+        self.engine = CompressionEngine(
+            compress_level=compress_level,
+            flush_bytes=flush_bytes,
+            flush_interval=flush_interval,
+            flush_markers=flush_markers,
+        )
 
     def __iter__(self) -> Iterator[bytes]:
-        buffer = io.BytesIO()
-        # Use the with block to manage the gzip object
-        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=self.compress_level) as f:
-            for fragment in self.generator:
-                f.write(fragment.encode('utf-8'))
-                f.flush()
-                chunk = buffer.getvalue()
-                if chunk:
-                    yield chunk
-                    buffer.seek(0)
-                    buffer.truncate()
-
-        # IMPORTANT: After the 'with' block closes, the Gzip footer is written.
-        # We must yield this final chunk to make the stream valid.
-        remainder = buffer.getvalue()
-        if remainder:
-            yield remainder
+        return self.engine.stream(self.generator)
 
 def stream_render(elements: Iterable[Callable]) -> Iterator[str]:
     """
@@ -6,6 +6,7 @@ from probo.styles.plain_css import (
 from dataclasses import dataclass
 from typing import List, Dict, Any, Union, Self
 from probo.styles.utils import resolve_complex_selector
+from probo.templates.resolver import TemplateIndex
 from probo.utility import ProboSourceString
 
 
@@ -17,7 +18,8 @@ class ComponentStyle:
     elements within the provided template, preventing broken styles.
 
     Attributes:
-        template (str): The HTML string representation of the component.
+        template (str): The HTML string representation of the component. 
+            A prebuilt TemplateIndex may be passed instead to skip reparsing.
         css_rules (tuple): A collection of SelectorRuleBridge objects 
             defining the styling logic.
         template_info (dict): A pre-computed dictionary of selectors 
@@ -36,12 +38,16 @@ class ComponentStyle:
         'template_representation',
         'template_info',
     )
-    def __init__(self, template: str = "", *css):
-        self.template = template
+    def __init__(self, template: str | TemplateIndex = "", *css):
+        if isinstance(template, TemplateIndex):
+            self.template = template.tmplt_str
+            self.template_info = template.tag_info
+        else:
+            self.template = template
+            if template:
+                self.template_info = CssSelector(self.template).template_info
         self.css_rules: tuple["SelectorRuleBridge"] = css
         self.template_representation = str()
-        if template:
-            self.template_info = CssSelector(self.template).template_info
 
     def link_component(self, cmp_str: str) -> Self:
         """Binds a specific HTML representation to this style for validation.
@@ -281,28 +287,17 @@ class SelectorRuleBridge:
 
         return bridges
 
-def _check_selector_in_template_re(selector: list[str], template: str) -> bool:
+def _check_selector_in_template_re(selector: list[str], template: str | TemplateIndex) -> bool:
     """
-    Uses RegEx to find if a simple selector (tag, id, or class)
-    exists in the rendered HTML template string.
+    Checks if a simple selector (tag, id, or class) exists in the
+    rendered HTML template, using a parse-once TemplateIndex.
     """
-    template_info = CssSelector(template).template_info
-    # 1. ID selector (e.g., '#my-id')
-    for key, value in template_info.items():
-        if key in selector:
-            return True
-        # Check nested dict
-        if isinstance(value, dict):
-            # Check nested key or nested value
-            # any([k in selector for k in value.keys()])  or
-            if any([all([s in v for s in selector]) for v in value.values()]):
-                return True
-        else:
-            return False
-    return False
+    if not isinstance(template, TemplateIndex):
+        template = TemplateIndex(template)
+    return template.match_tokens(selector)
 
 def element_style_state(
-    template: str,
+    template: str | TemplateIndex,
     rslvd_el: Dict[str, Any],  # Dict[str, ElementState]
     *css: SelectorRuleBridge,
 )-> List[SelectorRuleBridge]:
@@ -314,7 +309,9 @@ def element_style_state(
     underlying HTML structure.
 
     Args:
-        template (str): The HTML string template to be styled.
+        template (str | TemplateIndex): The HTML string template to be styled, 
+            or a TemplateIndex already built for it. The template is parsed 
+            at most once per call, whatever the number of rules.
         rslvd_el (Dict[str, Any]): A dictionary mapping element selectors 
             to their current State objects (ElementState).
         *css (SelectorRuleBridge): A variable number of bridge objects 
@@ -342,6 +339,8 @@ def element_style_state(
     # css: {"h1_big": {"color":"red"}, "a_btn": {"font":"12px"}}
 
     valid_css = []
+    if not isinstance(template, TemplateIndex):
+        template = TemplateIndex(template)
     for sel in css:
         selector: List[str] = [
             s.strip(".").strip("#").strip("[").strip("]")
@@ -1,13 +1,18 @@
 from probo.templates.default_templates import base_template_tree, base_template_string, welcome_template_tree
-from probo.templates.resolver import TemplateResolver
+from probo.templates.resolver import TemplateResolver, TemplateIndex
 from probo.templates.parser import HeavyNodeProxy, LightNodeProxy,ProboTemplateParser
+from probo.templates.loader import TemplateLoader, file_fingerprint, template_loader
 
 __all__ = [
     "base_template_tree",
     "base_template_string",
     "welcome_template_tree",
     "TemplateResolver",
+    "TemplateIndex",
     "HeavyNodeProxy",
     "LightNodeProxy",
     "ProboTemplateParser",
+    "TemplateLoader",
+    "file_fingerprint",
+    "template_loader",
 ]
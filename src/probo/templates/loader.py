@@ -0,0 +1,149 @@
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# A file modified this recently may be written again within the same mtime
+# tick (filesystems with coarse timestamps), so its fingerprint is not trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_fingerprint(st: os.stat_result) -> Optional[Tuple[int, int, int]]:
+    """Returns `(st_ino, st_size, st_mtime_ns)` for a stat result, or None
+    if the file was modified too recently for the fingerprint to prove it
+    unchanged later."""
+    if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class _Template:
+    __slots__ = ("fingerprint", "source", "compiled")
+
+    def __init__(self, fingerprint: Optional[Tuple[int, int, int]], source: str):
+        self.fingerprint = fingerprint
+        self.source = source
+        self.compiled: Dict[Callable[[str], Any], Any] = {}
+
+
+class TemplateLoader:
+    """
+    Keeps template files, and the forms compiled from them, in memory.
+
+    A file is read once and then re-checked with a single `os.stat`: it is
+    read again, and its compiled forms dropped, only when its
+    `(st_ino, st_size, st_mtime_ns)` fingerprint changes. In frozen mode
+    (production, after `warm()`) loaded files are not checked at all, so a
+    hot route does no file I/O.
+
+    Compiled forms are keyed by the compiler function, so pass the same
+    function every time (a module-level function, not a fresh lambda).
+
+    Args:
+        frozen (bool): Start in frozen mode.
+
+    Attributes:
+        loads (int): Files read from disk.
+        stat_calls (int): `os.stat` calls made.
+        compiles (int): Compiler calls made.
+
+    Example:
+        >>> template_loader.warm("layouts/base.html")
+        >>> template_loader.source("layouts/base.html")  # one stat, no read
+        >>> template_loader.compiled("layouts/base.html", parse_ast)  # parsed once
+        >>> template_loader.stats()["loads"]
+        1
+    """
+
+    __slots__ = ("_templates", "frozen", "loads", "stat_calls", "compiles")
+
+    def __init__(self, frozen: bool = False):
+        self._templates: Dict[str, _Template] = {}
+        self.frozen = frozen
+        self.loads = 0
+        self.stat_calls = 0
+        self.compiles = 0
+
+    def __contains__(self, path: Union[str, os.PathLike]) -> bool:
+        return os.fspath(path) in self._templates
+
+    def source(self, path: Union[str, os.PathLike]) -> str:
+        """Returns the text of the template at `path`.
+
+        Raises:
+            FileNotFoundError: If the file does not exist (and, in frozen
+                mode, was never loaded).
+        """
+        return self._load(os.fspath(path)).source
+
+    def compiled(self, path: Union[str, os.PathLike], compiler: Callable[[str], Any]) -> Any:
+        """Returns `compiler(source)` for the template at `path`, computed
+        once per version of the file."""
+        template = self._load(os.fspath(path))
+        try:
+            return template.compiled[compiler]
+        except KeyError:
+            self.compiles += 1
+            result = template.compiled[compiler] = compiler(template.source)
+            return result
+
+    def warm(self, *paths: Union[str, os.PathLike]) -> int:
+        """Loads `paths` ahead of the first request. Missing files are
+        skipped. Returns how many were loaded."""
+        loaded = 0
+        for path in paths:
+            try:
+                self._load(os.fspath(path))
+            except OSError:
+                continue
+            loaded += 1
+        return loaded
+
+    def freeze(self) -> "TemplateLoader":
+        """Stops checking templates that were already loaded."""
+        self.frozen = True
+        return self
+
+    def thaw(self) -> "TemplateLoader":
+        """Resumes stat checks on every access."""
+        self.frozen = False
+        return self
+
+    def forget(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Drops `path` (every template when omitted) from memory."""
+        if path is None:
+            self._templates.clear()
+        else:
+            self._templates.pop(os.fspath(path), None)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the loader counters for metrics scraping and tests."""
+        return {
+            "templates": len(self._templates),
+            "loads": self.loads,
+            "stat_calls": self.stat_calls,
+            "compiles": self.compiles,
+        }
+
+    def reset_stats(self) -> None:
+        self.loads = self.stat_calls = self.compiles = 0
+
+    def _load(self, path: str) -> _Template:
+        template = self._templates.get(path)
+        if template is not None and self.frozen:
+            return template
+        self.stat_calls += 1
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._templates.pop(path, None)
+            raise
+        if template is not None and template.fingerprint == (st.st_ino, st.st_size, st.st_mtime_ns):
+            return template
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        self.loads += 1
+        template = self._templates[path] = _Template(file_fingerprint(st), source)
+        return template
+
+
+template_loader = TemplateLoader()
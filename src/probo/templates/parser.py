@@ -6,10 +6,11 @@ from probo.components.node import (
 from probo.components.light_tags.node import LightNode
 from probo.components.base import BaseHTMLElement
 from probo.utility import StreamManager
+from probo.templates.loader import template_loader
 import re
 
 class HeavyNodeProxy(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
-    __slots__ = ("parsed_tag","_el_instance", "use_list", "use_deque", "element_data")
+    __slots__ = ("parsed_tag",)
 
     def __init__(
         self,tag, *content: tuple[str | ElementNodeMixin], **attrs: dict[str, Any]
@@ -26,24 +27,27 @@ class HeavyNodeProxy(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         ).set_attrs(**self.attributes).set_content(self.content).a().element"""
 
         content = self._get_rendered_content()
-        self.EL.set_attrs(**self.attributes).set_content(content)
+        self.EL.set_attrs(**self._attributes).set_content(content)
         method = getattr(self.EL, self.parsed_tag, None)
         if callable(method):
             return method().element
         return str()
 
+    def _frame_tag(self) -> str:
+        return self.parsed_tag
+
     def stream(self, chunk_size: int = 50) -> Generator[str, None, None]:
         """
         Yields HTML in chunks.
         Note: The builder's .a() method must support returning a generator.
         """
-        self.delegate_render_conditions(
+        self.use_render_conditions(
             use_list=True,
         )
 
         content_generator = self._get_stream_content(batch=chunk_size)
 
-        (self.EL.set_attrs(**self.attributes)
+        (self.EL.set_attrs(**self._attributes)
         .set_generator_content(content_generator))
         method = getattr(self.EL, self.parsed_tag, None)
 
@@ -65,7 +69,7 @@ class HeavyNodeProxy(BaseHTMLElement,ElementNodeMixin,ElementMutatorMixin):
         yield from stream_manager
 
     def __repr__(self):
-        children = f", children={len(self.content)}" if self.content else ""
+        children = f", children={len(self._content)}" if self._content else ""
         return f"HeavyNodeProxy(<{self.tag}>{children})"
 
 class LightNodeProxy(LightNode,ElementNodeMixin):
@@ -90,7 +94,7 @@ class LightNodeProxy(LightNode,ElementNodeMixin):
         yield from super().stream(EL,chunk_size)       
 
     def __repr__(self):
-        children = f", children={len(self.content)}" if self.content else ""
+        children = f", children={len(self._content)}" if self._content else ""
         return f"LightNodeProxy(<{self.tag}>{children})"
 
 
@@ -213,7 +217,11 @@ class ProboTemplateParser(HTMLParser):
         if not html_string and not self.file_path:
             return str()
         if not html_string and self.file_path:
-            self.feed(open(self.file_path,"r").read())
+            if mode == "json":
+                # The caller owns (and may edit) the returned AST: parse a fresh one.
+                self.feed(template_loader.source(self.file_path))
+            else:
+                self.root = list(template_loader.compiled(self.file_path, _parse_ast))
         else:
             self.feed(html_string)
 
@@ -227,3 +235,10 @@ class ProboTemplateParser(HTMLParser):
             )
         else:
             return self._convert_to_ssdom(self.root, mode)
+
+
+def _parse_ast(source: str) -> List[Dict[str, Any]]:
+    """Compiler for `template_loader`: the JSON AST of a template file."""
+    parser = ProboTemplateParser()
+    parser.feed(source)
+    return parser.root
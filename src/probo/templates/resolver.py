@@ -205,3 +205,114 @@ class TemplateResolver:
             )
             self.template_info.update(info)
             return info
+
+
+class TemplateIndex:
+    """A parse-once structural index of an HTML template for JIT selector matching.
+
+    TemplateIndex performs a single HTML -> XML conversion and one traversal 
+    of the resulting tree, recording every element's tag, id, classes, 
+    attributes and parent position. Every CSS rule of a render is then 
+    matched against this index instead of reparsing the template per rule.
+
+    Attributes:
+        tmplt_str (str): The raw HTML source string that was indexed.
+        tag_info (dict): Tags mapped to their merged attributes. Identical to 
+            `TemplateResolver.template_resolver()` output for the same template.
+        tags (set): Every tag name found in the template.
+        ids (set): Every id value found in the template.
+        classes (set): Every individual class token found in the template.
+        attributes (dict): Attribute names mapped to the set of their values.
+        elements (list): Document-ordered `(tag, attrs, parent_position)` 
+            records; `parent_position` is -1 for top-level elements.
+
+    Example:
+        >>> index = TemplateIndex('<ul class="menu"><li id="a"></li></ul>')
+        >>> index.match_tokens(["menu"])
+        True
+        >>> [tag for tag, _ in index.ancestors(1)]
+        ['ul']
+    """
+    __slots__ = (
+        'tmplt_str',
+        'tag_info',
+        'tags',
+        'ids',
+        'classes',
+        'attributes',
+        'elements',
+        '_merged_values',
+        '_match_cache',
+    )
+    def __init__(self, tmplt_str: str | None = None):
+        self.tmplt_str = str(tmplt_str) if tmplt_str else ""
+        self.tag_info: dict[str, dict] = {}
+        self.tags: set[str] = set()
+        self.ids: set[str] = set()
+        self.classes: set[str] = set()
+        self.attributes: dict[str, set[str]] = {}
+        self.elements: list[tuple[str, dict, int]] = []
+        self._merged_values: tuple[str, ...] = ()
+        self._match_cache: dict[tuple[str, ...], bool] = {}
+        if self.tmplt_str:
+            self._build()
+
+    def _build(self) -> None:
+        """Parses the template once and fills every lookup table."""
+        root = ET.fromstring(HtmlToXmlConverter(self.tmplt_str).to_xml())
+        merge = TemplateResolver().merge_attributes
+        stack = [(child, -1) for child in reversed(root)]
+        while stack:
+            elem, parent = stack.pop()
+            tag, attrs = elem.tag, elem.attrib
+            position = len(self.elements)
+            self.elements.append((tag, attrs, parent))
+            self.tags.add(tag)
+            if tag not in self.tag_info:
+                self.tag_info[tag] = attrs.copy()
+            else:
+                self.tag_info[tag] = merge(self.tag_info[tag], attrs)
+            for attr, value in attrs.items():
+                self.attributes.setdefault(attr, set()).add(value)
+                if attr == "id":
+                    self.ids.add(value)
+                elif attr == "class":
+                    self.classes.update(value.split())
+            stack.extend((child, position) for child in reversed(elem))
+        self._merged_values = tuple(
+            value for attrs in self.tag_info.values() for value in attrs.values()
+        )
+
+    def ancestors(self, position: int):
+        """Yields `(tag, attrs)` for each ancestor of an element, nearest first.
+
+        Args:
+            position (int): The element's index in `self.elements`.
+        """
+        parent = self.elements[position][2]
+        while parent != -1:
+            tag, attrs, parent_of_parent = self.elements[parent]
+            yield tag, attrs
+            parent = parent_of_parent
+
+    def match_tokens(self, selector: list[str]) -> bool:
+        """Checks whether stripped selector tokens exist in the template.
+
+        A selector matches when any token is a known tag, or when a single 
+        merged attribute value contains every token. Results are memoised 
+        per token tuple, so repeated selectors cost one dict lookup.
+
+        Args:
+            selector (list[str]): Selector tokens with '.', '#' and '[]' stripped.
+
+        Returns:
+            bool: True if the selector targets something in the template.
+        """
+        key = tuple(selector)
+        hit = self._match_cache.get(key)
+        if hit is None:
+            hit = not self.tags.isdisjoint(key) or any(
+                all(s in value for s in key) for value in self._merged_values
+            )
+            self._match_cache[key] = hit
+        return hit
@@ -11,6 +11,7 @@ import subprocess
 from rich.panel import Panel
 from rich.syntax import Syntax
 from probo.terminal.emmet import emmet
+from probo.streaming.sinks import FileSink, render_to
 from probo.terminal.app_generator import (
     create_probo_dj_structure,
     create_hacksoft_structure,
@@ -993,10 +994,9 @@ def build_from_route(
     for r in routes:
         file_name = "index.html" if r.path == "/" else f"{r.path.strip('/')}.html"
         content = r.component()
-        html = content.render() if hasattr(content, "render") else str(content)
 
-        with open(out_dir / file_name, "w", encoding="utf-8") as f:
-            f.write(html)
+        with FileSink(out_dir / file_name) as sink:
+            render_to(content, sink)
         console.print(f"  [green]✓[/green] Built: {r.path} -> {file_name}")
 
     if preview:
@@ -1,6 +1,10 @@
-from typing import Any, Dict, Set, Generator
+from typing import Any, AsyncIterator, Dict, Iterable, Set, Generator
+import re
 import html
-from collections import deque
+import secrets
+import threading
+from collections import OrderedDict, deque
+from contextvars import ContextVar
 import inspect
 
 # --- HIGH-SPEED CACHE ---
@@ -159,6 +163,117 @@ class EnumLookUPMixin:
         return self.keys_set
 
 
+class CustomTag:
+    """
+    A registered custom element (web component) definition.
+
+    Exposes the same `.value` shape as `Tag` members, `(name, {"void": bool})`,
+    so the Element builder treats it exactly like a built-in tag.
+
+    Args:
+        name (str): The tag name, e.g. "x-icon".
+        void (bool): If True, renders as a self-closing tag.
+        attributes (Iterable[str], optional): Allowed attribute names. None accepts any.
+
+    Raises:
+        ValueError: If the name is empty.
+    """
+
+    __slots__ = ("name", "void", "attributes", "value")
+
+    def __init__(self, name: str, void: bool = False, attributes=None):
+        if not name or not name.strip():
+            raise ValueError("A custom element needs a non-empty tag name.")
+        self.name = name.lower()
+        self.void = bool(void)
+        self.attributes = (
+            frozenset(attr.lower().replace("_", "-") for attr in attributes)
+            if attributes is not None
+            else None
+        )
+        self.value = (self.name, {"void": self.void})
+
+    def invalid_attributes(self, attrs: dict[str, Any]) -> list[str]:
+        """Returns the attribute names not declared for this element."""
+        if self.attributes is None:
+            return []
+        invalid = []
+        for key in attrs:
+            normalized = key.lower().replace("_", "-")
+            if normalized not in self.attributes and not normalized.startswith(
+                ("data-", "aria-", "hx-", "on", "xml", "ng-", "v-")
+            ):
+                invalid.append(key)
+        return invalid
+
+
+class CustomElementRegistry:
+    """
+    Persistent registry of custom element definitions.
+
+    Tags declared with `define()` keep their void-ness and allowed attributes
+    for every later render. Unknown names are registered implicitly on first
+    use (one definition per name and void flag), so rendering thousands of
+    `<x-icon>` elements is a dict lookup rather than building a new Enum.
+    Implicit definitions are only a lookup cache: at most `max_implicit` are
+    kept, oldest first out, so tag names taken from user input cannot grow
+    the registry without bound. An evicted name is simply rebuilt on its
+    next use; `define()`d tags are never evicted.
+
+    Args:
+        max_implicit (int): Number of implicit definitions kept.
+
+    Example:
+        >>> custom_elements.define("x-icon", void=True, attributes=["name", "size"])
+        >>> custom_elements.get("x-icon").value
+        ('x-icon', {'void': True})
+    """
+
+    __slots__ = ("max_implicit", "_defined", "_implicit", "_lock")
+
+    def __init__(self, max_implicit: int = 1024):
+        self.max_implicit = max_implicit
+        self._defined: Dict[str, CustomTag] = {}
+        self._implicit: "OrderedDict[tuple[str, bool], CustomTag]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def define(self, name: str, void: bool = False, attributes=None) -> CustomTag:
+        """Declares (or redeclares) a custom element; the definition wins over call-site flags."""
+        tag = CustomTag(name, void, attributes)
+        with self._lock:
+            self._defined[tag.name] = tag
+        return tag
+
+    def get(self, name: str, void: bool = False) -> CustomTag:
+        """O(1) lookup, registering an implicit definition for unseen names."""
+        key = name.lower()
+        tag = self._defined.get(key) or self._implicit.get((key, void))
+        if tag is None:
+            with self._lock:
+                tag = self._implicit.setdefault((key, void), CustomTag(key, void))
+                while len(self._implicit) > self.max_implicit:
+                    self._implicit.popitem(last=False)
+        return tag
+
+    def undefine(self, name: str) -> bool:
+        with self._lock:
+            return self._defined.pop(name.lower(), None) is not None
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._defined
+
+    def __len__(self) -> int:
+        return len(self._defined) + len(self._implicit)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._defined.clear()
+            self._implicit.clear()
+
+
+custom_elements = CustomElementRegistry()
+
+
 class StreamManager:
     """
     A lightweight wrapper that carries a generator and its wrapping tags.
@@ -201,11 +316,21 @@ class StreamManager:
         if self.closing:
             yield self.closing
     
+    def __aiter__(self) -> AsyncIterator[str]:
+        """Async iteration; resolves async content deferred by the sync pipeline."""
+        return astream_chunks(self, batch=self.chunk_size)
+
     def tolist(self,) -> list:
         return  list(self)
     def tostring(self,) -> str:
         return  "".join(list(self))
 
+    async def atolist(self,) -> list:
+        return [chunk async for chunk in self]
+
+    async def atostring(self,) -> str:
+        return "".join(await self.atolist())
+
 def _resolve_stream(content_tuple, chunk_size=50,EL=None):
     """
     Helper to flatten nested generators and classes.
@@ -219,10 +344,140 @@ def _resolve_stream(content_tuple, chunk_size=50,EL=None):
                 yield from item.stream(batch=chunk_size, EL=EL)  # Bridge to classes
             else:
                  yield from item.stream(batch=chunk_size)  # Bridge to classes
+        elif is_async_content(item):
+            yield defer_async(item, EL=EL)
         else:
             yield ProboSourceString(item)
 
 
+# --- ASYNC STREAMING ---
+# The sync stream pipelines stay untouched for sync content. When they meet an
+# awaitable or async iterable they emit a marker instead, registered in the
+# slot table of the `astream_chunks` call that is currently pulling them; the
+# driver then splices the awaited output in place of each marker. Markers
+# carry a random token drawn per `astream_chunks` call, so page text that
+# looks like a marker (or one copied out of another stream) is passed through
+# as text instead of crashing the driver or splicing in someone else's slot.
+_ASYNC_SLOTS: ContextVar["_AsyncSlots | None"] = ContextVar("probo_async_slots", default=None)
+_ASYNC_MARKER = re.compile("\x00probo-async:([0-9a-f]{16}):(\\d+)\x00")
+
+
+class _AsyncSlots:
+    """The async items deferred while one `astream_chunks` call pulls its stream."""
+
+    __slots__ = ("items", "token")
+
+    def __init__(self):
+        self.items: list = []
+        self.token = secrets.token_hex(8)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def add(self, item: Any, EL=None) -> str:
+        self.items.append((item, EL))
+        return f"\x00probo-async:{self.token}:{len(self.items) - 1}\x00"
+
+    def get(self, match: "re.Match") -> Any:
+        """The (item, EL) a marker match refers to, or None for a forged marker."""
+        if match.group(1) != self.token:
+            return None
+        index = int(match.group(2))
+        return self.items[index] if index < len(self.items) else None
+
+
+def is_async_content(item: Any) -> bool:
+    """True for awaitables and async iterables (async generators, async cursors)."""
+    return hasattr(item, "__aiter__") or inspect.isawaitable(item)
+
+
+def defer_async(item: Any, EL=None) -> ProboSourceString:
+    """Registers async content with the active `astream_chunks` and returns its marker.
+
+    Raises:
+        TypeError: If no async stream is pulling the pipeline (plain `stream()`
+            or `render()` cannot wait for async content).
+    """
+    slots = _ASYNC_SLOTS.get()
+    if slots is None:
+        if inspect.iscoroutine(item):
+            item.close()
+        raise TypeError(
+            f"Async content ({type(item).__name__}) can only be streamed with astream()."
+        )
+    return ProboSourceString(slots.add(item, EL))
+
+
+async def _aresolve(item: Any, batch: int, EL=None) -> AsyncIterator[str]:
+    """Yields the HTML fragments of one async content item."""
+    if inspect.isawaitable(item):
+        item = await item
+    if hasattr(item, "__aiter__"):
+        async for sub_item in item:
+            async for fragment in _aresolve(sub_item, batch, EL):
+                yield fragment
+    elif inspect.isgenerator(item) or isinstance(item, (list, tuple, deque)):
+        for sub_item in item:
+            async for fragment in _aresolve(sub_item, batch, EL):
+                yield fragment
+    elif hasattr(item, "astream"):
+        if hasattr(item, "light_tag") and EL is not None:
+            chunks = item.astream(EL, batch)
+        else:
+            chunks = item.astream(batch=batch)
+        async for fragment in chunks:
+            yield fragment
+    elif hasattr(item, "render"):
+        rendered = item.render()
+        yield "".join(rendered) if isinstance(rendered, (list, deque)) else rendered
+    elif item is not None:
+        yield str(item)
+
+
+async def astream_chunks(chunks: Iterable[str], batch: int = 50) -> AsyncIterator[str]:
+    """
+    Drives a synchronous chunk stream from async code.
+
+    Chunks without deferred async content are passed through as-is, so a fully
+    synchronous tree streams exactly as `stream()` would. Each deferred item is
+    awaited/iterated in place and its fragments are re-batched by `batch`.
+    """
+    slots = _AsyncSlots()
+    iterator = iter(chunks)
+    done = object()
+    while True:
+        token = _ASYNC_SLOTS.set(slots)
+        try:
+            chunk = next(iterator, done)
+        finally:
+            _ASYNC_SLOTS.reset(token)
+        if chunk is done:
+            return
+        if not slots or "\x00" not in chunk:
+            yield chunk
+            continue
+
+        position = 0
+        for match in _ASYNC_MARKER.finditer(chunk):
+            slot = slots.get(match)
+            if slot is None:
+                continue
+            if match.start() > position:
+                yield ProboSourceString(chunk[position : match.start()])
+            position = match.end()
+            item, EL = slot
+            buffer = []
+            async for fragment in _aresolve(item, batch, EL):
+                buffer.append(fragment)
+                if len(buffer) >= batch:
+                    yield ProboSourceString("".join(buffer))
+                    buffer.clear()
+            if buffer:
+                yield ProboSourceString("".join(buffer))
+        if position < len(chunk):
+            yield ProboSourceString(chunk[position:])
+
+
 def data_escaper(data: Any) -> Any:
     """
     Recursively iterates through data structures (dicts, lists, tuples) 
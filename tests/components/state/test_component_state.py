@@ -80,3 +80,41 @@ def test_cs_data_propagation():
 
     # Render 2
     assert "<b>99</b>" in cs.resolved_template(es.placeholder)
+
+
+def test_cs_single_pass_many_states(monkeypatch):
+    """
+    Scenario: Hundreds of states in one template.
+    Expected: The template is scanned once and reused on the next render;
+    every placeholder is substituted in place.
+    """
+    from probo.components.state import component_state
+
+    states = [ElementState("i", d_state=f"k{n}") for n in range(200)]
+    template = "<ul>" + "".join(f"<li>{es.placeholder}</li>" for es in states) + "</ul>"
+    cs = ComponentState(*states, d_data={f"k{n}": n + 1 for n in range(200)})
+
+    scans = []
+    original = component_state.PlaceholderIndex.__init__
+
+    def counting_init(self, template):
+        scans.append(1)
+        original(self, template)
+
+    monkeypatch.setattr(component_state.PlaceholderIndex, "__init__", counting_init)
+    component_state.placeholder_index.cache_clear()
+
+    first = cs.resolved_template(template)
+    second = cs.resolved_template(template)
+
+    assert first == second
+    assert first == "<ul>" + "".join(f"<li><i>{n + 1}</i></li>" for n in range(200)) + "</ul>"
+    assert len(scans) == 1
+
+
+def test_cs_replacement_is_literal():
+    """Resolved values are inserted verbatim, never read as regex templates."""
+    es = ElementState("code", d_state="snippet")
+    cs = ComponentState(es, d_data={"snippet": r"\1 \g<0>"})
+
+    assert cs.resolved_template(es.placeholder) == r"<code>\1 \g<0></code>"
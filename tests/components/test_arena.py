@@ -0,0 +1,158 @@
+import pytest
+
+from probo.components.arena import ArenaRef, TreeArena
+from probo.components.elements import Element
+from probo.components.light_tags.oop.block_tags import Ldiv, Lli, Lspan, Lul
+from probo.streaming.sinks import ListSink
+from probo.utility import ProboSourceString
+
+
+def build_list(arena):
+    return arena.ul(
+        arena.li(arena.span("a & b", Class="cell"), Class="row"),
+        arena.li("plain", 3, ProboSourceString("<b>safe</b>"), Class="row"),
+        id="rows",
+    )
+
+
+def light_list():
+    return Lul(
+        Lli(Lspan("a & b", Class="cell"), Class="row"),
+        Lli("plain", 3, ProboSourceString("<b>safe</b>"), Class="row"),
+        id="rows",
+    )
+
+
+@pytest.mark.parametrize("natural", [False, True])
+def test_render_matches_light_nodes(natural):
+    arena = TreeArena()
+    root = build_list(arena)
+
+    assert arena.render(root, Element(is_natural=natural)) == light_list().render(Element(is_natural=natural))
+
+
+def test_columns_share_tags_and_attribute_sets():
+    arena = TreeArena()
+    root = build_list(arena)
+
+    assert isinstance(root, ArenaRef)
+    assert len(arena) == 8
+    assert arena.tag_names == ["span", "li", "ul"]
+    assert arena.attribute_sets == [(), (("Class", "cell"),), (("Class", "row"),), (("id", "rows"),)]
+    assert list(arena.attribute_uses) == [0, 1, 2, 1]
+    assert list(arena.children(root)) == [2, 3]
+
+
+def test_equal_values_of_other_types_keep_their_own_set():
+    arena = TreeArena()
+    arena.div(hidden=True)
+    arena.div(hidden=1)
+
+    assert len(arena.attribute_sets) == 3
+
+
+def test_append_and_nested_iterables_keep_order():
+    arena = TreeArena()
+    body = arena.tbody()
+    for i in range(3):
+        arena.append(body, arena.tr(arena.td(str(i))))
+    arena.append(body, [arena.tr(arena.td(str(i))) for i in (3, 4)], (arena.tr() for _ in range(1)))
+
+    html = arena.render(body)
+
+    assert html.startswith("<tbody><tr><td>0</td></tr><tr><td>1</td></tr>")
+    assert html.endswith("<tr><td>4</td></tr><tr></tr></tbody>")
+
+
+def test_stream_and_render_into_agree_with_render():
+    arena = TreeArena()
+    root = arena.div(*[arena.p(f"row {i}", Class="r") for i in range(40)], id="page")
+
+    chunks = list(arena.stream(root, batch=7))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == arena.render(root)
+    assert arena.render_into(ListSink(), root).getvalue() == arena.render(root)
+
+
+def test_deep_trees_render_without_recursion():
+    arena = TreeArena()
+    node = arena.span("leaf")
+    for _ in range(5000):
+        node = arena.div(node)
+
+    html = arena.render(node)
+
+    assert html.count("<div>") == 5000 and "<span>leaf</span>" in html
+
+
+def test_void_tags_and_unframed_tags_render_like_light_nodes():
+    arena = TreeArena()
+    root = arena.html(arena.doctype(), arena.body(arena.br(), arena.img(src="a.png", alt="a")))
+
+    assert arena.render(root) == '<html><!DOCTYPE html><body><br/><img src="a.png" alt="a"/></body></html>'
+
+
+def test_invalid_links_and_tags_are_rejected():
+    arena = TreeArena()
+    child = arena.span("x")
+    arena.div(child)
+
+    with pytest.raises(ValueError):
+        arena.div(child)
+    with pytest.raises(ValueError):
+        arena.element("not-a-tag")
+    with pytest.raises(ValueError):
+        arena.append(arena.text_node("t"), "u")
+
+
+def test_cycles_are_rejected():
+    arena = TreeArena()
+    span = arena.span("x")
+    root = arena.div(span)
+
+    with pytest.raises(ValueError, match="ancestor"):
+        arena.append(span, root)
+    with pytest.raises(ValueError, match="ancestor"):
+        arena.append(root, root)
+    assert arena.render(root) == "<div><span>x</span></div>"
+
+
+def test_validation_errors_surface_at_render():
+    arena = TreeArena()
+    root = arena.div(arena.span("x", bogus_attr="z"))
+
+    with pytest.raises(ValueError):
+        arena.render(root)
+    assert "<div>" in arena.render(root, Element(probo_pretty_error=True))
+
+
+def test_shared_root_tree_matches_light_builder_with_class_names():
+    arena = TreeArena()
+
+    assert arena.render(arena.div(arena.span("x"), Class="wrap")) == Ldiv(Lspan("x"), Class="wrap").render(Element())
+
+
+class Rendered:
+    def __init__(self, html):
+        self.html = html
+
+    def render(self):
+        return self.html
+
+
+def test_objects_with_render_are_escaped_once_like_light_nodes():
+    arena = TreeArena()
+    root = arena.div(Rendered("a<b & c"), Rendered(ProboSourceString("<i>kept</i>")))
+
+    expected = Ldiv(Rendered("a<b & c"), Rendered(ProboSourceString("<i>kept</i>"))).render(Element())
+    assert arena.render(root) == expected == "<div>a&lt;b &amp; c<i>kept</i></div>"
+
+
+@pytest.mark.parametrize("natural", [False, True])
+def test_light_nodes_are_copied_into_the_arena(natural):
+    arena = TreeArena()
+    root = arena.div(light_list(), Lspan("x < y"))
+
+    EL = Element(is_natural=natural)
+    assert arena.render(root, EL) == Ldiv(light_list(), Lspan("x < y")).render(Element(is_natural=natural))
@@ -0,0 +1,103 @@
+import pickle
+import weakref
+from collections import deque
+
+import pytest
+
+from probo import DIV, LI, SPAN, UL
+from probo.components.compact import AttributeSet, intern_attributes
+from probo.components.elements import Element
+from probo.components.light_tags.oop.block_tags import Lli, Lul
+
+
+def test_equal_attributes_share_one_set():
+    first, second = LI("a", Class="row"), LI("b", Class="row")
+
+    assert first._attributes is second._attributes
+    assert isinstance(first._attributes, AttributeSet)
+    assert LI("c")._attributes is SPAN("d")._attributes
+    assert intern_attributes({"hidden": True}) is not intern_attributes({"hidden": 1})
+    assert intern_attributes({"Class": "a", "id": "b"}) is not intern_attributes({"id": "b", "Class": "a"})
+
+
+def test_unhashable_values_stay_private():
+    attributes = {"data_items": ["a", "b"]}
+
+    assert intern_attributes(attributes) is attributes
+
+
+def test_attribute_sets_are_immutable():
+    shared = intern_attributes({"Class": "row"})
+
+    with pytest.raises(TypeError):
+        shared["Class"] = "other"
+    with pytest.raises(TypeError):
+        shared.update(id="x")
+
+
+def test_editing_promotes_without_touching_siblings():
+    first, second = LI("a", Class="row"), LI("b", Class="row")
+    first.attributes["Class"] = "row active"
+    second.attr_manager.set_attr("id", "two")
+
+    assert first.render() == '<li class="row active">a</li>'
+    assert second.render() == '<li class="row" id="two">b</li>'
+    assert LI("c", Class="row")._attributes == {"Class": "row"}
+
+
+def test_content_is_a_tuple_until_mutated():
+    item = LI("a")
+    assert isinstance(item._content, tuple)
+
+    item.content.append("b")
+
+    assert isinstance(item._content, deque)
+    assert item.render() == "<li>ab</li>"
+
+
+def test_rendering_and_queries_do_not_promote():
+    rows = [LI(SPAN(str(i), Class="cell"), Class="row") for i in range(3)]
+    page = DIV(UL(*rows), id="page")
+
+    page.render()
+    list(page.stream())
+    page.build_index()
+    page.select_all("li.row > span")
+
+    assert all(node.is_compact for node in page.walk())
+
+
+def test_add_promotes_only_the_parent():
+    child = SPAN("x")
+    parent = DIV("a").add(child)
+
+    assert isinstance(parent._content, deque)
+    assert child.is_compact
+    assert parent.render() == "<div>a<span>x</span></div>"
+
+
+def test_light_nodes_are_compact():
+    tree = Lul(Lli("a", Class="row"), Lli("b", Class="row"))
+    first, second = tree.node_children
+
+    assert first._attributes is second._attributes
+    assert tree.render(Element()) == '<ul><li class="row">a</li><li class="row">b</li></ul>'
+    assert all(node.is_compact for node in (tree, first, second))
+
+
+def test_heavy_nodes_still_take_ad_hoc_attributes_and_weak_references():
+    item = LI("a")
+    item.cart_id = 7
+
+    assert item.cart_id == 7
+    assert weakref.ref(item)() is item
+    assert item.render() == "<li>a</li>"
+
+
+def test_pickled_trees_reintern_their_attributes():
+    page = DIV(SPAN("x", Class="cell"), id="page")
+
+    loaded = pickle.loads(pickle.dumps(page))
+
+    assert loaded.render() == page.render()
+    assert loaded.node_children[0]._attributes is SPAN("y", Class="cell")._attributes
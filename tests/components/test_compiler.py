@@ -0,0 +1,83 @@
+from probo import DIV, H1, LI, P, SPAN, UL
+from probo.components.compiler import CompiledTemplate, compile_tree
+from probo.components.elements import Element
+from probo.components.light_tags.oop.block_tags import Ldiv, Lspan
+from probo.utility import ProboSourceString
+
+
+class Counter:
+    """A component-like child whose output changes on every render."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def render(self):
+        self.calls += 1
+        return ProboSourceString(f"<span>{self.calls}</span>")
+
+
+def test_static_tree_compiles_to_one_literal():
+    page = DIV(H1("Title"), UL(*[LI(f"item {i}") for i in range(50)]), id="main")
+
+    compiled = page.compile()
+
+    assert isinstance(compiled, CompiledTemplate)
+    assert compiled.is_static
+    assert len(compiled.segments) == 1
+    assert compiled.render() == page.render()
+
+
+def test_dynamic_holes_are_slots_and_stay_live():
+    counter = Counter()
+    page = DIV(H1("Orders"), counter, P("footer & more"))
+
+    compiled = page.compile()
+
+    assert compiled.slot_count == 1
+    assert counter.calls == 0
+    assert compiled.render() == "<div><h1>Orders</h1><span>1</span><p>footer &amp;amp; more</p></div>"
+    assert compiled.render().count("<span>2</span>") == 1
+
+
+def test_static_subtrees_are_not_revalidated(monkeypatch):
+    compiled = DIV(*[SPAN(str(i), id=f"s{i}") for i in range(20)], Counter()).compile()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("static markup must not be rebuilt")
+
+    monkeypatch.setattr(Element, "tag_frame", fail)
+    monkeypatch.setattr(Element, "element_health", fail)
+
+    assert compiled.render().startswith('<div><span id="s0">0</span>')
+
+
+def test_generators_and_callables_stay_dynamic():
+    compiled = DIV((x for x in ["a", "b"]), len).compile()
+
+    assert compiled.slot_count == 2
+    assert compiled.render().startswith("<div>ab")
+
+
+def test_render_conditions_keep_the_element_live():
+    guarded = P("secret").add_render_constraints(is_admin=True)
+    compiled = DIV(SPAN("open"), guarded).compile()
+
+    assert compiled.slot_count == 1
+    assert compiled.render() == "<div><span>open</span><p>secret</p></div>"
+
+
+def test_light_tree_compiles_with_shared_builder():
+    tree = Ldiv(Lspan("x & y"), Counter(), Class="wrap")
+    EL = Element()
+
+    compiled = tree.compile(EL)
+
+    assert compiled.slot_count == 1
+    assert compiled.render() == '<div class="wrap"><span>x &amp; y</span><span>1</span></div>'
+
+
+def test_compile_tree_wraps_unframeable_roots():
+    compiled = compile_tree(Counter())
+
+    assert compiled.slot_count == 1
+    assert compiled.render() == "<span>1</span>"
@@ -43,4 +43,57 @@ def test_custom_element_stream():
     
     assert '<stream-tag' in html
     assert 'Async Content' in html
-    assert '</stream-tag>' in html
\ No newline at end of file
+    assert '</stream-tag>' in html
+
+def test_custom_element_registry_reuses_definitions(monkeypatch):
+    """Custom tags are resolved from the registry, never via new Enums or thaw()."""
+    from probo.components.elements import Element, Tag
+    from probo.utility import custom_elements
+
+    def fail(*args, **kwargs):
+        raise AssertionError("custom tags must not rebuild Enums")
+
+    monkeypatch.setattr(Tag, "thaw", classmethod(fail))
+    monkeypatch.setattr("probo.components.elements.Enum", fail, raising=False)
+
+    icons = [Element().custom_element("x-icon", str(i)).element for i in range(100)]
+
+    assert icons[3] == "<x-icon>3</x-icon>"
+    assert custom_elements.get("x-icon") is custom_elements.get("X-ICON")
+
+
+def test_custom_element_registry_definition_wins():
+    from probo.components.elements import Element
+    from probo.utility import custom_elements
+
+    custom_elements.define("app-badge", void=True, attributes=["tone", "label"])
+    try:
+        el = Element().custom_element("app-badge", tone="info", data_id="7").element
+        assert el == '<app-badge tone="info" data-id="7"/>'
+
+        with pytest.raises(ValueError, match="colour"):
+            Element().custom_element("app-badge", colour="red")
+    finally:
+        custom_elements.undefine("app-badge")
+
+    assert "app-badge" not in custom_elements
+    assert Element().custom_element("app-badge").element == "<app-badge></app-badge>"
+
+
+def test_custom_element_builtin_names_resolve_case_insensitively():
+    from probo.components.elements import Element
+
+    assert Element().custom_element("DIV", "x").element == "<div>x</div>"
+
+
+def test_implicit_custom_elements_are_bounded():
+    from probo.utility import CustomElementRegistry
+
+    registry = CustomElementRegistry(max_implicit=2)
+    registry.define("app-shell")
+    tags = [registry.get(f"x-tag-{i}") for i in range(5)]
+
+    assert len(registry) == 3
+    assert "app-shell" in registry
+    assert registry.get("x-tag-4") is tags[-1]
+    assert registry.get("x-tag-0").value == ("x-tag-0", {"void": False})
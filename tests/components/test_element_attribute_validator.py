@@ -1,4 +1,11 @@
-from probo.components.attributes import ElementAttributeValidator
+import pytest
+from probo.components.attributes import (
+    AttributeSchema,
+    AttributeValue,
+    ElementAttribute,
+    ElementAttributeValidator,
+    compile_attribute_schema,
+)
 
 def test_validator_success_path():
     """Test standard validation with valid attributes."""
@@ -17,3 +24,49 @@ def test_validator_error_path():
     assert validator.validate() is False
     assert "unknown-attr='value'" in validator.error_attrs
     assert 'cx' in validator.valid_attrs
+
+
+@pytest.mark.parametrize("tag", ["<a>", "<input>", "<form>", "<circle>", "<div>", ""])
+def test_schema_tables_match_attribute_rules(tag):
+    """The compiled tables are exactly what the enum rules allow for the tag."""
+    schema = AttributeSchema(tag)
+    rules = AttributeValue.ATTRIBUTE_VALUE.value
+    restrictions = ElementAttribute.ELEMENT_ATTRIBUTE.value
+    tag_clean = tag.strip("<>")
+
+    def permitted(key, rule):
+        if not rule:
+            return False
+        if restrictions.get(key) and tag and tag not in restrictions[key]:
+            return False
+        return not isinstance(rule, dict) or tag_clean in rule
+
+    expected = {k for k, rule in rules.items() if permitted(k, rule)}
+
+    assert schema.allowed == expected
+    assert schema.any_value == {k for k in expected if rules[k] == "any"}
+    assert schema.value_rules == {
+        k: frozenset(rules[k]) for k in expected if isinstance(rules[k], list)
+    }
+    assert schema.tag_value_rules.keys() == {
+        k for k in expected if isinstance(rules[k], dict)
+    }
+
+
+def test_schema_is_compiled_once_per_tag():
+    compile_attribute_schema.cache_clear()
+    for _ in range(100):
+        ElementAttributeValidator("<input>", type="text", Class="x").validate()
+
+    info = compile_attribute_schema.cache_info()
+    assert (info.misses, info.hits) == (1, 99)
+    assert compile_attribute_schema("<input>") is compile_attribute_schema("<input>")
+
+
+def test_validator_keeps_rule_error_messages():
+    validator = ElementAttributeValidator("<form>", autocomplete="sometimes")
+
+    assert validator.validate() is False
+    assert validator.error_attrs == [
+        "autocomplete='sometimes' on <form> (Expected: ['on', 'off'])"
+    ]
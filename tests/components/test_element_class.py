@@ -165,3 +165,47 @@ def test_attributes_chaining(builder):
     assert res is builder
     res.div()
     assert '<div id="1">X</div>' == builder.element
+
+
+def test_tag_template_cache_reuses_shapes():
+    """Repeated (tag, attrs) shapes are assembled once and shared."""
+    from src.probo.components.elements import TAG_TEMPLATES
+
+    TAG_TEMPLATES.clear()
+    cells = [Element().td(str(i), Class="cell").element for i in range(50)]
+
+    assert cells[7] == '<td class="cell">7</td>'
+    assert TAG_TEMPLATES.misses == 1
+    assert TAG_TEMPLATES.hits == 49
+
+
+def test_tag_template_cache_keys_on_value_types():
+    """1, True and ["a"] must not collide with each other or with strings."""
+    assert Element().input(value=1).element == '<input value="1"/>'
+    assert Element().input(hidden=True).element == "<input hidden/>"
+    assert Element().div(Class=["a", "b"]).element == '<div class="a b"></div>'
+    assert Element().div(Class=("a", "b")).element == "<div class=\"('a', 'b')\"></div>"
+
+
+def test_tag_template_cache_is_bounded_and_skips_unhashable():
+    from src.probo.components.elements import TagTemplateCache, TagTemplate
+
+    cache = TagTemplateCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put((key,), TagTemplate(f"<{key}>", f"</{key}>", False))
+
+    assert len(cache) == 2
+    assert cache.get(("a",)) is None
+    assert Element().div(style={"k": "v"}).element == "<div style=\"{'k': 'v'}\"></div>"
+
+
+def test_tag_template_cache_thread_safety():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def render(i):
+        return Element().li(str(i), Class=f"row-{i % 7}").element
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(render, range(400)))
+
+    assert results == [f'<li class="row-{i % 7}">{i}</li>' for i in range(400)]
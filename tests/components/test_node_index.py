@@ -0,0 +1,132 @@
+from probo import DIV, LI, P, SECTION, SPAN, UL
+from probo.components import NodeIndex
+
+
+def build_page():
+    badge = SPAN("3", id="badge", Class="pill hot")
+    items = UL(*[LI(f"row {i}", id=f"row-{i}", Class="row") for i in range(5)])
+    page = DIV(SECTION(P("intro", Class="lead"), badge), items, id="page")
+    return page, badge, items
+
+
+def test_index_answers_like_the_tree_walk():
+    page, badge, items = build_page()
+    expected = (
+        page.find_by_id("row-3"),
+        page.find_all_by_class("row"),
+        page.find_all_by_tag("li"),
+        page.select(".hot"),
+        page.select("SPAN"),
+    )
+
+    index = page.build_index()
+
+    assert isinstance(index, NodeIndex)
+    assert len(index) == 10
+    assert page.find_by_id("row-3") is expected[0] is items.node_children[3]
+    assert page.find_all_by_class("row") == expected[1]
+    assert page.find_all_by_tag("LI") == expected[2]
+    assert page.select(".hot") is expected[3] is badge
+    assert page.select("#badge") is badge
+    assert page.select("span") is expected[4] is badge
+
+
+def test_add_and_remove_update_the_index():
+    page, _, items = build_page()
+    page.build_index()
+
+    extra = DIV(SPAN("new", id="late", Class="row"))
+    items.add(extra)
+    assert page.find_by_id("late") is extra.node_children[0]
+    assert len(page.find_all_by_class("row")) == 6
+
+    items.remove(extra)
+    assert page.find_by_id("late") is None
+    assert len(page.find_all_by_class("row")) == 5
+
+
+def test_attribute_mutation_reindexes_the_node():
+    page, badge, _ = build_page()
+    page.build_index()
+
+    badge.attr_manager.set_id("count").remove_class("hot")
+
+    assert page.find_by_id("badge") is None
+    assert page.find_by_id("count") is badge
+    assert page.find_all_by_class("hot") == []
+    assert page.find_all_by_class("pill") == [badge]
+
+
+def test_direct_attribute_edits_need_mark_dirty():
+    page, badge, _ = build_page()
+    page.build_index()
+
+    badge.attributes["id"] = "moved"
+    assert page.find_by_id("moved") is None
+
+    badge.mark_dirty()
+    assert page.find_by_id("moved") is badge
+
+
+def test_drop_index_falls_back_to_the_tree_walk():
+    page, badge, _ = build_page()
+    page.build_index()
+    page.drop_index()
+
+    badge.attributes["id"] = "moved"
+
+    assert page.node_index is None
+    assert page.find_by_id("moved") is badge
+
+
+def test_lookups_after_add_come_back_in_document_order():
+    page = DIV(SPAN("a", id="a", Class="row"), UL(*[LI(f"r{i}", id=f"r{i}", Class="row") for i in range(3)]))
+    page.build_index()
+
+    page.add(SPAN("first", id="first", Class="row"), 1)
+
+    walked = [node.attributes["id"] for node in page.walk() if "row" in node.attributes.get("Class", "")]
+    assert walked == ["a", "first", "r0", "r1", "r2"]
+    assert [node.attributes["id"] for node in page.find_all_by_class("row")] == walked
+
+
+def test_index_keeps_document_order_through_random_edits():
+    import random
+
+    rng = random.Random(7)
+    page = DIV(*[UL(*[LI(f"{s}-{r}", Class="row") for r in range(3)]) for s in range(4)])
+    page.build_index()
+    lists = list(page.node_children)
+
+    for step in range(60):
+        target = rng.choice(lists)
+        if rng.random() < 0.25 and target.node_children:
+            target.remove(rng.choice(target.node_children))
+        else:
+            item = LI(SPAN(f"n{step}", Class="row"), Class="row")
+            target.add(item, rng.randint(0, len(target.node_children)))
+        walked = [node for node in page.walk() if "row" in node.attributes.get("Class", "")]
+        assert page.find_all_by_class("row") == walked
+        assert page.find_all_by_tag("li") == [node for node in page.walk() if node.element_tag == "li"]
+
+
+def test_lookup_after_add_does_not_walk_the_tree(monkeypatch):
+    from probo.components import node as node_module
+
+    page, _, items = build_page()
+    page.build_index()
+    visited = []
+    real_iter_subtree = node_module.iter_subtree
+
+    def counting(root, *args):
+        for current in real_iter_subtree(root, *args):
+            visited.append(current)
+            yield current
+
+    monkeypatch.setattr(node_module, "iter_subtree", counting)
+    extra = LI("mid", id="mid", Class="row")
+    items.add(extra, 2)
+
+    assert page.find_by_id("mid") is extra
+    assert page.find_all_by_class("row")[2] is extra
+    assert visited == [extra]
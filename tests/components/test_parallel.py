@@ -0,0 +1,78 @@
+import pytest
+
+from probo import DIV, P, SECTION, SPAN, TABLE, TBODY, TD, TR
+from probo.components import parallel
+from probo.components.elements import Element
+from probo.components.light_tags.oop.block_tags import Ldiv, Lp, Ltbody, Ltd, Ltr
+from probo.components.parallel import render_parallel
+
+OPTIONS = dict(workers=2, threshold=50, min_chunk=10)
+
+
+def heavy_page(rows=200):
+    body = TBODY(*[TR(TD(f"SKU {r} & co", Class="sku"), TD(r), Class="row") for r in range(rows)])
+    return DIV(SECTION(TABLE(body, id="t"), "tail <"), P("footer"))
+
+
+def light_page(rows=200):
+    return Ldiv(Ltbody(*[Ltr(Ltd(f"SKU {r} & co", Class="sku"), Ltd(str(r)), Class="row") for r in range(rows)]), "tail <")
+
+
+def test_heavy_tree_matches_serial_render_and_is_left_unchanged():
+    page = heavy_page()
+    expected = page.render()
+    section = page.node_children[0]
+    content = section._content
+
+    assert render_parallel(page, **OPTIONS) == expected
+    assert section._content is content
+    assert page.render() == expected
+
+
+@pytest.mark.parametrize("natural", [False, True])
+def test_light_tree_matches_serial_render(natural):
+    page = light_page()
+
+    assert render_parallel(page, Element(is_natural=natural), **OPTIONS) == page.render(Element(is_natural=natural))
+
+
+def test_mixed_heavy_and_light_children():
+    heavy_parent = DIV(*[Ldiv(Lp(str(i))) for i in range(100)], *[SPAN(str(i)) for i in range(100)])
+    light_parent = Ldiv(*[DIV(P(str(i))) for i in range(100)], *[Lp(str(i)) for i in range(100)])
+
+    assert render_parallel(heavy_parent, **OPTIONS) == heavy_parent.render()
+    assert render_parallel(light_parent, **OPTIONS) == light_parent.render(Element())
+
+
+def test_small_trees_and_single_workers_start_no_processes(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", no_pool)
+    page = heavy_page(rows=5)
+
+    assert render_parallel(page, workers=2) == page.render()
+    assert render_parallel(heavy_page(), workers=1, threshold=0) == heavy_page().render()
+
+
+def test_memoised_trees_render_serially(monkeypatch):
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", None)
+    page = heavy_page().memoize()
+
+    assert render_parallel(page, **OPTIONS) == page.render()
+
+
+def test_worker_errors_propagate_and_restore_the_tree():
+    page = heavy_page()
+    page.node_children[0].node_children[0].node_children[0].node_children[150].attr_manager.set_attr("bogus_attr", "x")
+    section = page.node_children[0]
+    content = section._content
+
+    with pytest.raises(ValueError):
+        render_parallel(page, **OPTIONS)
+    assert section._content is content
+
+
+def test_list_mode_is_rejected():
+    with pytest.raises(ValueError):
+        render_parallel(light_page(), Element(is_list=True), **OPTIONS)
@@ -0,0 +1,84 @@
+import pytest
+
+from probo import A, DIV, LI, P, SECTION, SPAN, UL
+from probo.components import SelectorSyntaxError, compile_selector
+from probo.components.light_tags.oop.block_tags import Ldiv, Lp, Lspan
+
+
+def build_menu():
+    return DIV(
+        UL(
+            LI(A("Home", href="/"), id="home", Class="item active"),
+            LI(A("Docs", href="/docs", data_kind="external"), id="docs", Class="item"),
+            LI(SPAN("soon"), id="blog", Class="item disabled"),
+            id="menu",
+            Class="menu",
+        ),
+        P("footer", lang="en"),
+        SECTION(SPAN("aside", id="note")),
+        id="page",
+    )
+
+
+def ids(nodes):
+    return [node.attributes["id"] for node in nodes]
+
+
+def test_combinators():
+    page = build_menu()
+
+    assert ids(page.select_all("ul.menu > li")) == ["home", "docs", "blog"]
+    assert ids(page.select_all("div section span")) == ["note"]
+    assert len(page.select_all("div span")) == 2
+    assert ids(page.select_all("#home + li")) == ["docs"]
+    assert ids(page.select_all("#home ~ li")) == ["docs", "blog"]
+    assert page.select_all("ul > span") == []
+
+
+def test_attribute_and_pseudo_selectors():
+    page = build_menu()
+
+    assert page.select_one("a[href^='/d']").attributes["href"] == "/docs"
+    assert page.select_one("[data-kind=external]") is not None
+    assert page.select_one("[lang|=en]").attributes["lang"] == "en"
+    assert ids(page.select_all("li:nth-child(odd)")) == ["home", "blog"]
+    assert ids(page.select_all("li:last-child, li:first-child")) == ["home", "blog"]
+    assert ids(page.select_all("li.item:not(.active)")) == ["docs", "blog"]
+    assert ids(page.select_all("li:nth-last-child(-n+2)")) == ["docs", "blog"]
+
+
+def test_matching_is_scoped_to_the_queried_node():
+    page = build_menu()
+    menu = page.select_one("#menu")
+
+    assert menu.select_all("div li") == []
+    assert ids(menu.select_all("ul li:first-child")) == ["home"]
+
+
+def test_light_trees_are_queried_in_place():
+    tree = Ldiv(Lp(Lspan("a", Class="x")), Lspan("b", Class="x"), Class="root")
+
+    assert [n.attributes["Class"] for n in tree.select_all(".root > .x")] == ["x"]
+    assert tree.select_one("p span").content[0] == "a"
+
+
+def test_index_backed_candidates_follow_mutations():
+    page = build_menu()
+    page.build_index()
+
+    assert ids(page.select_all("li.item")) == ["home", "docs", "blog"]
+
+    page.select_one("#blog").attr_manager.remove_class("item")
+    page.select_one("#menu").add(LI("new", id="new", Class="item"), index=0)
+
+    assert ids(page.select_all("li.item")) == ["new", "home", "docs"]
+
+
+def test_selectors_are_compiled_once():
+    assert compile_selector("ul > li.item") is compile_selector("ul > li.item")
+
+
+@pytest.mark.parametrize("selector", ["", "div >", "p:hover", "a[", "li:nth-child(x)", "div..a"])
+def test_invalid_selectors_raise(selector):
+    with pytest.raises(SelectorSyntaxError):
+        compile_selector(selector)
@@ -0,0 +1,115 @@
+import pytest
+
+from probo import BODY, DIV, LI, NAV, P, SPAN, UL
+from probo.components.elements import Element
+from probo.utility import ProboSourceString
+
+
+@pytest.fixture
+def frames(monkeypatch):
+    """Counts how many tags are (re)built from scratch."""
+    calls = []
+    original = Element.tag_frame
+
+    def counting(self, tag_string, attrs):
+        calls.append(tag_string)
+        return original(self, tag_string, attrs)
+
+    monkeypatch.setattr(Element, "tag_frame", counting)
+    return calls
+
+
+def build_layout():
+    badge = SPAN("3", id="badge")
+    layout = BODY(NAV(badge, SPAN("Inbox")), UL(*[LI(f"row {i}") for i in range(10)]))
+    return layout, badge
+
+
+def test_memoized_render_matches_plain_render():
+    layout, _ = build_layout()
+    expected = layout.render()
+
+    layout.memoize()
+
+    assert layout.render() == expected
+    assert layout.render() == expected
+
+
+def test_clean_subtrees_are_replayed(frames):
+    layout, _ = build_layout()
+    layout.memoize().render()
+    frames.clear()
+
+    layout.render()
+
+    assert frames == []
+
+
+def test_mutation_rerenders_only_the_dirty_path(frames):
+    layout, badge = build_layout()
+    layout.memoize().render()
+    frames.clear()
+
+    badge.inner_html("4")
+    html = layout.render()
+
+    assert '<span id="badge">4</span>' in html
+    assert sorted(frames) == ["nav", "span"]
+
+
+def test_attribute_manager_marks_dirty():
+    layout, badge = build_layout()
+    layout.memoize().render()
+
+    badge.attr_manager.set_attr("data-count", "9")
+
+    assert 'data-count="9"' in layout.render()
+
+
+def test_add_and_remove_invalidate_and_inherit_memoization():
+    root = DIV(P("a")).memoize()
+    root.render()
+
+    extra = SPAN("b")
+    root.add(extra)
+    assert root.render() == "<div><p>a</p><span>b</span></div>"
+    assert extra._memoize
+
+    root.remove(extra)
+    assert root.render() == "<div><p>a</p></div>"
+
+
+def test_direct_content_and_attribute_edits_invalidate():
+    inner = P("a")
+    root = DIV(inner).memoize()
+    root.render()
+
+    inner.content.append("b")
+    assert root.render() == "<div><p>ab</p></div>"
+
+    inner.attributes["id"] = "x"
+    assert root.render() == '<div><p id="x">ab</p></div>'
+
+
+def test_list_held_children_are_linked_for_invalidation():
+    item = LI("one")
+    root = UL([item]).memoize()
+    root.render()
+
+    item.inner_html("two")
+
+    assert root.render() == "<ul><li>two</li></ul>"
+
+
+def test_dynamic_children_stay_live_inside_cached_markup():
+    class Clock:
+        ticks = 0
+
+        def render(self):
+            Clock.ticks += 1
+            return ProboSourceString(f"<time>{Clock.ticks}</time>")
+
+    root = DIV(NAV(SPAN("static"), Clock())).memoize()
+
+    assert "<time>1</time>" in root.render()
+    assert "<time>2</time>" in root.render()
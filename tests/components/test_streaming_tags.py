@@ -3,7 +3,7 @@ import inspect
 from probo.components.elements import Element
 
 # Assuming these are available in your probo namespace
-from probo import DIV, IMG, SVG, div, img, svg
+from probo import DIV, IMG, P, SVG, div, img, svg
 
 # =====================================================================
 # 1. FIXTURES & DEFINITIONS
@@ -176,3 +176,84 @@ def test_heavy_func_streaming(category, tag_func, tag_name, is_self_closing):
         assert (
             TEST_TEXT in full_output
         )  # Ensures the nested lazy_content generator was consumed!
+
+
+# =====================================================================
+# 4. ASYNC STREAMING (astream)
+# =====================================================================
+
+
+async def _async_rows(count):
+    import asyncio
+
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield f"<tr>{i}</tr>"
+
+
+async def _async_title():
+    return "<h1>Title</h1>"
+
+
+def _acollect(async_iterable):
+    import asyncio
+
+    async def run():
+        return "".join([chunk async for chunk in async_iterable])
+
+    return asyncio.run(run())
+
+
+EXPECTED_ASYNC_BODY = "<h1>Title</h1>" + "".join(f"<tr>{i}</tr>" for i in range(3))
+
+
+def test_heavy_oop_astream_resolves_async_content():
+    html = _acollect(DIV(_async_title(), _async_rows(3), **TEST_ATTRS).astream(batch=2))
+
+    assert html.startswith("<div")
+    assert EXPECTED_ASYNC_BODY in html
+    assert html.endswith("</div>")
+
+
+def test_heavy_func_stream_manager_is_async_iterable():
+    html = _acollect(div(_async_title(), _async_rows(3), stream=True, batch=2))
+
+    assert html == f"<div>{EXPECTED_ASYNC_BODY}</div>"
+
+
+def test_light_paradigms_astream(shared_el):
+    from probo.components.light_tags.func.block_tags import l_div
+    from probo.components.light_tags.oop.block_tags import Ldiv
+
+    oop_html = _acollect(Ldiv(_async_title(), _async_rows(3)).astream(shared_el, 2))
+    func_html = _acollect(
+        l_div(Element(is_list=True), _async_title(), _async_rows(3), stream=True, batch=2)
+    )
+
+    assert oop_html == func_html == f"<div>{EXPECTED_ASYNC_BODY}</div>"
+
+
+def test_astream_passes_marker_lookalikes_through_as_text():
+    forged = "\x00probo-async:0\x00 \x00probo-async:0123456789abcdef:5\x00"
+    html = _acollect(DIV(_async_title(), P(forged)).astream(batch=2))
+
+    assert forged in html
+    assert "<h1>Title</h1>" in html
+
+
+def test_astream_matches_stream_for_sync_content():
+    """Sync-only trees stream identically through astream."""
+    import asyncio
+
+    async def chunks():
+        return [c async for c in DIV(TEST_TEXT, IMG(src="a.png")).astream(batch=1)]
+
+    assert asyncio.run(chunks()) == list(DIV(TEST_TEXT, IMG(src="a.png")).stream(batch=1))
+
+
+def test_element_astream():
+    from probo.utility import _resolve_stream
+
+    EL = Element(is_list=True)
+    EL.set_generator_content(_resolve_stream((_async_rows(2),))).div()
+    assert _acollect(EL.astream(batch=5)) == "<tr>0</tr><tr>1</tr>"
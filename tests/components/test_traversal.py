@@ -0,0 +1,66 @@
+import sys
+
+import pytest
+
+from probo import DIV, SPAN
+from probo.components.node import iter_subtree
+
+DEPTH = 10_000
+
+
+@pytest.fixture(scope="module")
+def deep_chain():
+    """DIV > DIV > ... > SPAN, far deeper than the recursion limit."""
+    assert sys.getrecursionlimit() < DEPTH
+    leaf = SPAN("leaf", id="leaf")
+    node = leaf
+    for level in range(DEPTH):
+        node = DIV(node, id=f"d{level}")
+    return node, leaf
+
+
+def test_walk_and_iter_subtree_are_iterative(deep_chain):
+    root, leaf = deep_chain
+
+    nodes = list(root.walk())
+
+    assert len(nodes) == DEPTH + 1
+    assert nodes[0] is root and nodes[-1] is leaf
+    assert nodes == list(iter_subtree(root))
+    assert list(root.walk(include_text=True))[-1] == "leaf"
+
+
+def test_find_and_find_all_reach_the_bottom(deep_chain):
+    root, leaf = deep_chain
+
+    assert root.find(lambda n: n.attributes.get("id") == "leaf") is leaf
+    assert len(root.find_all(lambda n: n.element_tag == "div")) == DEPTH
+    assert root.select_one("div > span#leaf") is leaf
+    assert leaf.get_tree_depth() == DEPTH
+
+
+def test_delegate_render_conditions_reaches_every_node(deep_chain):
+    root, leaf = deep_chain
+
+    root.delegate_render_conditions(use_list=True)
+    assert leaf.use_list is True
+
+    root.delegate_render_conditions(use_list=False)
+    assert leaf.use_list is False
+
+
+def test_render_flags_are_inherited_lazily(deep_chain):
+    root, leaf = deep_chain
+    middle = root.find(lambda n: n.attributes.get("id") == "d5000")
+    stale = leaf.EL
+
+    root.use_render_conditions(use_list=True)
+
+    assert middle.use_list is False  # nothing was pushed down
+    builder = leaf.EL  # resolved bottom-up without recursion
+    assert builder is root.EL is middle.EL
+    assert builder is not stale and builder.is_list
+    assert leaf.use_list is True and middle.use_list is True
+
+    root.use_render_conditions(use_list=False)
+    assert leaf.EL is root.EL and not leaf.EL.is_list
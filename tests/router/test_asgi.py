@@ -0,0 +1,293 @@
+import asyncio
+import gzip
+import time
+
+import pytest
+
+from probo.router.asgi import ProboASGIApp, build_environ
+from probo.router.router import ProboRouter
+from probo.router.settings import RouterSettings
+
+
+@pytest.fixture
+def router():
+    return ProboRouter(settings=RouterSettings(ENABLE_GZIP=False))
+
+
+def asgi_call(app, path, method="GET", headers=(), query=b"", body=b""):
+    """Drives one HTTP request through an ASGI app and collects the messages."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 5000),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    start = messages[0]
+    assert start["type"] == "http.response.start"
+    assert messages[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    content = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, content, messages[1:]
+
+
+def test_asgi_app_property_is_native(router):
+    assert isinstance(router.asgi_app, ProboASGIApp)
+
+
+def test_build_environ_translates_scope():
+    environ = build_environ(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/café",
+            "query_string": b"a=1",
+            "headers": [(b"content-type", b"text/plain"), (b"x-token", b"abc")],
+        },
+        b"payload",
+    )
+
+    assert environ["PATH_INFO"] == "/café".encode("utf8").decode("latin1")
+    assert environ["QUERY_STRING"] == "a=1"
+    assert environ["CONTENT_TYPE"] == "text/plain"
+    assert environ["HTTP_X_TOKEN"] == "abc"
+    assert environ["wsgi.input"].read() == b"payload"
+
+
+def test_asgi_sync_page(router):
+    @router.page("/hello/<name>")
+    def hello(name, request):
+        return f"Hello {name} from {request.path}"
+
+    status, headers, body, _ = asgi_call(router.asgi_app, "/hello/ada")
+
+    assert status == 200
+    assert "Hello ada from /hello/ada" in body.decode()
+    assert headers["content-type"].startswith("text/html")
+
+
+def test_asgi_async_page_is_awaited_on_the_loop(router):
+    @router.page("/async")
+    async def async_page(request, response):
+        await asyncio.sleep(0)
+        response.set_header("X-Async", request.query.get("q", ""))
+        return "<p>awaited</p>"
+
+    status, headers, body, _ = asgi_call(router.asgi_app, "/async", query=b"q=yes")
+
+    assert status == 200
+    assert headers["x-async"] == "yes"
+    assert "<p>awaited</p>" in body.decode()
+
+
+def test_async_page_still_works_under_wsgi(router):
+    from webtest import TestApp
+
+    @router.page("/async")
+    async def async_page():
+        return "<p>from wsgi</p>"
+
+    assert "<p>from wsgi</p>" in TestApp(router.wsgi_app).get("/async").text
+
+
+def test_asgi_concurrent_requests_keep_their_own_state(router):
+    @router.page("/slow/<n>")
+    async def slow(n, response):
+        response.set_header("X-N", n)
+        await asyncio.sleep(0.01 * (3 - int(n)))
+        return f"<p>{n}</p>"
+
+    async def run_all():
+        results = {}
+
+        async def one(n):
+            messages = []
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": f"/slow/{n}", "headers": []}
+            await router.asgi_app(scope, receive, send)
+            headers = dict(messages[0]["headers"])
+            results[n] = (headers[b"x-n"], b"".join(m.get("body", b"") for m in messages[1:]))
+
+        await asyncio.gather(*(one(n) for n in range(3)))
+        return results
+
+    for n, (header, body) in asyncio.run(run_all()).items():
+        assert header == str(n).encode()
+        assert f"<p>{n}</p>".encode() in body
+
+
+def test_asgi_sync_pages_do_not_block_the_event_loop(router):
+    @router.page("/blocking/<n>")
+    def blocking(n, response):
+        time.sleep(0.3)
+        response.set_header("X-N", n)
+        return f"<p>{n}</p>"
+
+    async def run_all():
+        results = {}
+
+        async def one(n):
+            messages = []
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                messages.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": f"/blocking/{n}", "headers": []}
+            await router.asgi_app(scope, receive, send)
+            results[n] = dict(messages[0]["headers"])[b"x-n"]
+
+        await asyncio.gather(*(one(n) for n in range(4)))
+        return results
+
+    started = time.perf_counter()
+    results = asyncio.run(run_all())
+
+    assert time.perf_counter() - started < 0.9
+    assert results == {n: str(n).encode() for n in range(4)}
+
+
+def test_asgi_streamed_page_sends_multiple_body_messages():
+    router = ProboRouter(settings=RouterSettings(ENABLE_GZIP=True, GZIP_FLUSH_BYTES=64))
+
+    class Rows:
+        def stream(self, batch_size=50):
+            for i in range(200):
+                yield f"<tr><td>{i}</td></tr>"
+
+    @router.page("/rows", stream=True)
+    def rows():
+        return Rows()
+
+    status, headers, body, messages = asgi_call(
+        router.asgi_app, "/rows", headers=[("Accept-Encoding", "gzip")]
+    )
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert len([m for m in messages if m["body"]]) > 1
+    assert gzip.decompress(body).decode() == "".join(
+        f"<tr><td>{i}</td></tr>" for i in range(200)
+    )
+
+
+def test_asgi_falls_back_to_wsgi_for_tcm_and_plain_routes(router):
+    router.tcm.url_name_comp["/about"] = "<p>about us</p>"
+
+    @router.wsgi_app.get("/plain")
+    def plain():
+        return "plain bottle route"
+
+    status, _, body, _ = asgi_call(router.asgi_app, "/about")
+    assert status == 200
+    assert "about us" in body.decode()
+
+    assert asgi_call(router.asgi_app, "/plain")[2] == b"plain bottle route"
+    assert asgi_call(router.asgi_app, "/missing")[0] == 404
+
+
+def test_asgi_cached_page_and_etag(router):
+    router.settings.ENABLE_ETAG = True
+    calls = []
+
+    @router.page("/cached", cache_ttl=60)
+    async def cached():
+        calls.append(1)
+        return "<p>cached</p>"
+
+    status, headers, body, _ = asgi_call(router.asgi_app, "/cached")
+    assert status == 200 and "<p>cached</p>" in body.decode()
+
+    status, _, body, _ = asgi_call(
+        router.asgi_app, "/cached", headers=[("If-None-Match", headers["etag"])]
+    )
+    assert status == 304
+    assert body == b""
+    assert len(calls) == 1
+
+
+def test_asgi_lifespan_is_acknowledged(router):
+    sent = []
+    incoming = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+    async def receive():
+        return next(incoming)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(router.asgi_app({"type": "lifespan"}, receive, send))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_asgi_streamed_page_resolves_async_rows(router):
+    from probo import DIV, TD
+
+    async def rows():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield TD(str(i))
+
+    @router.page("/async-rows", stream=True)
+    def async_rows():
+        return DIV(rows(), id="grid")
+
+    status, _, body, _ = asgi_call(router.asgi_app, "/async-rows")
+
+    assert status == 200
+    assert body.decode() == '<div id="grid"><td>0</td><td>1</td><td>2</td></div>'
+
+
+def test_asgi_before_request_hook_can_abort(router):
+    from bottle import abort
+
+    @router.hook("before_request")
+    def guard():
+        abort(401, "nope")
+
+    @router.page("/secret")
+    def secret():
+        return "<p>secret</p>"
+
+    status, _, body, _ = asgi_call(router.asgi_app, "/secret")
+
+    assert status == 401
+    assert b"<p>secret</p>" not in body and b"nope" in body
+
+
+def test_asgi_before_request_hook_can_redirect(router):
+    from bottle import redirect
+
+    @router.hook("before_request")
+    def to_login():
+        redirect("/login")
+
+    @router.page("/account")
+    def account():
+        return "<p>account</p>"
+
+    status, headers, _, _ = asgi_call(router.asgi_app, "/account")
+
+    assert status in (302, 303)
+    assert headers["location"].endswith("/login")
@@ -1,6 +1,6 @@
 import pytest
 import time
-from probo.router.cache import CacheItem, ProboCache
+from probo.router.cache import CacheItem, ProboCache, ResponseCache
 
 # ==========================================
 # TEST 1: CacheItem Data Structure
@@ -144,3 +144,103 @@ def test_cache_walk(cache):
     multi = list(cache.walk(on_keys=True, on_values=True))
     assert len(multi) == 4  # 2 keys + 2 value objects
     assert "k1" in multi
+
+
+# ==========================================
+# TEST 5: Bounds, LRU Eviction & Counters
+# ==========================================
+
+
+def test_cache_lru_eviction_by_entries():
+    """Least recently used keys are evicted once max_entries is exceeded."""
+    cache = ProboCache(max_entries=2)
+    cache.set_cache("a", 1)
+    cache.set_cache("b", 2)
+    cache.get("a")  # 'a' becomes most recently used
+    cache.set_cache("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_eviction_by_bytes():
+    """The byte budget evicts old entries and refuses oversized ones."""
+    cache = ProboCache(max_bytes=10)
+    cache.set_cache("a", "xxxxxx")
+    cache.set_cache("b", "yyyyyy")
+
+    assert "a" not in cache
+    assert cache.get("b") == "yyyyyy"
+    assert cache.current_bytes == 6
+
+    cache.set_cache("huge", "z" * 50)
+    assert cache.get("huge") is None
+    assert cache.get("b") == "yyyyyy"
+
+
+def test_cache_stats_counters(cache, monkeypatch):
+    """Hits, misses and expirations are tracked for scraping."""
+    cache.set_cache("k", "v", ttl=10)
+    cache.get("k")
+    cache.get("missing")
+
+    original_time = time.time
+    monkeypatch.setattr("probo.router.cache.time.time", lambda: original_time() + 20)
+    cache.get("k")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
+
+
+def test_cache_concurrent_writes_respect_bounds():
+    """Concurrent writers never push the store past max_entries."""
+    import threading
+
+    cache = ProboCache(max_entries=50)
+
+    def writer(prefix):
+        for i in range(500):
+            cache.set_cache(f"{prefix}:{i}", i)
+            cache.get(f"{prefix}:{i // 2}")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(cache) == 50
+    assert cache.stats()["evictions"] == 8 * 500 - 50
+
+
+def test_cache_background_sweeper(monkeypatch):
+    """The sweeper thread purges expired items without any read."""
+    cache = ProboCache()
+    cache.set_cache("dead", "val", ttl=1)
+    original_time = time.time
+    monkeypatch.setattr("probo.router.cache.time.time", lambda: original_time() + 5)
+
+    cache.start_sweeper(0.01)
+    deadline = original_time() + 2
+    while "dead" in cache._store and original_time() < deadline:
+        time.sleep(0.01)
+    cache.stop_sweeper()
+
+    assert "dead" not in cache._store
+
+
+def test_response_cache_keys_escape_request_values():
+    keys = ResponseCache(ProboCache())
+
+    assert keys.build_key("/p", [("a", "1&b=2")]) != keys.build_key("/p", [("a", "1"), ("b", "2")])
+    assert keys.build_key("/p?a=1") != keys.build_key("/p", [("a", "1")])
+    assert keys.build_key("/p", headers={"X-A": "1|x-b=2"}, vary=["X-A"]) != keys.build_key(
+        "/p", headers={"X-A": "1", "X-B": "2"}, vary=["X-A", "X-B"]
+    )
+    assert keys.build_key("/p", [("b", "2"), ("a", "1")]) == keys.build_key("/p", [("a", "1"), ("b", "2")])
@@ -0,0 +1,143 @@
+import asyncio
+import inspect
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from probo.router import ProboRouter
+from probo.router.discovery import LazyPage, discover_pages, discover_routers
+from probo.router.manifest import DiscoveryManifest
+
+PAGE = '''
+from probo.router.discovery import route
+
+IMPORTS = globals().setdefault("IMPORTS", 0) + 1
+
+def dashboard(request):
+    return "dashboard"
+
+async def feed():
+    return "feed"
+
+routes = [route("dashboard", dashboard, cache_ttl=30), route("feed", feed)]
+'''
+
+
+def write(path, text, age=60):
+    """Writes `text` and backdates the mtime out of the racy window."""
+    path.write_text(text)
+    then = time.time() - age
+    os.utime(path, (then, then))
+    return str(path)
+
+
+@pytest.fixture
+def pages(tmp_path):
+    directory = tmp_path / "pages"
+    directory.mkdir()
+    write(directory / "app.py", PAGE)
+    write(directory / "helpers.py", "VALUE = 1\n")
+    yield directory
+    for name in ("probo_auto_app", "probo_auto_helpers", "probo_auto_router_urls", "probo_auto_router_helpers"):
+        sys.modules.pop(name, None)
+
+
+def test_first_discovery_imports_and_writes_the_manifest(pages, tmp_path):
+    path = tmp_path / "manifest.json"
+
+    routes = discover_pages(str(pages), manifest=str(path))
+
+    assert routes["/dashboard/"].component.__name__ == "dashboard"
+    assert routes["/dashboard/"].kwargs == {"cache_ttl": 30}
+    assert len(json.loads(path.read_text())["sections"]["pages::0"]) == 2
+
+
+def test_unchanged_modules_are_not_imported_until_the_first_call(pages, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    discover_pages(str(pages), manifest=path)
+    sys.modules.pop("probo_auto_app")
+
+    manifest = DiscoveryManifest(path)
+    routes = discover_pages(str(pages), manifest=manifest)
+    dashboard = routes["/dashboard/"]
+
+    assert manifest.stats() == {"files": 2, "reused": 2, "rebuilt": 0}
+    assert "probo_auto_app" not in sys.modules
+    assert dashboard.kwargs == {"cache_ttl": 30}
+    assert list(inspect.signature(dashboard.component).parameters) == ["request"]
+    assert inspect.iscoroutinefunction(routes["/feed/"].component)
+    assert not dashboard.component.lazy_page.resolved
+
+    assert dashboard.component(request=None) == "dashboard"
+    assert asyncio.run(routes["/feed/"].component()) == "feed"
+    assert sys.modules["probo_auto_app"].IMPORTS == 1
+
+
+def test_changed_modules_are_imported_again(pages, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    discover_pages(str(pages), manifest=path)
+    write(pages / "app.py", PAGE.replace('route("feed", feed)', 'route("news", feed)'), age=30)
+
+    manifest = DiscoveryManifest(path)
+    routes = discover_pages(str(pages), manifest=manifest)
+
+    assert "/news/" in routes and "/feed/" not in routes
+    assert (manifest.reused, manifest.rebuilt) == (1, 1)
+    assert "/news/" in {r["path"] for r in DiscoveryManifest(path)._sections["pages::0"][str(pages / "app.py")]["routes"]}
+
+
+def test_routes_with_unserializable_options_stay_eager(pages, tmp_path):
+    write(pages / "app.py", PAGE.replace("cache_ttl=30", "cache_ttl=object()"))
+    path = str(tmp_path / "manifest.json")
+    discover_pages(str(pages), manifest=path)
+    sys.modules.pop("probo_auto_app")
+
+    routes = discover_pages(str(pages), manifest=path)
+
+    assert not hasattr(routes["/dashboard/"].component, "lazy_page")
+    assert "probo_auto_app" in sys.modules
+
+
+def test_a_corrupt_manifest_is_rebuilt(pages, tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+
+    routes = discover_pages(str(pages), manifest=str(path))
+
+    assert "/dashboard/" in routes
+    assert json.loads(path.read_text())["version"] == DiscoveryManifest.VERSION
+
+
+def test_lazy_pages_raise_when_the_route_is_gone(pages):
+    page = LazyPage(str(pages / "app.py"), None, False, index=5)
+
+    with pytest.raises(LookupError):
+        page.resolve()
+
+
+def test_discover_routers_skips_modules_without_routers(pages, tmp_path):
+    write(pages / "urls.py", "from probo.router.router import ProboRouter\nblog = ProboRouter(app_name='blog')\n")
+    path = str(tmp_path / "manifest.json")
+    assert [r.app_name for r in discover_routers(str(pages), manifest=path)] == ["blog"]
+
+    manifest = DiscoveryManifest(path)
+    routers = discover_routers(str(pages), manifest=manifest)
+
+    assert [r.app_name for r in routers] == ["blog"]
+    assert manifest.reused == 3
+
+
+def test_router_registers_lazy_pages_from_the_manifest_setting(pages, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    discover_pages(str(pages), manifest=path)
+    sys.modules.pop("probo_auto_app")
+
+    router = ProboRouter()
+    router.settings.DISCOVERY_MANIFEST = path
+    router.include_discoveries(str(pages), for_router=False)
+
+    assert "probo_auto_app" not in sys.modules
+    assert router.routes["/dashboard/"].lazy_page.py_file == str(pages / "app.py")
@@ -0,0 +1,112 @@
+import os
+import time
+
+import pytest
+
+from probo.router import ProboRouter, RouterSettings
+from probo.router.global_cache import FileFreshness, file_freshness, file_hash, get_or_render, global_cache
+
+
+def write(path, text, age=60):
+    """Writes `text` and backdates the mtime out of the racy window."""
+    path.write_text(text)
+    then = time.time() - age
+    os.utime(path, (then, then))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    global_cache.clear()
+    file_freshness.thaw().forget()
+    yield
+    global_cache.clear()
+    file_freshness.thaw().forget()
+
+
+def test_unchanged_files_cost_one_stat_and_no_read(tmp_path):
+    path = write(tmp_path / "layout.html", "<main>v1</main>")
+    freshness = FileFreshness()
+
+    first = freshness.version(path)
+    assert freshness.version(path) == first == file_hash(path)
+    assert (freshness.stat_calls, freshness.hash_calls) == (2, 1)
+
+
+def test_fingerprint_change_rehashes(tmp_path):
+    path = write(tmp_path / "layout.html", "<main>v1</main>")
+    freshness = FileFreshness()
+    first = freshness.version(path)
+
+    write(tmp_path / "layout.html", "<main>v22</main>", age=30)
+
+    assert freshness.version(path) == file_hash(path) != first
+    assert freshness.hash_calls == 2
+
+
+def test_recently_modified_files_are_hashed_again(tmp_path):
+    path = tmp_path / "layout.html"
+    path.write_text("<main>v1</main>")
+    freshness = FileFreshness()
+
+    freshness.version(str(path))
+    freshness.version(str(path))
+
+    assert freshness.hash_calls == 2
+
+
+def test_frozen_mode_skips_stat_after_warmup(tmp_path):
+    path = write(tmp_path / "layout.html", "<main>v1</main>")
+    freshness = FileFreshness()
+    first = freshness.version(path)
+    freshness.freeze()
+    write(tmp_path / "layout.html", "<main>changed</main>")
+
+    assert freshness.version(path) == first
+    assert freshness.stat_calls == 1
+    freshness.forget(path)
+    assert freshness.version(path) == file_hash(path)
+
+
+def test_missing_files_have_no_version(tmp_path):
+    freshness = FileFreshness()
+
+    assert freshness.version(str(tmp_path / "missing.html")) == ""
+
+
+def test_get_or_render_rerenders_only_after_a_change(tmp_path):
+    path = write(tmp_path / "page.html", "a")
+    calls = []
+
+    def render():
+        calls.append(1)
+        return f"<p>{len(calls)}</p>"
+
+    assert get_or_render(path, render) == "<p>1</p>"
+    assert get_or_render(path, render) == "<p>1</p>"
+    write(tmp_path / "page.html", "changed", age=30)
+    assert get_or_render(path, render) == "<p>2</p>"
+    assert file_freshness.hash_calls >= 2
+
+
+def test_router_setting_freezes_file_checks():
+    ProboRouter(settings=RouterSettings(CACHE_FROZEN_FILES=True))
+
+    assert file_freshness.frozen
+
+
+def test_sub_routers_keep_the_app_cache_configuration():
+    app = ProboRouter(settings=RouterSettings(CACHE_MAX_ENTRIES=5, CACHE_SWEEP_INTERVAL=30))
+    sweeper = global_cache._sweeper
+    try:
+        ProboRouter(prefix="auth")
+        ProboRouter()
+        assert global_cache.max_entries == 5
+        assert global_cache.sweep_interval == 30
+        assert global_cache._sweeper is sweeper
+
+        app.include_router(ProboRouter(settings=RouterSettings(CACHE_MAX_ENTRIES=5, CACHE_SWEEP_INTERVAL=30)))
+        assert global_cache._sweeper is sweeper
+    finally:
+        ProboRouter(settings=RouterSettings())
+    assert global_cache.max_entries == RouterSettings().CACHE_MAX_ENTRIES
@@ -171,3 +171,30 @@ def test_file_uploads(monkeypatch):
     # 4. Test save_upload (Failure - file not found)
     fail = save_upload("missing_file", "/tmp/uploads/missing.png")
     assert fail is False
+
+
+# ==========================================
+# TEST: ETag Helpers
+# ==========================================
+
+
+def test_make_etag_strong_and_weak():
+    from probo.router.http import make_etag
+
+    strong = make_etag("<p>hi</p>")
+    weak = make_etag(b"<p>hi</p>", weak=True)
+
+    assert strong.startswith('"') and strong.endswith('"')
+    assert weak == f"W/{strong}"
+    assert make_etag("<p>bye</p>") != strong
+
+
+def test_etag_matches_variants():
+    from probo.router.http import etag_matches
+
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', 'W/"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"xyz"', '"abc"')
+    assert not etag_matches(None, '"abc"')
@@ -1,5 +1,4 @@
 import pytest
-from unittest.mock import MagicMock
 from webtest import TestApp
 import json
 from probo.router.router import ProboRouter
@@ -125,6 +124,35 @@ def test_maybe_compress(monkeypatch):
     assert router._maybe_compress(b"binary data") == b"binary data"
 
 
+def test_stream_page_is_gzipped_incrementally():
+    """Streamed pages go through the shared compression engine."""
+    import gzip
+    from wsgiref.util import setup_testing_defaults
+
+    router = ProboRouter(settings=RouterSettings(ENABLE_GZIP=True))
+
+    class Rows:
+        def stream(self, batch_size=50):
+            for i in range(500):
+                yield f"<tr><td>{i}</td></tr>"
+
+    @router.page("/rows", stream=True)
+    def rows():
+        return Rows()
+
+    environ = {"PATH_INFO": "/rows", "HTTP_ACCEPT_ENCODING": "gzip"}
+    setup_testing_defaults(environ)
+    headers = {}
+    body = b"".join(
+        router.wsgi_app(environ, lambda status, h, exc=None: headers.update(h))
+    )
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body).decode() == "".join(
+        f"<tr><td>{i}</td></tr>" for i in range(500)
+    )
+
+
 # ==========================================
 # TEST 4: The @page Routing Decorator
 # ==========================================
@@ -167,24 +195,165 @@ def test_page_decorator_htmx_request():
     assert "/htmx-part" in router.payload.diff
 
 
-def test_page_decorator_caching(router, client, monkeypatch):
+def test_payload_diffs_are_kept_per_client():
+    """Each client cookie gets its own SSDOM baseline."""
+    router = ProboRouter(app_name="TestApp", respond_format="json")
+
+    @router.page("/panel")
+    def panel():
+        return "<div>Panel</div>"
+
+    alice, bob = TestApp(router.wsgi_app), TestApp(router.wsgi_app)
+    htmx = {"HX-Request": "true"}
+
+    assert json.loads(alice.get("/panel", headers=htmx).text)["status"] == "update"
+    assert json.loads(alice.get("/panel", headers=htmx).text)["status"] == "no-change"
+    assert json.loads(bob.get("/panel", headers=htmx).text)["status"] == "update"
+    assert alice.cookies["probo_client"] != bob.cookies["probo_client"]
+
+
+def test_payload_responses_are_not_shared_through_the_response_cache():
+    """A cached 'no-change' diff for one client must never reach another."""
+    router = ProboRouter(app_name="TestApp", respond_format="json")
+
+    @router.page("/cached-panel", cache_ttl=60)
+    def panel():
+        return "<div>Panel</div>"
+
+    alice, bob = TestApp(router.wsgi_app), TestApp(router.wsgi_app)
+    htmx = {"HX-Request": "true"}
+    alice.get("/cached-panel", headers=htmx)
+    assert json.loads(alice.get("/cached-panel", headers=htmx).text)["status"] == "no-change"
+
+    res = bob.get("/cached-panel", headers=htmx)
+    assert json.loads(res.text)["payload"]["/cached-panel"]["content"] == "<div>Panel</div>"
+    assert "probo_client" in bob.cookies
+
+
+def test_page_decorator_caching(router, client):
     """Tests the new cache_ttl integration."""
-    mock_cache = MagicMock()
-    mock_cache.get.return_value = None
-    monkeypatch.setattr("probo.router.router.global_cache", mock_cache)
+    from probo.router.global_cache import global_cache
+
+    global_cache.clear()
+    calls = []
 
     @router.page("/cached", cache_ttl=60)
     def cached_route():
+        calls.append(1)
         return "Expensive Data"
 
     # Call it (Cache Miss -> Renders -> Sets Cache)
-    client.get("/cached")
-    mock_cache.set.assert_called_once()
+    res_miss = client.get("/cached")
+    assert len(calls) == 1
 
-    # Simulate Cache Hit
-    mock_cache.get.return_value = "Cached HTML"
+    # Cache Hit: the handler is not called again and the body is identical
     res_hit = client.get("/cached")
-    assert res_hit.text == "Cached HTML"
+    assert len(calls) == 1
+    assert res_hit.body == res_miss.body
+    assert "HX-Request" in res_hit.headers["Vary"]
+
+
+def test_page_cache_keys_on_query_and_vary(router, client):
+    """Distinct query strings and declared Vary headers never share an entry."""
+    from probo.router.global_cache import global_cache
+
+    global_cache.clear()
+
+    @router.page("/search", cache_ttl=60, cache_query=("q",), cache_vary=("Accept-Language",))
+    def search(request):
+        return f"{request.query.get('q')}-{request.headers.get('Accept-Language')}"
+
+    assert "a-en" in client.get("/search?q=a", headers={"Accept-Language": "en"}).text
+    assert "b-en" in client.get("/search?q=b", headers={"Accept-Language": "en"}).text
+    assert "a-fr" in client.get("/search?q=a", headers={"Accept-Language": "fr"}).text
+    # Unselected params do not fragment the cache
+    assert "a-en" in client.get("/search?q=a&utm=x", headers={"Accept-Language": "en"}).text
+    assert global_cache.stats()["entries"] == 3
+
+
+def test_page_cache_stores_gzipped_body():
+    """With GZIP enabled, the compressed body is built once and replayed."""
+    import gzip
+    from wsgiref.util import setup_testing_defaults
+    from probo.router.global_cache import global_cache
+
+    global_cache.clear()
+    router = ProboRouter(settings=RouterSettings(ENABLE_GZIP=True))
+
+    @router.page("/zipped", cache_ttl=60)
+    def zipped():
+        return "Z" * 500
+
+    def call(accept_encoding=""):
+        environ = {"PATH_INFO": "/zipped", "HTTP_ACCEPT_ENCODING": accept_encoding}
+        setup_testing_defaults(environ)
+        captured = {}
+
+        def start_response(status, headers, exc_info=None):
+            captured.update(headers)
+
+        return b"".join(router.wsgi_app(environ, start_response)), captured
+
+    first, first_headers = call("gzip")
+    second, _ = call("gzip")
+    plain, plain_headers = call()
+
+    assert first_headers["Content-Encoding"] == "gzip"
+    assert second == first
+    assert gzip.decompress(first) == plain
+    assert "Content-Encoding" not in plain_headers
+    assert "Accept-Encoding" in plain_headers["Vary"]
+
+
+def test_page_conditional_get_returns_304():
+    """A matching If-None-Match gets an empty 304 instead of the page."""
+    router = ProboRouter(settings=RouterSettings(ENABLE_ETAG=True))
+    client = TestApp(router.wsgi_app)
+
+    @router.page("/poll")
+    def poll():
+        return "Same HTML"
+
+    first = client.get("/poll")
+    etag = first.headers["ETag"]
+    revalidated = client.get("/poll", headers={"If-None-Match": etag}, status=304)
+
+    assert revalidated.body == b""
+    assert client.get("/poll", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_cached_page_revalidation_skips_render():
+    """Cached pages answer conditional requests from the stored ETag."""
+    from probo.router.global_cache import global_cache
+
+    global_cache.clear()
+    router = ProboRouter(settings=RouterSettings(ENABLE_ETAG=True, WEAK_ETAG=True))
+    client = TestApp(router.wsgi_app)
+    calls = []
+
+    @router.page("/feed", cache_ttl=60)
+    def feed():
+        calls.append(1)
+        return "Feed"
+
+    etag = client.get("/feed").headers["ETag"]
+    client.get("/feed", headers={"If-None-Match": etag}, status=304)
+
+    assert etag.startswith("W/")
+    assert len(calls) == 1
+
+
+def test_tcm_conditional_get(monkeypatch):
+    """TCM fallback responses carry ETags too."""
+    monkeypatch.setattr(
+        TemplateComponentMap, "get_component", lambda self, path: "TCM Body"
+    )
+    router = ProboRouter(settings=RouterSettings(ENABLE_ETAG=True))
+    router.tcm.url_name_comp["/tcm-etag"] = "TCM Body"
+    client = TestApp(router.wsgi_app)
+
+    etag = client.get("/tcm-etag").headers["ETag"]
+    client.get("/tcm-etag", headers={"If-None-Match": etag}, status=304)
 
 
 # ==========================================
@@ -21,7 +21,7 @@ def test_initial_payload_processing():
     comp = MockComponent("<h1>Hello</h1>")
     payload = RouterPayload(header=comp)
     
-    expected_hash = hashlib.md5("<h1>Hello</h1>".encode()).hexdigest()
+    expected_hash = hashlib.blake2b("<h1>Hello</h1>".encode(), digest_size=16).hexdigest()
     assert "header" in payload.diff
     assert payload.diff["header"]["hash"] == expected_hash
     assert payload.diff["header"]["content"] == "<h1>Hello</h1>"
@@ -29,8 +29,8 @@ def test_initial_payload_processing():
 def test_cache_skips_unchanged_content():
     """2. Test that unchanged content results in an empty diff and 'no-change' status."""
     comp = "static content"
-    # First run caches it
-    RouterPayload(sidebar=comp)
+    # First run caches it (components are rendered when the diff is read)
+    RouterPayload(sidebar=comp).diff
     
     # Second run with same content
     payload2 = RouterPayload(sidebar=comp)
@@ -69,7 +69,7 @@ def test_xml_response_structure():
 
 def test_multiple_payload_diffing():
     """6. Test processing multiple components where only one changes."""
-    RouterPayload(a="fixed", b="old")
+    RouterPayload(a="fixed", b="old").diff
     
     # Only 'b' changes
     payload = RouterPayload(a="fixed", b="new")
@@ -102,9 +102,41 @@ def test_non_renderable_fallback():
 def test_state_cache_persistence_across_instances():
     """10. Verify that the class-level cache persists across different instances."""
     # Instance 1 caches 'key1'
-    RouterPayload(key1="content1")
+    RouterPayload(key1="content1").diff
 
     # Instance 2 should see 'key1' as unchanged even if not passed in init
     payload2 = RouterPayload(key1="content1")
     assert "key1" not in payload2.diff
     assert "payload::key1" in list(global_cache.walk())
+
+class CountingComponent:
+    renders = 0
+
+    def __init__(self, content):
+        self.content = content
+
+    def render(self):
+        CountingComponent.renders += 1
+        return self.content
+
+def test_components_render_only_when_the_diff_is_requested():
+    """11. Registering components (at init or with load) renders nothing."""
+    CountingComponent.renders = 0
+    payload = RouterPayload(**{f"c{i}": CountingComponent(f"<p>{i}</p>") for i in range(1000)})
+    payload.load(extra=CountingComponent("<p>extra</p>"))
+    assert CountingComponent.renders == 0
+
+    assert len(payload.diff) == 1001
+    payload.diff
+    assert CountingComponent.renders == 1001
+
+def test_clients_keep_their_own_baselines():
+    """12. One client's update never hides a change from another client."""
+    base = RouterPayload()
+    assert "main" in base.for_client("alice", main="v1").diff
+    assert "main" in base.for_client("bob", main="v1").diff
+    assert base.for_client("alice", main="v1").diff == {}
+
+    assert "main" in base.for_client("alice", main="v2").diff
+    assert base.for_client("bob", main="v1").diff == {}
+    assert "payload:alice::main" in global_cache
@@ -53,7 +53,7 @@ def test_cache_persistence_between_router_calls(router):
     req = type('MockReq', (), {'params': {'val': 'same'}})()
     
     # First call fills cache
-    router.routes["/api/update"](req)
+    router.routes["/api/update"](req).diff
     
     # Second call should result in no-change
     payload2 = router.routes["/api/update"](req)
@@ -75,10 +75,10 @@ def test_partial_router_update(router):
     assert "sidebar" not in res_json["payload"]
 
 def test_hash_match_with_router_context(router):
-    """4. Ensure the hash generated in the router matches expected MD5."""
+    """4. Ensure the hash generated in the router matches expected BLAKE2b."""
     payload = router.routes["/api/update"](type('MockReq', (), {'params': {'val': 'test'}})())
     content = DIV(P("Value: test"), Id="main").render()
-    expected_hash = hashlib.md5(content.encode()).hexdigest()
+    expected_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
     
     assert payload.diff["main_content"]["hash"] == expected_hash
 
@@ -132,13 +132,13 @@ def test_duplicate_cid_overwrite(router):
 def test_complex_nesting_diff(router):
     """11. Verify nested DIVs are hashed correctly as a single unit by the payload."""
     nested = DIV(DIV(P("Deep")))
-    p1 = RouterPayload(nested=nested)
+    p1 = RouterPayload(nested=nested).diff
     p2 = RouterPayload(nested=nested)
     assert p2.diff == {}
 
 def test_router_status_on_no_change(router):
     """12. Check that the payload status string is exactly 'no-change' for JS compat."""
-    p = RouterPayload(x=1) # Cache it
+    p = RouterPayload(x=1).diff # Cache it
     p2 = RouterPayload(x=1)
     assert json.loads(p2.get_json_response())["status"] == "no-change"
 
@@ -180,9 +180,9 @@ def test_binary_content_hashing(router):
     assert "bin" in p.diff
 
 def test_router_payload_type_check(router):
-    """19. Ensure RouterPayload strictly uses MD5 (Standard for SSDOM v1.3.0)."""
+    """19. Ensure RouterPayload hashes stay 32 hex chars (BLAKE2b-128, same width as SSDOM v1.3.0's MD5)."""
     p = RouterPayload(t="val")
-    # MD5 is 32 chars
+    # BLAKE2b with a 16-byte digest is 32 chars
     assert len(p.diff["t"]["hash"]) == 32
 
 def test_ssdom_update_tag_presence(router):
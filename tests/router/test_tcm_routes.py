@@ -0,0 +1,131 @@
+import pytest
+from webtest import TestApp
+
+from probo.context import TemplateComponentMap
+from probo.router import ProboRouter, RouterSettings
+from probo.router.tcm_routes import TCMRouteTable
+
+
+class Card:
+    instances = 0
+
+    def __init__(self, **params):
+        Card.instances += 1
+        self.props = {}
+        self.params = params
+        self.renders = 0
+
+    def render(self):
+        self.renders += 1
+        return f"<p>{self.params or self.props.get('url-params')}</p>"
+
+
+@pytest.fixture(autouse=True)
+def reset_cards():
+    Card.instances = 0
+
+
+def test_static_and_parameterised_routes():
+    table = TCMRouteTable(TemplateComponentMap(**{
+        "/about/": "<p>about</p>",
+        "/users/<user_id>/": Card,
+        "/users/me/": "<p>me</p>",
+        "/posts/<slug>/edit/": Card(),
+    }))
+
+    assert table.render("/about/") == "<p>about</p>"
+    assert table.render("/users/me/") == "<p>me</p>"
+    assert table.render("/users/42/") == "<p>{'user_id': '42'}</p>"
+    assert table.render("/posts/intro/edit/") == "<p>{'slug': 'intro'}</p>"
+    assert table.render("/users/") is None
+    assert table.render("/posts/intro/") is None
+    assert table.stats()["misses"] == 2
+
+
+def test_factories_are_built_once_per_parameters():
+    table = TCMRouteTable(TemplateComponentMap(**{"/users/<user_id>/": Card}))
+
+    for _ in range(3):
+        table.render("/users/1/")
+    table.render("/users/2/")
+
+    assert Card.instances == table.builds == 2
+    assert table.renders == 4
+
+
+def test_memoized_renders_and_lru_eviction():
+    table = TCMRouteTable(TemplateComponentMap(**{"/users/<user_id>/": Card}), memoize=True, max_entries=2)
+
+    table.render("/users/1/")
+    table.render("/users/1/")
+    table.render("/users/2/")
+    table.render("/users/3/")
+    table.render("/users/1/")
+
+    assert table.renders == 4
+    assert table.stats()["built"] == 2
+
+
+def test_table_follows_changes_to_the_map():
+    tcm = TemplateComponentMap(**{"/a/": "a"})
+    table = TCMRouteTable(tcm)
+    tcm.set_component("/b/", "b")
+    assert table.sync(tcm).render("/b/") == "b"
+
+    tcm.url_name_comp["/a/"] = "changed"
+    assert table.render("/a/") == "changed"
+
+    other = TemplateComponentMap(**{"/c/": "c"})
+    assert table.sync(other).render("/a/") is None
+
+
+def test_router_serves_tcm_routes_from_the_table():
+    router = ProboRouter(settings=RouterSettings(TCM_MEMOIZE=True))
+    router.tcm.url_name_comp["/users/<user_id>/"] = Card
+    router.tcm.url_name_comp["/hello/<name>/"] = lambda name: f"<p>hello {name}</p>"
+    client = TestApp(router.wsgi_app)
+
+    assert "<p>hello ada</p>" in client.get("/hello/ada/").text
+    client.get("/users/7/")
+    client.get("/users/7/")
+
+    assert router.tcm_routes.stats()["renders"] == 1
+    client.get("/users/", status=404)
+
+
+def test_subclassed_maps_keep_their_get_component():
+    class PrefixMap(TemplateComponentMap):
+        def get_component(self, url_name):
+            return f"<p>{url_name}</p>"
+
+    router = ProboRouter()
+    router.register_tcm(PrefixMap(**{"/x/": "ignored"}))
+
+    assert "<p>/x/</p>" in TestApp(router.wsgi_app).get("/x/").text
+    assert router.tcm_routes.hits == 0
+
+
+def test_replacing_a_mapping_in_place_serves_the_new_page():
+    router = ProboRouter()
+    router.tcm.set_component("/about/", "<p>old</p>")
+    router.tcm.set_component("/users/<user_id>/", lambda user_id: f"<p>old {user_id}</p>")
+    client = TestApp(router.wsgi_app)
+    assert "<p>old</p>" in client.get("/about/").text
+    assert "<p>old 1</p>" in client.get("/users/1/").text
+
+    router.tcm.set_component("/about/", "<p>new</p>")
+    router.tcm.set_component("/users/<user_id>/", lambda user_id: f"<p>new {user_id}</p>")
+
+    assert "<p>new</p>" in client.get("/about/").text
+    assert "<p>new 1</p>" in client.get("/users/1/").text
+
+
+def test_parameterised_hits_are_recorded_once_per_pattern():
+    router = ProboRouter()
+    router.tcm.url_name_comp["/users/<user_id>/"] = Card
+    client = TestApp(router.wsgi_app)
+
+    for uid in range(50):
+        client.get(f"/users/{uid}/")
+
+    assert [key for key in router.routes if key.startswith("/users/")] == ["/users/<user_id>/"]
@@ -0,0 +1,101 @@
+import sys
+
+import pytest
+
+from probo import DIV, SPAN, P, IMG
+from probo.components.elements import Element
+from probo.components.light_tags.oop.block_tags import Ldiv, Lspan
+from probo.streaming import (
+    BytesSink,
+    FileSink,
+    ListSink,
+    RenderSink,
+    StringSink,
+    render_to,
+)
+
+
+def build_tree():
+    return DIV(
+        P("a & b", SPAN("safe", Class="x")),
+        [SPAN("one"), "two <3>"],
+        (x for x in ["gen", "&"]),
+        IMG(src="/i.png"),
+        id="root",
+    )
+
+
+@pytest.mark.parametrize("sink_cls", [ListSink, StringSink])
+def test_render_into_matches_render(sink_cls):
+    expected = build_tree().render()
+
+    assert build_tree().render_into(sink_cls()).getvalue() == expected
+
+
+def test_bytes_sink_encodes_utf8():
+    sink = DIV("café").render_into(BytesSink())
+
+    assert sink.getvalue() == "<div>café</div>".encode("utf-8")
+
+
+def test_file_sink_streams_to_disk(tmp_path):
+    target = tmp_path / "page.html"
+    page = DIV(*[P(f"row {i}") for i in range(200)])
+
+    with FileSink(target, buffer_size=64) as sink:
+        page.render_into(sink)
+        assert sink.getvalue() == len(page.render())
+
+    assert target.read_text(encoding="utf-8") == page.render()
+
+
+def test_light_nodes_render_into_shared_builder():
+    tree = Ldiv(Lspan("x & y"), "tail", Class="wrap")
+    expected = tree.render(Element())
+
+    assert tree.render_into(Element(), ListSink()).getvalue() == expected
+    assert render_to(tree).getvalue() == expected
+
+
+def test_natural_builder_separators_are_kept():
+    tree = Ldiv(Lspan("a"))
+
+    assert tree.render_into(Element(is_natural=True), ListSink()).getvalue() == (
+        tree.render(Element(is_natural=True))
+    )
+
+
+def test_render_to_falls_back_for_plain_values():
+    assert render_to("<p>raw</p>").getvalue() == "<p>raw</p>"
+    assert render_to(42, StringSink()).getvalue() == "42"
+
+
+def test_deep_tree_renders_in_one_pass():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, 5000))
+    try:
+        node = SPAN("leaf")
+        for _ in range(300):
+            node = DIV(node)
+        html = node.render()
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert html == "<div>" * 300 + "<span>leaf</span>" + "</div>" * 300
+
+
+def test_render_sink_is_abstract():
+    class Counting(RenderSink):
+        __slots__ = ("count",)
+
+        def __init__(self):
+            self.count = 0
+
+        def write(self, chunk):
+            self.count += len(chunk)
+
+    with pytest.raises(TypeError):
+        RenderSink()
+    with pytest.raises(NotImplementedError):
+        Counting().getvalue()
+    assert render_to(DIV("hi"), Counting()).count == len("<div>hi</div>")
@@ -5,6 +5,7 @@ import json
 from typing import Iterator
 from unittest.mock import MagicMock, patch
 from probo.streaming import (
+CompressionEngine,
 GzipStreamer,
 stream_render,
 to_django_response,
@@ -167,4 +168,59 @@ def test_nested_stream_render():
     # unless logic is recursive. Let's test current behavior:
     res = list(stream_render([level1]))
     # Based on: content=el() -> level2. then yields content (level2)
-    assert "function" in str(res[0])
\ No newline at end of file
+    assert "function" in str(res[0])
+
+# --- COMPRESSION ENGINE ---
+
+
+def test_engine_byte_threshold_batches_flushes():
+    """Small fragments are not sync-flushed one by one."""
+    fragments = [f"<tr><td>{i}</td></tr>" for i in range(2000)]
+    engine = CompressionEngine(flush_bytes=8192)
+
+    chunks = list(engine.stream(iter(fragments)))
+
+    assert len(chunks) < 20
+    assert decompress_stream(iter(chunks)) == "".join(fragments)
+
+
+def test_engine_ratio_beats_per_fragment_flush():
+    """One deflate stream with sparse flushes is smaller than per-fragment flushing."""
+    fragments = [f"<tr><td class='cell'>{i}</td></tr>" for i in range(3000)]
+    batched = b"".join(CompressionEngine(flush_bytes=16384).stream(iter(fragments)))
+    eager = b"".join(CompressionEngine(flush_bytes=1).stream(iter(fragments)))
+
+    assert len(batched) < len(eager)
+
+
+def test_engine_marker_hint_flushes_immediately():
+    """A fragment containing a marker (e.g. </head>) is decodable on its own."""
+    import zlib
+
+    engine = CompressionEngine(flush_bytes=0, flush_markers=("</head>",))
+    first = engine.compress("<html><head><title>x</title></head>")
+    decoder = zlib.decompressobj(31)
+
+    assert decoder.decompress(first) == b"<html><head><title>x</title></head>"
+    assert engine.compress("<body>") == b""
+    assert decoder.decompress(engine.compress("</body>", flush=True)) == b"<body></body>"
+
+
+def test_engine_interval_flush(monkeypatch):
+    """Pending data is flushed once flush_interval has elapsed."""
+    clock = [100.0]
+    monkeypatch.setattr("probo.streaming.streaming.time.monotonic", lambda: clock[0])
+    engine = CompressionEngine(flush_bytes=0, flush_interval=0.5)
+
+    engine.compress("header")
+    assert engine.compress("slow row") == b""
+    clock[0] += 1
+    assert len(engine.compress("late row")) > 0
+
+
+def test_engine_min_size_cutoff():
+    """Buffered bodies below min_size are left uncompressed."""
+    engine = CompressionEngine(min_size=64)
+
+    assert engine.compress_body("tiny") is None
+    assert gzip.decompress(engine.compress_body("x" * 64)) == b"x" * 64
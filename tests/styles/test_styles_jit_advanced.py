@@ -257,3 +257,61 @@ def test_css_specificity_accumulation(static_template):
     output = "\n".join(b.render() for b in valid_bridges)
     assert ".btn {" in output
     assert ".btn.btn-primary {" in output
+
+
+# ==============================================================================
+#  TEMPLATE INDEX TESTS (3 Tests)
+# ==============================================================================
+
+
+def test_template_index_matches_resolver_info(static_template):
+    """13. The index exposes the same merged tag info as TemplateResolver."""
+    from probo.templates.resolver import TemplateIndex, TemplateResolver
+
+    index = TemplateIndex(static_template)
+    resolved = TemplateResolver(tmplt_str=static_template).template_resolver()
+
+    assert index.tag_info.keys() == resolved.keys()
+    assert index.tag_info["a"] == resolved["a"]
+    assert {"top-bar", "sticky", "menu-item", "btn-primary"} <= index.classes
+    assert index.ids == {"app-root", "hero"}
+    assert [tag for tag, _ in index.ancestors(len(index.elements) - 1)] == [
+        "footer",
+        "div",
+    ]
+
+
+def test_jit_parses_template_once_for_many_rules(static_template, monkeypatch):
+    """14. Many rules against one template trigger a single HTML parse."""
+    from probo.xml.xml import HtmlToXmlConverter
+
+    calls = []
+    original = HtmlToXmlConverter.to_xml
+
+    def counting_to_xml(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(HtmlToXmlConverter, "to_xml", counting_to_xml)
+    bridges = [
+        SelectorRuleBridge(selector=CssSelector().cls(name), rule=CssRule(color="red"))
+        for name in ("btn", "lead", "menu", "sidebar") * 50
+    ]
+
+    valid_bridges = element_style_state(static_template, {}, *bridges)
+
+    assert len(calls) == 1
+    assert len(valid_bridges) == 150
+
+
+def test_jit_accepts_prebuilt_index(static_template):
+    """15. element_style_state and ComponentStyle share one prebuilt index."""
+    from probo.templates.resolver import TemplateIndex
+
+    index = TemplateIndex(static_template)
+    bridge = SelectorRuleBridge(selector=CssSelector().Id("hero"), rule=CssRule(margin="0"))
+
+    valid = element_style_state(index, {}, bridge)
+    css = ComponentStyle(index, *valid).render()
+
+    assert "#hero" in css
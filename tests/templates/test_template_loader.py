@@ -0,0 +1,118 @@
+import os
+import time
+
+import pytest
+
+from probo.router.discovery import discover_pages
+from probo.router.views import ProboRouterView
+from probo.templates.loader import TemplateLoader, template_loader
+from probo.templates.parser import ProboTemplateParser
+
+
+def write(path, text, age=60):
+    """Writes `text` and backdates the mtime out of the racy window."""
+    path.write_text(text)
+    then = time.time() - age
+    os.utime(path, (then, then))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clean_loader():
+    template_loader.thaw().forget()
+    template_loader.reset_stats()
+    yield
+    template_loader.thaw().forget()
+    template_loader.reset_stats()
+
+
+def test_files_are_read_once_and_rechecked_by_stat(tmp_path):
+    path = write(tmp_path / "base.html", "<main>v1</main>")
+    loader = TemplateLoader()
+
+    assert loader.source(path) == loader.source(path) == "<main>v1</main>"
+    assert loader.stats() == {"templates": 1, "loads": 1, "stat_calls": 2, "compiles": 0}
+
+
+def test_changed_files_are_reloaded_and_recompiled(tmp_path):
+    path = write(tmp_path / "base.html", "<main>v1</main>")
+    loader = TemplateLoader()
+    assert loader.compiled(path, str.upper) == loader.compiled(path, str.upper) == "<MAIN>V1</MAIN>"
+
+    write(tmp_path / "base.html", "<main>v2!</main>", age=30)
+
+    assert loader.compiled(path, str.upper) == "<MAIN>V2!</MAIN>"
+    assert (loader.loads, loader.compiles) == (2, 2)
+
+
+def test_recently_written_files_are_not_trusted(tmp_path):
+    path = tmp_path / "base.html"
+    path.write_text("<main>v1</main>")
+    loader = TemplateLoader()
+
+    loader.source(path)
+    loader.source(path)
+
+    assert loader.loads == 2
+
+
+def test_warm_skips_missing_files_and_source_raises(tmp_path):
+    loader = TemplateLoader()
+
+    assert loader.warm(write(tmp_path / "a.html", "a"), tmp_path / "missing.html") == 1
+    with pytest.raises(FileNotFoundError):
+        loader.source(tmp_path / "missing.html")
+
+
+def test_frozen_loader_does_no_file_io(tmp_path):
+    path = write(tmp_path / "base.html", "<main>v1</main>")
+    loader = TemplateLoader()
+    loader.warm(path)
+    loader.freeze()
+    loader.reset_stats()
+
+    for _ in range(3):
+        loader.source(path)
+
+    assert loader.stats()["loads"] == loader.stats()["stat_calls"] == 0
+
+
+def test_magic_template_routes_are_warmed_and_hot_routes_do_no_io(tmp_path):
+    html = write(tmp_path / "page.html", "<div>Hello</div>")
+    (tmp_path / "home.py").write_text(f'__prb_file__ = r"{html}"\n')
+
+    page = discover_pages(str(tmp_path))["/"]
+    assert template_loader.loads == 1
+    template_loader.freeze()
+    template_loader.reset_stats()
+
+    assert page() == page()
+    assert "<div>Hello</div>" in page()
+    assert template_loader.stats()["loads"] == template_loader.stats()["stat_calls"] == 0
+
+
+def test_lazy_layouts_are_warmed_when_the_view_is_defined(tmp_path):
+    html = write(tmp_path / "layout.html", "<main>layout</main>")
+
+    class LayoutView(ProboRouterView):
+        lazy_layout = html
+
+    assert html in template_loader
+    template_loader.reset_stats()
+    view = LayoutView()
+
+    assert view() == view()
+    assert "<main>layout</main>" in view()
+    assert template_loader.loads == 0
+
+
+def test_parser_reuses_the_parsed_file(tmp_path):
+    path = write(tmp_path / "card.html", "<div class='card'><p>x</p></div>")
+
+    first = ProboTemplateParser(path).parse(mode="heavy")
+    second = ProboTemplateParser(path).parse(mode="heavy")
+
+    assert first.render() == second.render()
+    assert first is not second
+    assert template_loader.compiles == 1
+    assert ProboTemplateParser(path).parse() == ProboTemplateParser().parse("<div class='card'><p>x</p></div>")
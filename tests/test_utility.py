@@ -14,6 +14,8 @@ from probo.utility import (
     exists_in_dict,
     render_attributes,
     EnumLookUPMixin,
+    astream_chunks,
+    defer_async,
 )
 
 
@@ -312,3 +314,58 @@ def test_resolve_stream_light_tag_class():
         _resolve_stream((MockLightComponentFallback(),), chunk_size=10, EL=None)
     )
     assert results_without_el == ["Fallback stream"]
+
+
+# ==========================================
+# TESTS: Async Streaming
+# ==========================================
+
+
+def _collect(async_iterable):
+    import asyncio
+
+    async def run():
+        return [chunk async for chunk in async_iterable]
+
+    return asyncio.run(run())
+
+
+def test_astream_chunks_passes_sync_chunks_through():
+    """Fully synchronous streams come out chunk-for-chunk unchanged."""
+    manager = StreamManager("<ul>", (f"<li>{i}</li>" for i in range(5)), "</ul>", 2)
+    assert _collect(astream_chunks(iter(manager))) == list(
+        StreamManager("<ul>", (f"<li>{i}</li>" for i in range(5)), "</ul>", 2)
+    )
+
+
+def test_stream_manager_resolves_async_content():
+    """Awaitables and async generators are spliced in place and re-batched."""
+
+    async def rows():
+        for i in range(5):
+            yield f"<li>{i}</li>"
+
+    async def heading():
+        return "<h2>Rows</h2>"
+
+    manager = StreamManager(
+        "<div>", _resolve_stream((heading(), rows(), "<p>end</p>")), "</div>", 2
+    )
+    chunks = _collect(manager)
+
+    assert "".join(chunks) == (
+        "<div><h2>Rows</h2>"
+        + "".join(f"<li>{i}</li>" for i in range(5))
+        + "<p>end</p></div>"
+    )
+    assert "<li>0</li><li>1</li>" in chunks
+
+
+def test_defer_async_requires_astream():
+    """Sync streaming cannot wait, so async content fails loudly."""
+
+    async def rows():
+        yield "x"
+
+    with pytest.raises(TypeError, match="astream"):
+        defer_async(rows())